@@ -76,7 +76,9 @@ def main():
         }
         inventory["repos"][name] = entry
 
-    (out / "yai-infra-inventory.json").write_text(json.dumps(inventory, indent=2), encoding="utf-8")
+    # json.dump streams encoder chunks to the file instead of building one large string
+    with (out / "yai-infra-inventory.json").open("w", encoding="utf-8") as fh:
+        json.dump(inventory, fh, indent=2)
     # Placeholders for next steps:
     (out / "yai-infra-duplicates.csv").write_text(
         "logical_component,source_repo,source_path,similarity,proposed_owner\n", encoding="utf-8"
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import py_compile
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+# Single-file distribution of yai_tools + yai_infra_tools.
+#
+# Every module is stored next to a CHECKED_HASH .pyc (zipimport looks for
+# `mod.pyc` beside `mod.py`), so a fresh CI container imports bytecode straight
+# from the archive instead of compiling the tree on first use; the hash check
+# still rejects bytecode that does not match the bundled source. Entries are
+# stored uncompressed (no inflate on import) with fixed timestamps, so the same
+# tree and interpreter build the same archive. On another Python version the
+# .pyc magic does not match and zipimport falls back to the bundled sources.
+
+ROOT = Path(__file__).resolve().parents[4]
+PYTHON_DIR = ROOT / "tools" / "python"
+PACKAGES = ("yai_tools", "yai_infra_tools")
+DEFAULT_OUT = ROOT / "dist" / "yai-tools.pyz"
+_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+MAIN_PY = '''\
+import os
+import subprocess
+import sys
+
+
+def _repo_root():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=False
+        ).stdout.strip()
+    except OSError:
+        out = ""
+    return out or os.getcwd()
+
+
+def main():
+    # no checkout surrounds the archive: operate on the repository around the cwd
+    if not os.environ.get("YAI_REPO_ROOT"):
+        os.environ["YAI_REPO_ROOT"] = _repo_root()
+    argv = sys.argv[1:]
+    if argv and argv[0] == "inventory":
+        sys.argv = [sys.argv[0], *argv[1:]]
+        from yai_infra_tools.project.inventory import main as inventory_main
+
+        return inventory_main()
+    if argv and argv[0] in MODULE_COMMANDS:
+        import importlib
+
+        return importlib.import_module(MODULE_COMMANDS[argv[0]]).main(argv[1:])
+    from yai_tools.cli import main as cli_main
+
+    return cli_main()
+
+
+MODULE_COMMANDS = {
+    "docs-trace-check": "yai_tools.verify.traceability",
+    "changelog-check": "yai_tools.verify.changelog",
+    "proof-check": "yai_tools.verify.proof_pack",
+}
+
+raise SystemExit(main())
+'''
+
+
+def _sources(packages: tuple[str, ...] = PACKAGES) -> list[Path]:
+    files: list[Path] = []
+    for pkg in packages:
+        files.extend(p for p in (PYTHON_DIR / pkg).rglob("*.py") if "__pycache__" not in p.parts)
+    return sorted(files)
+
+
+def _entry(zf: zipfile.ZipFile, arcname: str, data: bytes, mode: int = 0o644) -> None:
+    info = zipfile.ZipInfo(arcname, date_time=_EPOCH)
+    info.external_attr = (0o100000 | mode) << 16
+    info.compress_type = zipfile.ZIP_STORED
+    zf.writestr(info, data)
+
+
+def _compile(src: Path, arcname: str, tmp: Path) -> bytes:
+    cfile = tmp / (arcname.replace("/", "_") + "c")
+    py_compile.compile(
+        str(src),
+        cfile=str(cfile),
+        dfile=arcname,  # tracebacks point into the archive, not the build host
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+    return cfile.read_bytes()
+
+
+def _build_info() -> bytes:
+    sys.path.insert(0, str(PYTHON_DIR))
+    try:
+        from yai_tools.verify.gate_cache import source_digest
+    finally:
+        sys.path.pop(0)
+    version_file = ROOT / "tools" / "VERSION"
+    version = version_file.read_text(encoding="utf-8").strip() if version_file.exists() else "0"
+    return (
+        '"""Written by yai_infra_tools.release.zipapp; read by _core.paths.tools_version() and gate_cache.generator_version()."""\n'
+        f"TOOLS_VERSION = {version!r}\n"
+        f"SOURCE_DIGEST = {source_digest(PYTHON_DIR / 'yai_tools')!r}\n"
+        f"PYTHON = {'.'.join(map(str, sys.version_info[:2]))!r}\n"
+    ).encode("utf-8")
+
+
+def build(out: Path = DEFAULT_OUT, interpreter: str = "/usr/bin/env python3") -> tuple[Path, int]:
+    """Write the archive atomically; returns (path, module count)."""
+    out.parent.mkdir(parents=True, exist_ok=True)
+    generated = {"yai_tools/_build_info.py": _build_info(), "__main__.py": MAIN_PY.encode("utf-8")}
+    buf = io.BytesIO()
+    count = 0
+    with tempfile.TemporaryDirectory(prefix="yai-zipapp-") as tmp_name:
+        tmp = Path(tmp_name)
+        with zipfile.ZipFile(buf, "w") as zf:
+            modules = [(p.relative_to(PYTHON_DIR).as_posix(), p) for p in _sources()]
+            for arcname, data in generated.items():
+                src = tmp / arcname.replace("/", "_")
+                src.write_bytes(data)
+                modules.append((arcname, src))
+            for arcname, src in sorted(modules):
+                _entry(zf, arcname, src.read_bytes())
+                if arcname != "__main__.py":  # zipimport never loads __main__ from bytecode
+                    _entry(zf, arcname + "c", _compile(src, arcname, tmp))
+                count += 1
+
+    fd, tmp_out = tempfile.mkstemp(prefix=f".{out.name}.", dir=str(out.parent))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(f"#!{interpreter}\n".encode("utf-8"))
+            fh.write(buf.getvalue())
+        os.chmod(tmp_out, 0o755)
+        os.replace(tmp_out, out)
+    except BaseException:
+        if os.path.exists(tmp_out):
+            os.unlink(tmp_out)
+        raise
+    return out, count
+
+
+def _timed(argv: list[str], env: dict[str, str], runs: int) -> list[float]:
+    times: list[float] = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        p = subprocess.run(argv, cwd=str(ROOT), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - t0) * 1000)
+        if p.returncode not in (0, 1):
+            raise SystemExit(f"[zipapp] ERROR: `{' '.join(argv)}` exited {p.returncode}")
+    return times
+
+
+def bench(pyz: Path, commands: list[str], runs: int) -> int:
+    """Cold-start wall time: wrappers without bytecode caches vs. warm wrappers vs. the zipapp."""
+    if not pyz.exists():
+        print(f"[zipapp] ERROR: {pyz} not found (run `make zipapp` first)")
+        return 2
+    base = {k: v for k, v in os.environ.items() if not k.startswith("YAI_TOOLS_PROFILE")}
+    base["YAI_TOOLS_NO_HISTORY"] = "1"
+    print(f"[zipapp] cold start, median of {runs} run(s) in ms (cold = no __pycache__, as in a fresh container)")
+    print(f"{'command':<36} {'wrapper cold':>13} {'wrapper warm':>13} {'zipapp':>9}")
+    for cmd in commands:
+        sub, *args = cmd.split()
+        wrapper = [str(ROOT / "tools" / "bin" / f"yai-{sub}"), *args]
+        if not Path(wrapper[0]).exists():
+            wrapper = [str(ROOT / "tools" / "bin" / "yai-tools"), sub, *args]
+        with tempfile.TemporaryDirectory(prefix="yai-pycache-") as prefix:
+            cold_env = {**base, "PYTHONDONTWRITEBYTECODE": "1", "PYTHONPYCACHEPREFIX": prefix}
+            cold = _timed(wrapper, cold_env, runs)
+        _timed(wrapper, base, 1)  # populate __pycache__
+        warm = _timed(wrapper, base, runs)
+        zapp = _timed([sys.executable, str(pyz), sub, *args], base, runs)
+        print(
+            f"{cmd:<36} {statistics.median(cold):>13.1f} {statistics.median(warm):>13.1f}"
+            f" {statistics.median(zapp):>9.1f}"
+        )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="yai-zipapp", description="Build or benchmark dist/yai-tools.pyz")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="build the zipapp")
+    b.add_argument("--out", default=str(DEFAULT_OUT))
+    b.add_argument("--python", default="/usr/bin/env python3", help="shebang interpreter")
+    m = sub.add_parser("bench", help="compare cold-start time with the tools/bin wrappers")
+    m.add_argument("--pyz", default=str(DEFAULT_OUT))
+    m.add_argument("--runs", type=int, default=5)
+    m.add_argument(
+        "commands",
+        nargs="*",
+        default=["pr-check --help", "branch --help", "docs-graph --check", "docs-doctor --mode all --no-cache"],
+        help="subcommand lines to time (default: a light and a verify set)",
+    )
+    args = ap.parse_args(argv)
+
+    if args.cmd == "build":
+        out, count = build(Path(args.out), args.python)
+        size = out.stat().st_size
+        print(f"[zipapp] OK: {out} ({count} module(s), {size / 1024:.0f} KiB, {sys.implementation.cache_tag})")
+        return 0
+    return bench(Path(args.pyz), args.commands, max(1, args.runs))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
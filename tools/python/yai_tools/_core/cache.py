@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from yai_tools._core.paths import repo_root
+
+
+def cache_dir(*parts: str) -> Path:
+    """Local tool cache root (`$YAI_TOOLS_CACHE_DIR`, default `<repo>/.cache/yai-tools`)."""
+    base = os.environ.get("YAI_TOOLS_CACHE_DIR", "").strip()
+    root = Path(base) if base else repo_root() / ".cache" / "yai-tools"
+    return root.joinpath(*parts)
+
+
+def cache_disabled() -> bool:
+    return os.environ.get("YAI_TOOLS_NO_CACHE", "").strip().lower() in ("1", "true", "yes")
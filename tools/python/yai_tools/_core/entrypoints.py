@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from yai_tools._core.paths import repo_root
+
+# tools/bin wrappers are thin bash shims; the python ones exec either
+# `python3 -m yai_tools.cli <sub>` or a verify module directly. Only a wrapper
+# whose single `exec` runs unconditionally (top level, not inside an `if`) maps
+# to one module: the yai-gate/suite/verify dispatchers exec `cli plan` for one
+# branch only and are left out.
+
+_EXEC_RE = re.compile(r'^exec\s+(?:python3|"\$\{PYTHON\}")\s+-m\s+(yai_tools[\w.]*)(?:\s+([a-z][\w-]*))?', re.M)
+_ALIAS_RE = re.compile(r'^exec\s+".*/(yai-[\w-]+)"\s+"\$@"', re.M)
+_ANY_EXEC_RE = re.compile(r"^\s*exec\b", re.M)
+
+
+@dataclass
+class EntryPoint:
+    script: str
+    module: str
+    sub: str = ""
+
+    @property
+    def target(self) -> str:
+        return f"{self.module} {self.sub}".strip()
+
+
+def discover_entry_points(bin_dir: Path | None = None) -> list[EntryPoint]:
+    """tools/bin wrappers that unconditionally exec a yai_tools module (aliases resolve to their target)."""
+    bin_dir = bin_dir or repo_root() / "tools" / "bin"
+    direct: dict[str, EntryPoint] = {}
+    aliases: dict[str, str] = {}
+    for path in sorted(bin_dir.glob("yai-*")):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        if len(_ANY_EXEC_RE.findall(text)) != 1:
+            continue  # dispatcher (or no exec at all): not a single module
+        m = _EXEC_RE.search(text)
+        if m:
+            direct[path.name] = EntryPoint(path.name, m.group(1), m.group(2) or "")
+            continue
+        a = _ALIAS_RE.search(text)
+        if a:
+            aliases[path.name] = a.group(1)
+    for name, target in aliases.items():
+        if target in direct:
+            ep = direct[target]
+            direct[name] = EntryPoint(name, ep.module, ep.sub)
+    return [direct[k] for k in sorted(direct)]
@@ -1,17 +1,364 @@
 from __future__ import annotations
 
+import atexit
+import os
+import re
 import subprocess
-from typing import List
+import sys
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List
+
+from yai_tools._core import profile
+
+# Single git access layer for yai_tools. Every git subprocess goes through
+# _count_spawn() so the per-process count stays accurate; read-only queries are
+# memoized, blob reads share one `git cat-file --batch` per repository and
+# diffs are parsed as a stream from a single invocation.
+
+_spawn_lock = threading.Lock()
+_spawn_count = 0
+
+
+class GitError(RuntimeError):
+    def __init__(self, args: List[str], returncode: int, stderr: str) -> None:
+        self.git_args = list(args)
+        self.returncode = returncode
+        self.stderr = stderr
+        super().__init__(stderr or f"git {' '.join(args)} failed with exit code {returncode}")
+
+
+def _cwd_key(cwd: str | Path | None) -> str:
+    return str(Path(cwd).resolve()) if cwd is not None else os.getcwd()
+
+
+def _count_spawn() -> None:
+    global _spawn_count
+    with _spawn_lock:
+        _spawn_count += 1
+
+
+def git_spawn_count() -> int:
+    """Number of git subprocesses started by this process."""
+    return _spawn_count
+
+
+def _check_cwd(args: List[str], cwd: str | Path | None) -> None:
+    if cwd is not None and not Path(cwd).is_dir():
+        raise GitError(args, 128, f"cannot change to '{cwd}': No such directory")
+
+
+def run_git(args: List[str], cwd: str | Path | None = None, check: bool = True) -> str:
+    """Run `git <args>` and return raw stdout; raises GitError on failure when `check`."""
+    _check_cwd(args, cwd)
+    _count_spawn()
+    with profile.span(f"git {args[0]}" if args else "git", "git", argv=" ".join(args)):
+        p = subprocess.run(["git", *args], cwd=None if cwd is None else str(cwd), capture_output=True, text=True)
+    if check and p.returncode != 0:
+        raise GitError(args, p.returncode, p.stderr.strip())
+    return p.stdout
+
+
+def popen_git(args: List[str], cwd: str | Path | None = None) -> subprocess.Popen[bytes]:
+    """Start `git <args>` with a binary stdout pipe for streaming parsers."""
+    _check_cwd(args, cwd)
+    _count_spawn()
+    with profile.span(f"git {args[0]} (spawn)" if args else "git", "git", argv=" ".join(args)):
+        return subprocess.Popen(
+            ["git", *args],
+            cwd=None if cwd is None else str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
 
 
 def _run_git(args: List[str]) -> str:
-    p = subprocess.run(["git", *args], check=True, capture_output=True, text=True)
-    return p.stdout.strip()
+    return run_git(args).strip()
+
+
+@lru_cache(maxsize=None)
+def _rev_parse(rev: str, cwd_key: str) -> str:
+    return run_git(["rev-parse", rev], cwd=cwd_key).strip()
+
+
+def rev_parse(rev: str, cwd: str | Path | None = None) -> str:
+    return _rev_parse(rev, _cwd_key(cwd))
+
+
+@lru_cache(maxsize=None)
+def _show_toplevel(cwd_key: str) -> str:
+    return run_git(["rev-parse", "--show-toplevel"], cwd=cwd_key).strip()
+
+
+def show_toplevel(cwd: str | Path | None = None) -> str:
+    return _show_toplevel(_cwd_key(cwd))
+
+
+@lru_cache(maxsize=None)
+def _merge_base(a: str, b: str, cwd_key: str) -> str:
+    return run_git(["merge-base", a, b], cwd=cwd_key).strip()
+
+
+def merge_base(a: str, b: str, cwd: str | Path | None = None) -> str:
+    return _merge_base(a, b, _cwd_key(cwd))
+
+
+@lru_cache(maxsize=None)
+def _diff_name_only(base: str, head: str, cwd_key: str) -> tuple[str, ...]:
+    out = run_git(["diff", "--name-only", f"{base}...{head}"], cwd=cwd_key)
+    return tuple(x.strip() for x in out.splitlines() if x.strip())
+
+
+def diff_name_only(base: str, head: str, cwd: str | Path | None = None) -> list[str]:
+    """Paths changed in `base...head` (memoized per process)."""
+    return list(_diff_name_only(base, head, _cwd_key(cwd)))
+
+
+_HUNK_RE = re.compile(r"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+@dataclass(frozen=True)
+class DiffScan:
+    """Changed paths of a range plus the added lines of the paths asked for."""
+
+    names: tuple[str, ...]
+    added: dict[str, tuple[str, ...]]
+    added_at: dict[str, tuple[int, ...]] = field(default_factory=dict)  # new-file line of each added line
+
+
+class _PatchStream:
+    """Line parser for one `--raw --unified=0` diff: paths, plus added lines of `wanted` paths.
+
+    `--raw` lists every filepair (same path quoting as --name-only) before the
+    patches, and each patch opens with one `diff --git` header in the same
+    order, so the n-th header belongs to the n-th raw entry. Hunks are walked
+    by their line counts, so added lines that look like headers are kept.
+    """
+
+    def __init__(self, wanted: tuple[str, ...]) -> None:
+        self.names: list[str] = []
+        self.added: dict[str, list[str]] = {p: [] for p in wanted}
+        self.added_at: dict[str, list[int]] = {p: [] for p in wanted}
+        self._target: list[str] | None = None
+        self._target_at: list[int] | None = None
+        self._patches = self._old_left = self._new_left = self._new_line = 0
+
+    @property
+    def in_hunk(self) -> bool:
+        return bool(self._old_left or self._new_left)
+
+    def feed(self, line: str) -> None:
+        if self._old_left or self._new_left:
+            if line.startswith("+"):
+                self._new_left -= 1
+                if self._target is not None and self._target_at is not None:
+                    self._target.append(line[1:])
+                    self._target_at.append(self._new_line)
+                self._new_line += 1
+            elif line.startswith("-"):
+                self._old_left -= 1
+            return
+        if line.startswith(":") and not self._patches:
+            self.names.append(line.rsplit("\t", 1)[-1])
+        elif line.startswith("diff --git "):
+            name = self.names[self._patches] if self._patches < len(self.names) else ""
+            self._target = self.added.get(name)
+            self._target_at = self.added_at.get(name)
+            self._patches += 1
+        elif line.startswith("@@"):
+            m = _HUNK_RE.match(line)
+            if m:
+                self._old_left = int(m.group(1) or 1)
+                self._new_line = int(m.group(2))
+                self._new_left = int(m.group(3) or 1)
+
+    def result(self) -> DiffScan:
+        return DiffScan(
+            tuple(self.names),
+            {p: tuple(v) for p, v in self.added.items()},
+            {p: tuple(v) for p, v in self.added_at.items()},
+        )
+
+
+def _stream_lines(args: List[str], cwd_key: str) -> Iterator[str]:
+    """Decoded stdout lines of `git <args>`; raises GitError once the stream ends on failure."""
+    proc = popen_git(args, cwd=cwd_key)
+    assert proc.stdout is not None and proc.stderr is not None
+    with profile.span(f"git {args[0]} (parse)", "git", argv=" ".join(args)):
+        for raw in proc.stdout:
+            yield raw.decode("utf-8", "replace").rstrip("\n")
+        stderr = proc.stderr.read().decode("utf-8", "replace")
+        if proc.wait() != 0:
+            raise GitError(args, proc.returncode, stderr.strip())
+
+
+@lru_cache(maxsize=None)
+def _diff_scan(base: str, head: str, paths: tuple[str, ...], cwd_key: str) -> DiffScan:
+    stream = _PatchStream(paths)
+    args = ["diff", "--raw", "--unified=0", "--no-color", "--no-ext-diff", f"{base}...{head}"]
+    for line in _stream_lines(args, cwd_key):
+        stream.feed(line)
+    return stream.result()
+
+
+def diff_scan(base: str, head: str, paths: tuple[str, ...] = (), cwd: str | Path | None = None) -> DiffScan:
+    """One streamed `git diff` over `base...head`: all changed paths, plus added lines for `paths`."""
+    return _diff_scan(base, head, tuple(paths), _cwd_key(cwd))
+
+
+@dataclass(frozen=True)
+class CommitScan:
+    sha: str
+    parent: str  # first parent; empty for a root commit
+    subject: str
+    diff: DiffScan
+
+
+_COMMIT_MARK = "\x1e"
+
+
+@lru_cache(maxsize=None)
+def _log_scan(base: str, head: str, paths: tuple[str, ...], cwd_key: str) -> tuple[CommitScan, ...]:
+    args = [
+        "log",
+        "--reverse",
+        "--no-merges",
+        f"--format={_COMMIT_MARK}%H %P%x1f%s",
+        "--raw",
+        "--unified=0",
+        "--no-color",
+        "--no-ext-diff",
+        f"{base}..{head}",
+    ]
+    out: list[CommitScan] = []
+    header: tuple[str, str, str] | None = None
+    stream = _PatchStream(paths)
+    for line in _stream_lines(args, cwd_key):
+        if line.startswith(_COMMIT_MARK) and not stream.in_hunk:
+            if header is not None:
+                out.append(CommitScan(*header, stream.result()))
+            shas, _, subject = line[1:].partition("\x1f")
+            sha, *parents = shas.split()
+            header = (sha, parents[0] if parents else "", subject)
+            stream = _PatchStream(paths)
+        else:
+            stream.feed(line)
+    if header is not None:
+        out.append(CommitScan(*header, stream.result()))
+    return tuple(out)
+
+
+def log_scan(base: str, head: str, paths: tuple[str, ...] = (), cwd: str | Path | None = None) -> list[CommitScan]:
+    """Non-merge commits of `base..head`, oldest first, each with its `diff_scan` against its first parent.
+
+    One streamed `git log` walks the range and produces every patch.
+    """
+    return list(_log_scan(base, head, tuple(paths), _cwd_key(cwd)))
+
+
+@lru_cache(maxsize=None)
+def _ls_files(cwd_key: str) -> tuple[str, ...]:
+    out = run_git(["ls-files", "-z"], cwd=cwd_key)
+    return tuple(x for x in out.split("\0") if x)
+
+
+def ls_files(cwd: str | Path | None = None) -> list[str]:
+    return list(_ls_files(_cwd_key(cwd)))
+
+
+class CatFileBatch:
+    """Persistent `git cat-file --batch` reader for one repository."""
+
+    def __init__(self, cwd: str) -> None:
+        self.cwd = cwd
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen[bytes] | None = None
+
+    def _ensure(self) -> subprocess.Popen[bytes]:
+        if self._proc is None or self._proc.poll() is not None:
+            _check_cwd(["cat-file", "--batch"], self.cwd)
+            _count_spawn()
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def read(self, spec: str) -> bytes | None:
+        """Object content for `spec` (e.g. `<ref>:<path>`), or None when it does not exist."""
+        if "\n" in spec:
+            raise ValueError("object spec must not contain newlines")
+        with profile.span("git cat-file", "git", spec=spec), self._lock:
+            proc = self._ensure()
+            assert proc.stdin is not None and proc.stdout is not None
+            proc.stdin.write(spec.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline().decode("utf-8", "replace").rstrip("\n")
+            if not header or header.endswith((" missing", " ambiguous")):
+                return None
+            size = int(header.rsplit(" ", 1)[1])
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing LF
+            return data
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is None:
+                return
+            if self._proc.stdin:
+                self._proc.stdin.close()
+            self._proc.wait()
+            self._proc = None
+
+
+_batches: dict[str, CatFileBatch] = {}
+_batches_lock = threading.Lock()
+
+
+def cat_file(cwd: str | Path | None = None) -> CatFileBatch:
+    key = _cwd_key(cwd)
+    with _batches_lock:
+        batch = _batches.get(key)
+        if batch is None:
+            batch = CatFileBatch(key)
+            _batches[key] = batch
+        return batch
+
+
+def read_blob(ref: str, path: str, cwd: str | Path | None = None) -> str | None:
+    """Text of `path` at `ref`, or None when absent (served by the batch reader)."""
+    data = cat_file(cwd).read(f"{ref}:{path}")
+    if data is None:
+        return None
+    return data.decode("utf-8")
+
+
+def clear_cache() -> None:
+    for fn in (_rev_parse, _show_toplevel, _merge_base, _diff_name_only, _diff_scan, _log_scan, _ls_files):
+        fn.cache_clear()
+
+
+@atexit.register
+def _shutdown() -> None:
+    for batch in list(_batches.values()):
+        try:
+            batch.close()
+        except OSError:
+            pass
+    if os.environ.get("YAI_TOOLS_GIT_STATS"):
+        print(f"[git] subprocesses spawned: {_spawn_count}", file=sys.stderr)
 
 
 def head_sha() -> str:
-    return _run_git(["rev-parse", "HEAD"])
+    return rev_parse("HEAD")
 
 
 def checkout_new_branch(name: str) -> None:
-    subprocess.run(["git", "checkout", "-b", name], check=True)
+    _count_spawn()
+    with profile.span("git checkout", "git", argv=f"checkout -b {name}"):
+        subprocess.run(["git", "checkout", "-b", name], check=True)
@@ -1,9 +1,37 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
+REPO_ROOT_ENV = "YAI_REPO_ROOT"
+
 
 def repo_root() -> Path:
+    """Repository the tools operate on: `$YAI_REPO_ROOT`, else the checkout they live in.
+
+    The zipapp sets YAI_REPO_ROOT, since its modules have no checkout around them.
+    """
+    env = os.environ.get(REPO_ROOT_ENV, "").strip()
+    if env:
+        return Path(env).resolve()
     # tools/python/yai_tools/_core/paths.py -> repo root = ../../../..
     here = Path(__file__).resolve()
     return here.parents[4]
+
+
+@lru_cache(maxsize=1)
+def tools_version() -> str:
+    """Version of the tools themselves, not of the repo under `repo_root()` ("" if unknown).
+
+    The zipapp records it in `_build_info`; a checkout reads tools/VERSION next to the package.
+    """
+    try:
+        from yai_tools._build_info import TOOLS_VERSION  # type: ignore[import-not-found]
+
+        return TOOLS_VERSION
+    except ImportError:
+        pass
+    # tools/python/yai_tools/_core/paths.py -> tools/VERSION
+    path = Path(__file__).resolve().parents[3] / "VERSION"
+    return path.read_text(encoding="utf-8").strip() if path.exists() else ""
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+# Chrome trace-event recorder (load the output in chrome://tracing or Perfetto).
+# Disabled by default: span() then returns a shared no-op context, so the
+# instrumentation left in git/gh/corpus/gate code costs one global check.
+
+PROFILE_ENV = "YAI_TOOLS_PROFILE"
+PSTATS_ENV = "YAI_TOOLS_PSTATS"
+
+_lock = threading.Lock()
+_events: list[dict[str, Any]] = []
+_threads: dict[int, str] = {}
+_active = False
+_t0 = 0.0
+_NOOP = contextlib.nullcontext()
+
+
+def enabled() -> bool:
+    return _active
+
+
+def _now_us() -> float:
+    return (time.perf_counter() - _t0) * 1e6
+
+
+@contextlib.contextmanager
+def _record(name: str, cat: str, args: dict[str, Any]) -> Iterator[None]:
+    start = _now_us()
+    try:
+        yield
+    finally:
+        dur = _now_us() - start
+        tid = threading.get_ident()
+        ev: dict[str, Any] = {"name": name, "cat": cat, "ph": "X", "ts": start, "dur": dur, "pid": os.getpid(), "tid": tid}
+        if args:
+            ev["args"] = {k: v if isinstance(v, (int, float, bool)) else str(v) for k, v in args.items()}
+        with _lock:
+            _events.append(ev)
+            _threads.setdefault(tid, threading.current_thread().name)
+
+
+def span(name: str, cat: str = "tool", **args: Any) -> contextlib.AbstractContextManager[Any]:
+    """Timed span; nested spans on one thread render as a flame stack."""
+    if not _active:
+        return _NOOP
+    return _record(name, cat, args)
+
+
+def start() -> None:
+    global _active, _t0
+    with _lock:
+        _events.clear()
+        _threads.clear()
+    _t0 = time.perf_counter()
+    _active = True
+
+
+def stop(path: str | Path) -> int:
+    """Stop recording and write the trace; returns the number of spans written."""
+    global _active
+    _active = False
+    with _lock:
+        events = list(_events)
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": tname}}
+            for tid, tname in _threads.items()
+        ]
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", encoding="utf-8") as fh:
+        json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, fh)
+        fh.write("\n")
+    return len(events)
+
+
+def split_profile_args(argv: list[str]) -> tuple[list[str], str, str]:
+    """Strip `--profile PATH` / `--pstats PATH` (also `--opt=PATH`) from argv.
+
+    Environment variables YAI_TOOLS_PROFILE / YAI_TOOLS_PSTATS are the defaults.
+    """
+    opts = {"--profile": os.environ.get(PROFILE_ENV, ""), "--pstats": os.environ.get(PSTATS_ENV, "")}
+    rest: list[str] = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        name, eq, val = arg.partition("=")
+        if name in opts:
+            if eq:
+                opts[name] = val
+            elif i + 1 < len(argv):
+                opts[name] = argv[i + 1]
+                i += 1
+            else:
+                raise SystemExit(f"{name} requires a path")
+        else:
+            rest.append(arg)
+        i += 1
+    return rest, opts["--profile"], opts["--pstats"]
+
+
+def run_profiled(main: Callable[[], int], name: str = "main", trace: str = "", pstats: str = "") -> int:
+    """Run `main` with span recording and/or cProfile when a path is configured."""
+    trace = trace or os.environ.get(PROFILE_ENV, "")
+    pstats = pstats or os.environ.get(PSTATS_ENV, "")
+    if not trace and not pstats:
+        return main()
+
+    prof = None
+    if pstats:
+        import cProfile
+
+        prof = cProfile.Profile()
+    if trace:
+        start()
+    try:
+        with span(name, "command"):
+            if prof is not None:
+                return prof.runcall(main)
+            return main()
+    finally:
+        if trace:
+            count = stop(trace)
+            print(f"[profile] {count} span(s) -> {trace}", file=sys.stderr)
+        if prof is not None:
+            prof.dump_stats(pstats)
+            print(f"[profile] pstats (main thread) -> {pstats}", file=sys.stderr)
+
+
+def run_main(main: Callable[[], int], name: str) -> int:
+    """Entry point for `python -m` modules: honours --profile/--pstats before argparse sees argv."""
+    sys.argv[1:], trace, pstats = split_profile_args(sys.argv[1:])
+    return run_profiled(main, name=name, trace=trace, pstats=pstats)
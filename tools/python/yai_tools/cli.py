@@ -4,32 +4,10 @@ import json
 import re
 import subprocess
 import sys
-from typing import Any
-
-from yai_tools.issue.body import generate_issue_body
-from yai_tools.issue.templates import (
-    canonical_milestone_title,
-    canonical_mp_closure_title,
-    canonical_phase_issue_title,
-    default_mp_id,
-    default_rb_id,
-    mp_closure_labels,
-    phase_issue_labels,
-    phase_label,
-    pr_phase_labels,
-    render_milestone_body,
-    render_mp_closure_body,
-    render_phase_issue_body,
-    track_label,
-)
-from yai_tools.pr.body import generate_pr_body
-from yai_tools.pr.check import check_pr_body
-from yai_tools.verify.agent_pack import run_agent_pack
-from yai_tools.verify.architecture_alignment import run_architecture_alignment
-from yai_tools.verify.doctor import run_doctor
-from yai_tools.verify.frontmatter_schema import run_schema_check
-from yai_tools.verify.trace_graph import run_graph
-from yai_tools.workflow.branch import make_branch_name, maybe_checkout
+from typing import Any, Callable
+
+from yai_tools._core import profile
+from yai_tools._core.profile import run_profiled, split_profile_args
 
 _DEFAULT_LABEL_COLOR = "d4a72c"
 _EXACT_LABEL_COLORS: dict[str, str] = {
@@ -52,26 +30,25 @@ _PREFIX_LABEL_COLORS: tuple[tuple[str, str], ...] = (
 
 
 def _repo_root() -> str:
-    out = subprocess.run(["git", "rev-parse", "--show-toplevel"], check=True, capture_output=True, text=True)
-    return out.stdout.strip()
+    from yai_tools._core.git import show_toplevel
+
+    return show_toplevel()
 
 
 def _safe_specs_sha(repo_root: str) -> str:
+    from yai_tools._core.git import rev_parse
+
     for rel in ("deps/yai-law", "deps/yai-law"):
         try:
-            out = subprocess.run(
-                ["git", "-C", f"{repo_root}/{rel}", "rev-parse", "HEAD"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return out.stdout.strip()
+            return rev_parse("HEAD", cwd=f"{repo_root}/{rel}")
         except Exception:
             continue
     return "unknown"
 
 
 def _autofill_docs_touched(repo_root: str) -> list[str]:
+    from yai_tools._core.git import run_git
+
     candidates = [
         "docs",
         ".github",
@@ -82,13 +59,8 @@ def _autofill_docs_touched(repo_root: str) -> list[str]:
         "CODE_OF_CONDUCT.md",
     ]
     try:
-        out = subprocess.run(
-            ["git", "-C", repo_root, "diff", "--name-only", "--", *candidates],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        touched = [x.strip() for x in out.stdout.splitlines() if x.strip()]
+        out = run_git(["diff", "--name-only", "--", *candidates], cwd=repo_root)
+        touched = [x.strip() for x in out.splitlines() if x.strip()]
         return touched
     except Exception:
         return []
@@ -126,13 +98,14 @@ def _default_spec_delta_for_template(template: str) -> list[str]:
 
 
 def _run(args: list[str], input_text: str | None = None) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        args,
-        input=input_text,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
+    with profile.span(" ".join(args[:3]), "gh" if args[0] == "gh" else "subprocess"):
+        return subprocess.run(
+            args,
+            input=input_text,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
 
 
 def _gh_json(args: list[str], input_text: str | None = None) -> Any:
@@ -255,6 +228,8 @@ def _ensure_phase_milestone(
     apply: bool,
     report: list[str],
 ) -> tuple[str, int | None]:
+    from yai_tools.issue.templates import canonical_milestone_title, default_rb_id, render_milestone_body
+
     canonical_title = canonical_milestone_title(track, phase)
     legacy_title = f"{default_rb_id(track)}-{phase}"
     body = render_milestone_body(track=track, phase=phase, rb_anchor=rb_anchor, mp_id=mp_id)
@@ -335,6 +310,8 @@ def _mp_id_is_phase_specific(mp_id: str, phase: str) -> bool:
 
 
 def _matches_phase(issue: dict[str, Any], track: str, phase: str, rb_id: str, mp_id: str, milestone_title: str) -> bool:
+    from yai_tools.issue.templates import phase_label, track_label
+
     title = (issue.get("title") or "")
     body = (issue.get("body") or "")
     title_l = title.lower()
@@ -417,6 +394,8 @@ def _report_line(
 
 
 def cmd_pr_body(argv: list[str]) -> int:
+    from yai_tools.pr.body import generate_pr_body
+
     p = argparse.ArgumentParser(prog="yai-pr-body", add_help=True)
     p.add_argument("--template", default="default", help="default|docs-governance|type-a-milestone|type-b-twin-pr")
     p.add_argument("--issue", required=True, help="#123 or 123 or N/A")
@@ -446,6 +425,22 @@ def cmd_pr_body(argv: list[str]) -> int:
         action="store_true",
         help="With --autofill-docs-governance, execute default commands and inject exit-code evidence.",
     )
+    p.add_argument(
+        "--evidence-timeout",
+        type=float,
+        default=600.0,
+        help="Per-command timeout in seconds for --run-evidence (default: 600).",
+    )
+    p.add_argument(
+        "--evidence-logs",
+        default="",
+        help="Directory for --run-evidence command logs (default: .cache/yai-tools/evidence/logs).",
+    )
+    p.add_argument(
+        "--no-evidence-cache",
+        action="store_true",
+        help="Always re-run evidence commands instead of reusing results cached for the current tree.",
+    )
     p.add_argument("--out", default="", help="Output file. If omitted: stdout.")
     args = p.parse_args(argv)
 
@@ -468,34 +463,24 @@ def cmd_pr_body(argv: list[str]) -> int:
             commands = _default_commands_for_template(args.template)
 
         if args.run_evidence:
-            results: list[tuple[str, int, str]] = []
-            for cmd in commands:
-                run = subprocess.run(
-                    cmd,
-                    shell=True,
-                    cwd=repo_root,
-                    capture_output=True,
-                    text=True,
-                )
-                combined = f"{run.stdout}\n{run.stderr}".strip()
-                results.append((cmd, run.returncode, combined))
+            from pathlib import Path
+
+            from yai_tools.pr.evidence import negative_bullets, positive_bullets, run_evidence
+
+            results = run_evidence(
+                commands,
+                cwd=repo_root,
+                timeout_s=args.evidence_timeout,
+                log_dir=Path(args.evidence_logs) if args.evidence_logs else None,
+                use_cache=not args.no_evidence_cache,
+            )
 
             if not evidence_positive:
                 evidence_positive = [f"Baseline commit verified: yai + yai-cli -> {specs_sha}"]
-                for cmd, code, _ in results:
-                    if code == 0 and "yai-proof-check" not in cmd:
-                        evidence_positive.append(f"{cmd} exit code = 0")
+                evidence_positive += positive_bullets(results)
 
             if not evidence_negative:
-                neg: list[str] = []
-                for cmd, code, output in results:
-                    if "yai-proof-check" in cmd and "SKIP" in output:
-                        neg.append(f"{cmd} -> SKIP (private draft manifest)")
-                    elif code != 0:
-                        neg.append(f"{cmd} exit code = {code}")
-                if not neg:
-                    neg = ["No runtime/protocol behavior change expected."]
-                evidence_negative = neg
+                evidence_negative = negative_bullets(results) or ["No runtime/protocol behavior change expected."]
         else:
             if not evidence_positive:
                 evidence_positive = [f"Baseline commit verified: yai + yai-cli -> {specs_sha}"]
@@ -533,10 +518,29 @@ def cmd_pr_body(argv: list[str]) -> int:
 
 
 def cmd_pr_check(argv: list[str]) -> int:
+    from yai_tools.pr.check import check_batch, check_pr_body
+
     p = argparse.ArgumentParser(prog="yai-pr-check", add_help=True)
     p.add_argument("path", nargs="?", default=".pr/PR_BODY.md", help="PR body path")
+    p.add_argument(
+        "--batch",
+        default="",
+        metavar="SOURCE",
+        help="check every PR body in a directory of *.md files or a JSONL export (`-` for stdin); prints JSON",
+    )
     args = p.parse_args(argv)
 
+    if args.batch:
+        try:
+            results = check_batch(args.batch)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"FAIL: cannot read batch source: {e}", file=sys.stderr)
+            return 2
+        failed = sum(1 for r in results if not r["ok"])
+        doc = {"ok": not failed, "total": len(results), "failed": failed, "results": results}
+        print(json.dumps(doc, indent=2, ensure_ascii=False))
+        return 1 if failed else 0
+
     ok, msg = check_pr_body(args.path)
     if not ok:
         print(f"FAIL: {msg}", file=sys.stderr)
@@ -547,6 +551,8 @@ def cmd_pr_check(argv: list[str]) -> int:
 
 
 def cmd_issue_body(argv: list[str]) -> int:
+    from yai_tools.issue.body import generate_issue_body
+
     p = argparse.ArgumentParser(prog="yai-issue-body", add_help=True)
     p.add_argument("--title", required=True, help="Issue title")
     p.add_argument("--type", default="task", help="bug|feature|runbook|docs|task")
@@ -574,6 +580,8 @@ def cmd_issue_body(argv: list[str]) -> int:
 
 
 def cmd_milestone_body(argv: list[str]) -> int:
+    from yai_tools.issue.templates import render_milestone_body
+
     p = argparse.ArgumentParser(prog="yai-dev milestone body", add_help=True)
     p.add_argument("--track", required=True)
     p.add_argument("--phase", required=True)
@@ -599,6 +607,8 @@ def cmd_milestone_body(argv: list[str]) -> int:
 
 
 def cmd_issue_phase(argv: list[str]) -> int:
+    from yai_tools.issue.templates import canonical_phase_issue_title, phase_issue_labels, render_phase_issue_body
+
     p = argparse.ArgumentParser(prog="yai-dev issue phase", add_help=True)
     p.add_argument("--track", required=True)
     p.add_argument("--phase", required=True)
@@ -655,6 +665,8 @@ def cmd_issue_phase(argv: list[str]) -> int:
 
 
 def cmd_issue_mp_closure(argv: list[str]) -> int:
+    from yai_tools.issue.templates import canonical_mp_closure_title, mp_closure_labels, render_mp_closure_body
+
     p = argparse.ArgumentParser(prog="yai-dev issue mp-closure", add_help=True)
     p.add_argument("--track", required=True)
     p.add_argument("--phase", required=True)
@@ -706,6 +718,17 @@ def cmd_issue_mp_closure(argv: list[str]) -> int:
 
 
 def cmd_fix_phase(argv: list[str]) -> int:
+    from yai_tools.issue.templates import (
+        canonical_mp_closure_title,
+        default_mp_id,
+        default_rb_id,
+        mp_closure_labels,
+        phase_issue_labels,
+        phase_label,
+        pr_phase_labels,
+        track_label,
+    )
+
     p = argparse.ArgumentParser(prog="yai-dev fix phase", add_help=True)
     p.add_argument("--track", required=True)
     p.add_argument("--phase", required=True)
@@ -918,6 +941,8 @@ def cmd_dev_issue(argv: list[str]) -> int:
 
 
 def cmd_branch(argv: list[str]) -> int:
+    from yai_tools.workflow.branch import make_branch_name, maybe_checkout
+
     p = argparse.ArgumentParser(prog="yai-branch", add_help=True)
     p.add_argument("--type", required=True, help="feat|fix|docs|chore|refactor|test|ci|hotfix")
     p.add_argument("--issue", required=True, help="#123 or 123 or N/A")
@@ -943,50 +968,112 @@ def cmd_branch(argv: list[str]) -> int:
 
 
 def cmd_docs_schema_check(argv: list[str]) -> int:
+    from yai_tools.verify.frontmatter_schema import run_schema_check
+    from yai_tools.verify.report import add_format_arg
+
     p = argparse.ArgumentParser(prog="yai-docs-schema-check", add_help=True)
     p.add_argument("--changed", action="store_true")
     p.add_argument("--base", default="")
     p.add_argument("--head", default="HEAD")
+    add_format_arg(p)
     args = p.parse_args(argv)
 
     if args.changed and not args.base:
         print("[docs-schema] ERROR: --changed requires --base <sha>", file=sys.stderr)
         return 2
 
-    return run_schema_check(changed=args.changed, base=args.base, head=args.head)
+    return run_schema_check(changed=args.changed, base=args.base, head=args.head, fmt=args.format)
+
+
+def cmd_path_policy_check(argv: list[str]) -> int:
+    from yai_tools.verify.path_policy import run_path_policy
+    from yai_tools.verify.report import add_format_arg
+
+    p = argparse.ArgumentParser(prog="yai-path-policy-check", add_help=True)
+    p.add_argument("--changed", action="store_true")
+    p.add_argument("--base", default="")
+    p.add_argument("--head", default="HEAD")
+    add_format_arg(p)
+    args = p.parse_args(argv)
+
+    if args.changed and not args.base:
+        print("[path-policy] ERROR: --changed requires --base <sha>", file=sys.stderr)
+        return 2
+
+    return run_path_policy(changed=args.changed, base=args.base, head=args.head, fmt=args.format)
 
 
 def cmd_docs_graph(argv: list[str]) -> int:
+    from yai_tools.verify.report import add_format_arg
+    from yai_tools.verify.trace_graph import run_graph
+
     p = argparse.ArgumentParser(prog="yai-docs-graph", add_help=True)
     mode = p.add_mutually_exclusive_group(required=True)
     mode.add_argument("--write", action="store_true")
     mode.add_argument("--check", action="store_true")
+    add_format_arg(p)
     args = p.parse_args(argv)
 
-    return run_graph(write=args.write)
+    return run_graph(write=args.write, fmt=args.format)
 
 
 def cmd_agent_pack(argv: list[str]) -> int:
+    from yai_tools.verify.agent_pack import run_agent_pack
+    from yai_tools.verify.report import add_format_arg
+
     p = argparse.ArgumentParser(prog="yai-agent-pack", add_help=True)
     mode = p.add_mutually_exclusive_group(required=True)
     mode.add_argument("--write", action="store_true")
     mode.add_argument("--check", action="store_true")
+    add_format_arg(p)
+    args = p.parse_args(argv)
+
+    return run_agent_pack(write=args.write, fmt=args.format)
+
+
+def cmd_generate(argv: list[str]) -> int:
+    from yai_tools.verify.generate import run_generate
+    from yai_tools.verify.report import add_format_arg
+
+    p = argparse.ArgumentParser(prog="yai-generate", add_help=True)
+    mode = p.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--all", action="store_true", help="regenerate every docs/_generated artifact")
+    mode.add_argument("--check-all", action="store_true", help="report drift for every generated artifact")
+    add_format_arg(p)
     args = p.parse_args(argv)
 
-    return run_agent_pack(write=args.write)
+    return run_generate(check=args.check_all, fmt=args.format)
 
 
 def cmd_docs_doctor(argv: list[str]) -> int:
+    from yai_tools.verify import gate_cache
+    from yai_tools.verify.doctor import run_doctor
+    from yai_tools.verify.report import add_format_arg
+
     p = argparse.ArgumentParser(prog="yai-docs-doctor", add_help=True)
     p.add_argument("--mode", choices=["ci", "all"], default="ci")
     p.add_argument("--base", default="")
     p.add_argument("--head", default="HEAD")
+    p.add_argument("--jobs", type=int, default=None, help="max concurrent gates (default: one per gate)")
+    p.add_argument("--no-cache", action="store_true", help="always run gates, ignoring the gate result cache")
+    add_format_arg(p)
     args = p.parse_args(argv)
 
-    return run_doctor(mode=args.mode, base=args.base, head=args.head)
+    return run_doctor(
+        mode=args.mode,
+        base=args.base,
+        head=args.head,
+        jobs=None if args.jobs is None else max(1, args.jobs),
+        use_cache=gate_cache.enabled(args.no_cache),
+        fmt=args.format,
+    )
 
 
 def cmd_architecture_check(argv: list[str]) -> int:
+    from yai_tools.verify import gate_cache
+    from yai_tools.verify.architecture_alignment import run_architecture_alignment
+    from yai_tools.verify.report import add_format_arg
+
     p = argparse.ArgumentParser(prog="yai-architecture-check", add_help=True)
     mode = p.add_mutually_exclusive_group(required=True)
     mode.add_argument("--changed", action="store_true")
@@ -994,59 +1081,293 @@ def cmd_architecture_check(argv: list[str]) -> int:
     mode.add_argument("--write", action="store_true")
     p.add_argument("--base", default="")
     p.add_argument("--head", default="HEAD")
+    p.add_argument("--jobs", type=int, default=None, help="component validation workers (default: auto)")
+    p.add_argument("--no-cache", action="store_true", help="always run the check, ignoring the gate result cache")
+    add_format_arg(p)
     args = p.parse_args(argv)
 
     run_mode = "all"
     if args.changed:
         run_mode = "changed"
 
-    return run_architecture_alignment(mode=run_mode, base=args.base, head=args.head, write=args.write)
+    return run_architecture_alignment(
+        mode=run_mode,
+        base=args.base,
+        head=args.head,
+        write=args.write,
+        jobs=None if args.jobs is None else max(1, args.jobs),
+        use_cache=gate_cache.enabled(args.no_cache),
+        fmt=args.format,
+    )
+
+
+def cmd_plan(argv: list[str]) -> int:
+    from yai_tools.verify import gate_cache
+    from yai_tools.workflow.plan import list_plans, run_plan
+
+    if not argv or argv[0] in {"-h", "--help"}:
+        print("Usage: yai-{gate|suite|verify} plan <list|run> ...")
+        print("  list              show plans from tools/ops/plans/")
+        print("  run <plan> [...]  run a plan's gates in dependency order (--jobs N, --no-cache, --verbose, --dry-run)")
+        return 0
+    if argv[0] == "list":
+        for name in list_plans():
+            print(name)
+        return 0
+    if argv[0] != "run":
+        print(f"Unknown plan command: {argv[0]}", file=sys.stderr)
+        return 2
+
+    p = argparse.ArgumentParser(prog="yai-plan run", add_help=True)
+    p.add_argument("plan")
+    p.add_argument("--jobs", type=int, default=None, help="max concurrent gates (default: min(8, gate count))")
+    p.add_argument("--no-cache", action="store_true", help="run every gate even when its inputs are unchanged")
+    p.add_argument("--verbose", action="store_true", help="print output of passing gates too")
+    p.add_argument("--dry-run", action="store_true", help="print the resolved execution order and exit")
+    args = p.parse_args(argv[1:])
+
+    return run_plan(
+        args.plan,
+        jobs=args.jobs,
+        use_cache=gate_cache.enabled(args.no_cache),
+        verbose=args.verbose,
+        dry_run=args.dry_run,
+    )
+
+
+def cmd_perf(argv: list[str]) -> int:
+    if not argv or argv[0] in {"-h", "--help"}:
+        print("Usage: yai-tools perf <history|import-budget|synth|bench|memory> ...")
+        print("  history [...]        per-gate timing percentiles and regressions from the local history")
+        print("  import-budget [...]  check import time of every tools/bin python entry point against its budget")
+        print("  synth [...]          generate a synthetic governance corpus (ADR/runbook/MP/proposal/components)")
+        print("  bench [...]          time each docs gate on synthetic corpora (1k/10k/100k docs)")
+        print("  memory [...]         tracemalloc peak and top allocation sites of tree-wide tools, against budgets")
+        return 0
+    if argv[0] == "history":
+        return _cmd_perf_history(argv[1:])
+    if argv[0] == "import-budget":
+        return _cmd_perf_import_budget(argv[1:])
+    if argv[0] == "synth":
+        return _cmd_perf_synth(argv[1:])
+    if argv[0] == "bench":
+        return _cmd_perf_bench(argv[1:])
+    if argv[0] == "memory":
+        return _cmd_perf_memory(argv[1:])
+    print(f"Unknown perf command: {argv[0]}", file=sys.stderr)
+    return 2
+
+
+def _cmd_perf_history(argv: list[str]) -> int:
+    from yai_tools.perf.history import run_history
+
+    p = argparse.ArgumentParser(prog="yai-tools perf history", add_help=True)
+    p.add_argument("--gate", default="", help="only this gate (e.g. docs-schema, plan:docs/docs-graph)")
+    p.add_argument("--days", type=float, default=0, help="only runs from the last N days")
+    p.add_argument("--window", type=int, default=10, help="runs in the rolling baseline median (default: 10)")
+    p.add_argument("--threshold", type=float, default=0.25, help="flag runs this much slower than baseline")
+    p.add_argument("--min-ms", type=float, default=50.0, help="ignore slowdowns smaller than this (default: 50)")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    p.add_argument("--fail-on-regression", action="store_true", help="exit 1 when a gate's latest run regressed")
+    args = p.parse_args(argv)
+
+    return run_history(
+        gate=args.gate,
+        days=args.days,
+        window=max(1, args.window),
+        threshold=args.threshold,
+        min_ms=args.min_ms,
+        fmt=args.format,
+        fail_on_regression=args.fail_on_regression,
+    )
+
+
+def _cmd_perf_import_budget(argv: list[str]) -> int:
+    from yai_tools.perf.import_budget import run_import_budget
+
+    p = argparse.ArgumentParser(prog="yai-tools perf import-budget", add_help=True)
+    p.add_argument("scripts", nargs="*", help="tools/bin entry points to check (default: all python ones)")
+    p.add_argument("--repeat", type=int, default=3, help="runs per entry point; the fastest counts (default: 3)")
+    p.add_argument("--scale", type=float, default=1.0, help="multiply every budget (slow CI runners)")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    args = p.parse_args(argv)
+
+    return run_import_budget(only=args.scripts, repeat=args.repeat, scale=args.scale, fmt=args.format)
+
+
+def _cmd_perf_synth(argv: list[str]) -> int:
+    from pathlib import Path
+
+    from yai_tools._core.paths import REPO_ROOT_ENV
+    from yai_tools.perf.synth import generate, parse_size
+
+    p = argparse.ArgumentParser(prog="yai-tools perf synth", add_help=True)
+    p.add_argument("--out", required=True, help="target directory (replaced)")
+    p.add_argument("--docs", default="1k", help="corpus size, e.g. 1000, 10k, 100k (default: 1k)")
+    p.add_argument("--invalid", type=float, default=0.02, help="share of deliberately broken docs (default: 0.02)")
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args(argv)
+
+    stats = generate(Path(args.out), parse_size(args.docs), args.invalid, args.seed)
+    kinds = ", ".join(f"{n} {k}" for k, n in stats.counts.items())
+    defects = sum(stats.defects.values())
+    print(f"[synth] OK: {stats.docs} docs under {stats.root} ({kinds}; {defects} broken on purpose)")
+    print(f"  run gates against it with {REPO_ROOT_ENV}={stats.root}")
+    return 0
+
+
+def _cmd_perf_bench(argv: list[str]) -> int:
+    from yai_tools.perf.bench import DEFAULT_SIZES, GATES, run_bench
+
+    p = argparse.ArgumentParser(prog="yai-tools perf bench", add_help=True)
+    p.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="comma-separated corpus sizes (default: %(default)s)")
+    p.add_argument("--gates", default="", help=f"comma-separated subset of: {', '.join(GATES)}")
+    p.add_argument("--runs", type=int, default=3, help="runs per gate and size; the median counts (default: 3)")
+    p.add_argument("--invalid", type=float, default=0.02, help="share of deliberately broken docs (default: 0.02)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--fresh", action="store_true", help="regenerate cached corpora")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    args = p.parse_args(argv)
+
+    return run_bench(
+        sizes=[s for s in args.sizes.split(",") if s.strip()],
+        gates=[g.strip() for g in args.gates.split(",") if g.strip()],
+        runs=max(1, args.runs),
+        invalid_ratio=args.invalid,
+        seed=args.seed,
+        fresh=args.fresh,
+        fmt=args.format,
+    )
+
+
+def _cmd_perf_memory(argv: list[str]) -> int:
+    from yai_tools.perf.memory import DEFAULT_TOP, TOOLS, run_memory
+    from yai_tools.perf.synth import parse_size
+
+    p = argparse.ArgumentParser(prog="yai-tools perf memory", add_help=True)
+    p.add_argument("--tools", default="", help=f"comma-separated subset of: {', '.join(TOOLS)}")
+    p.add_argument("--docs", default="10k", help="synthetic corpus size (default: 10k)")
+    p.add_argument("--top", type=int, default=DEFAULT_TOP, help="allocation sites to list per tool")
+    p.add_argument("--scale", type=float, default=1.0, help="multiply every budget")
+    p.add_argument("--fresh", action="store_true", help="regenerate the cached corpus")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    args = p.parse_args(argv)
+
+    return run_memory(
+        tools=[t.strip() for t in args.tools.split(",") if t.strip()],
+        docs=parse_size(args.docs),
+        top=max(0, args.top),
+        scale=args.scale,
+        fresh=args.fresh,
+        fmt=args.format,
+    )
+
+
+def cmd_perf_check(argv: list[str]) -> int:
+    from yai_tools.perf.check import run_perf_check
+    from yai_tools.verify.report import add_format_arg
+
+    p = argparse.ArgumentParser(prog="yai-perf-check", add_help=True)
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="compare against the committed baseline (default)")
+    mode.add_argument("--write", action="store_true", help="re-record docs/_generated/perf-baseline.v1.json")
+    p.add_argument("--tolerance", type=float, default=None, help="allowed throughput loss (baseline default: 0.35)")
+    p.add_argument("--rss-tolerance", type=float, default=None, help="allowed peak RSS growth (baseline default: 0.20)")
+    add_format_arg(p)
+    args = p.parse_args(argv)
+
+    tolerance = {}
+    if args.tolerance is not None:
+        tolerance["throughput"] = args.tolerance
+    if args.rss_tolerance is not None:
+        tolerance["peak_rss"] = args.rss_tolerance
+    return run_perf_check(write=args.write, tolerance=tolerance, fmt=args.format)
+
+
+def cmd_changelog(argv: list[str]) -> int:
+    from yai_tools.verify.changelog_index import run_query
+
+    p = argparse.ArgumentParser(
+        prog="yai-changelog",
+        add_help=True,
+        description="Query CHANGELOG.md sections or export release notes for a version range.",
+    )
+    p.add_argument("versions", nargs="*", help="section names to print (e.g. Unreleased 1.4.0)")
+    p.add_argument("--since", default="", help="first version of a range, inclusive (file order, either direction)")
+    p.add_argument("--until", default="", help="last version of a range, inclusive")
+    p.add_argument("--list", action="store_true", help="list the selected sections with date and bullet count")
+    p.add_argument("--ref", default="", help="read the changelog at a git ref instead of the worktree")
+    p.add_argument("--file", default="CHANGELOG.md", help="changelog path relative to the repo root")
+    p.add_argument("--format", choices=("markdown", "json"), default="markdown", help="output format")
+    args = p.parse_args(argv)
+
+    if args.versions and (args.since or args.until):
+        print("[changelog] ERROR: pass versions or --since/--until, not both", file=sys.stderr)
+        return 2
+    return run_query(args.file, args.ref, args.versions, args.since, args.until, args.list, args.format)
+
+
+def cmd_batch(argv: list[str]) -> int:
+    from yai_tools.workflow.batch import read_lines, run_batch
+
+    p = argparse.ArgumentParser(
+        prog="yai-tools batch",
+        add_help=True,
+        description="Run several subcommands in one interpreter, e.g. "
+        "yai-tools batch 'docs-schema-check' 'docs-graph --check' 'yai-changelog-check --pr --base HEAD~1 --head HEAD'",
+    )
+    p.add_argument("commands", nargs="*", help="one quoted command line per argument")
+    p.add_argument("-f", "--file", default="", help="read command lines from PATH (`-` for stdin)")
+    p.add_argument("--jobs", type=int, default=1, help="run up to N commands concurrently (default: 1)")
+    p.add_argument("--fail-fast", action="store_true", help="do not start further commands after a failure")
+    args = p.parse_args(argv)
+
+    return run_batch(read_lines(args.commands, args.file), COMMANDS, jobs=max(1, args.jobs), fail_fast=args.fail_fast)
+
+
+# Subcommand -> handler. Handlers import their modules on first call, so
+# `pr-check` or `branch` never load the verify stack.
+COMMANDS: dict[str, Callable[[list[str]], int]] = {
+    "pr-body": cmd_pr_body,
+    "pr-check": cmd_pr_check,
+    "branch": cmd_branch,
+    "issue-body": cmd_issue_body,
+    "dev-issue": cmd_dev_issue,
+    "milestone-body": cmd_milestone_body,
+    "issue-phase": cmd_issue_phase,
+    "issue-mp-closure": cmd_issue_mp_closure,
+    "fix-phase": cmd_fix_phase,
+    "label-sync": cmd_label_sync,
+    "docs-schema-check": cmd_docs_schema_check,
+    "docs-graph": cmd_docs_graph,
+    "agent-pack": cmd_agent_pack,
+    "docs-doctor": cmd_docs_doctor,
+    "architecture-check": cmd_architecture_check,
+    "path-policy-check": cmd_path_policy_check,
+    "generate": cmd_generate,
+    "plan": cmd_plan,
+    "perf": cmd_perf,
+    "perf-check": cmd_perf_check,
+    "changelog": cmd_changelog,
+    "batch": cmd_batch,
+}
 
 
 def main() -> int:
-    if len(sys.argv) < 2:
+    argv, trace, pstats = split_profile_args(sys.argv[1:])
+    if not argv:
         print(
-            "Usage: python -m yai_tools.cli <pr-body|pr-check|branch|issue-body|dev-issue|milestone-body|issue-phase|issue-mp-closure|fix-phase|label-sync|docs-schema-check|docs-graph|agent-pack|docs-doctor|architecture-check> ...",
+            f"Usage: python -m yai_tools.cli <{'|'.join(COMMANDS)}> [--profile trace.json] [--pstats out.prof] ...",
             file=sys.stderr,
         )
         return 2
 
-    sub = sys.argv[1]
-    rest = sys.argv[2:]
-
-    if sub == "pr-body":
-        return cmd_pr_body(rest)
-    if sub == "pr-check":
-        return cmd_pr_check(rest)
-    if sub == "branch":
-        return cmd_branch(rest)
-    if sub == "issue-body":
-        return cmd_issue_body(rest)
-    if sub == "dev-issue":
-        return cmd_dev_issue(rest)
-    if sub == "milestone-body":
-        return cmd_milestone_body(rest)
-    if sub == "issue-phase":
-        return cmd_issue_phase(rest)
-    if sub == "issue-mp-closure":
-        return cmd_issue_mp_closure(rest)
-    if sub == "fix-phase":
-        return cmd_fix_phase(rest)
-    if sub == "label-sync":
-        return cmd_label_sync(rest)
-    if sub == "docs-schema-check":
-        return cmd_docs_schema_check(rest)
-    if sub == "docs-graph":
-        return cmd_docs_graph(rest)
-    if sub == "agent-pack":
-        return cmd_agent_pack(rest)
-    if sub == "docs-doctor":
-        return cmd_docs_doctor(rest)
-    if sub == "architecture-check":
-        return cmd_architecture_check(rest)
-
-    print(f"Unknown subcommand: {sub}", file=sys.stderr)
-    return 2
+    sub, rest = argv[0], argv[1:]
+    handler = COMMANDS.get(sub)
+    if handler is None:
+        print(f"Unknown subcommand: {sub}", file=sys.stderr)
+        return 2
+    return run_profiled(lambda: handler(rest), name=sub, trace=trace, pstats=pstats)
 
 
 if __name__ == "__main__":
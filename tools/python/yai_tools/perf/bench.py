@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from yai_tools._core.cache import cache_dir
+from yai_tools._core.paths import REPO_ROOT_ENV
+from yai_tools.perf import synth
+
+# Gate benchmarks on synthetic corpora. Each gate runs in a fresh interpreter
+# with YAI_REPO_ROOT pointing at a generated tree, so a run measures what CI
+# pays: startup, discovery, reads, parsing and validation. Gate and history
+# caches are off; trees are kept under the tool cache and reused across runs.
+
+PYTHON_DIR = Path(__file__).resolve().parents[2]
+
+GATES: dict[str, list[str]] = {
+    "trace-check": ["yai_tools.verify.traceability", "--all"],
+    "schema-check": ["yai_tools.cli", "docs-schema-check"],
+    "docs-graph": ["yai_tools.cli", "docs-graph", "--check"],
+    "architecture-check": ["yai_tools.cli", "architecture-check", "--all", "--no-cache"],
+    "doctor": ["yai_tools.cli", "docs-doctor", "--mode", "all", "--no-cache"],
+}
+# generated artifacts the --check gates compare against (refused while the tree has violations)
+PREPARE = (
+    ["yai_tools.cli", "docs-graph", "--write"],
+    ["yai_tools.cli", "architecture-check", "--write"],
+    ["yai_tools.cli", "agent-pack", "--write"],
+)
+DEFAULT_SIZES = ("1k", "10k", "100k")
+
+
+@dataclass
+class GateBench:
+    gate: str
+    docs: int
+    rc: int
+    wall_ms: list[float] = field(default_factory=list)
+    cpu_ms: list[float] = field(default_factory=list)  # child user + system time
+    peak_rss_kib: int = 0
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.wall_ms) if self.wall_ms else 0.0
+
+    @property
+    def docs_per_s(self) -> float:
+        return self.docs / (self.median_ms / 1000) if self.median_ms else 0.0
+
+
+def gate_env(root: Path) -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("YAI_TOOLS_")}
+    env.update(
+        {
+            "PYTHONPATH": str(PYTHON_DIR),
+            REPO_ROOT_ENV: str(root),
+            "YAI_TOOLS_CACHE_DIR": str(root / ".cache" / "yai-tools"),
+            "YAI_TOOLS_NO_CACHE": "1",
+            "YAI_TOOLS_NO_HISTORY": "1",
+        }
+    )
+    return env
+
+
+def run_module(argv: list[str], env: dict[str, str]) -> tuple[int, float, float, int]:
+    """Run `python -m argv...` once; (exit code, wall ms, CPU ms, peak RSS KiB of the child)."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", *argv], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = (time.perf_counter() - t0) * 1000
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return proc.returncode, wall, (usage.ru_utime + usage.ru_stime) * 1000, usage.ru_maxrss  # KiB on Linux
+
+
+def ensure_corpus(docs: int, invalid_ratio: float, seed: int, fresh: bool = False) -> tuple[Path, bool]:
+    """Synthetic tree for this size, reused from the tool cache; (root, generated now)."""
+    root = cache_dir("bench", f"synth-{docs}-s{seed}-i{invalid_ratio:g}")
+    have = None if fresh else synth.load_manifest(root)
+    if have is not None and have.docs == docs and have.seed == seed and have.invalid_ratio == invalid_ratio:
+        return root, False
+    synth.generate(root, docs, invalid_ratio, seed)
+    env = gate_env(root)
+    for argv in PREPARE:
+        run_module(argv, env)
+    return root, True
+
+
+def bench_size(
+    docs: int, gates: list[str], runs: int = 3, invalid_ratio: float = 0.02, seed: int = 0, fresh: bool = False
+) -> list[GateBench]:
+    root, generated = ensure_corpus(docs, invalid_ratio, seed, fresh)
+    if generated:
+        print(f"[bench] generated {docs} docs under {root}", file=sys.stderr)
+    env = gate_env(root)
+    out: list[GateBench] = []
+    for gate in gates:
+        res = GateBench(gate=gate, docs=docs, rc=0)
+        for _ in range(runs):
+            rc, wall, cpu, rss = run_module(GATES[gate], env)
+            res.rc = rc
+            res.wall_ms.append(wall)
+            res.cpu_ms.append(cpu)
+            res.peak_rss_kib = max(res.peak_rss_kib, rss)
+        out.append(res)
+    return out
+
+
+def render_text(results: list[GateBench], runs: int) -> str:
+    lines = [
+        f"[bench] median of {runs} run(s) per gate; rc 1 is expected (the corpus carries invalid docs)",
+        f"{'docs':>7} {'gate':<20} {'median':>10} {'docs/s':>10} {'peak RSS':>10} {'rc':>3}",
+    ]
+    for r in results:
+        lines.append(
+            f"{r.docs:>7} {r.gate:<20} {r.median_ms:>8.0f}ms {r.docs_per_s:>10.0f}"
+            f" {r.peak_rss_kib / 1024:>8.1f}MB {r.rc:>3}"
+        )
+    return "\n".join(lines)
+
+
+def run_bench(
+    sizes: list[str] | None = None,
+    gates: list[str] | None = None,
+    runs: int = 3,
+    invalid_ratio: float = 0.02,
+    seed: int = 0,
+    fresh: bool = False,
+    fmt: str = "text",
+) -> int:
+    gates = gates or list(GATES)
+    unknown = [g for g in gates if g not in GATES]
+    if unknown:
+        print(f"[bench] ERROR: unknown gate(s): {', '.join(unknown)} (known: {', '.join(GATES)})")
+        return 2
+    results: list[GateBench] = []
+    for size in sizes or DEFAULT_SIZES:
+        results += bench_size(synth.parse_size(size), gates, runs, invalid_ratio, seed, fresh)
+
+    errored = [r for r in results if r.rc not in (0, 1)]
+    if fmt == "json":
+        rows = [{**asdict(r), "median_ms": round(r.median_ms, 1), "docs_per_s": round(r.docs_per_s, 1)} for r in results]
+        print(json.dumps({"runs": runs, "invalid_ratio": invalid_ratio, "seed": seed, "results": rows}, indent=2))
+    else:
+        print(render_text(results, runs))
+    if errored:
+        names = ", ".join(f"{r.gate}@{r.docs}" for r in errored)
+        print(f"[bench] ERROR: gate(s) crashed or rejected their arguments: {names}", file=sys.stderr)
+        return 2
+    return 0
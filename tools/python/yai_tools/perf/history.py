@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from yai_tools._core.cache import cache_dir
+from yai_tools._core.git import GitError, run_git
+from yai_tools._core.paths import repo_root, tools_version
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Local gate timing history: every measured gate is buffered in memory and
+# written to one SQLite file at process exit, so recording costs a single
+# transaction per command and never touches the gate's own timing. sqlite3 is
+# only imported when something is actually written or read.
+
+NO_HISTORY_ENV = "YAI_TOOLS_NO_HISTORY"
+DB_SCHEMA_VERSION = 1
+DEFAULT_INPUTS = ("docs",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS gate_runs (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    gate TEXT NOT NULL,
+    status TEXT NOT NULL,
+    wall_ms REAL NOT NULL,
+    cpu_ms REAL,
+    findings INTEGER NOT NULL DEFAULT 0,
+    cached INTEGER NOT NULL DEFAULT 0,
+    input_files INTEGER,
+    input_bytes INTEGER,
+    tools_version TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS gate_runs_gate_ts ON gate_runs (gate, ts);
+"""
+
+_lock = threading.Lock()
+_pending: list[tuple[Any, ...]] = []
+_run_id = os.urandom(6).hex()
+_registered = False
+
+
+def db_path() -> Path:
+    return cache_dir("perf", "history.sqlite3")
+
+
+def disabled() -> bool:
+    return os.environ.get(NO_HISTORY_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=None)
+def input_size(pathspecs: tuple[str, ...] = DEFAULT_INPUTS) -> tuple[int | None, int | None]:
+    """Tracked (files, bytes) under `pathspecs` at HEAD; (None, None) outside a git checkout."""
+    try:
+        out = run_git(["ls-tree", "-r", "-l", "--full-tree", "HEAD", "--", *pathspecs], cwd=repo_root())
+    except GitError:
+        return None, None
+    files = size = 0
+    for line in out.splitlines():
+        meta = line.split("\t", 1)[0].split()
+        if len(meta) == 4 and meta[1] == "blob":
+            files += 1
+            size += int(meta[3])
+    return files, size
+
+
+def record(
+    gate: str,
+    status: str,
+    wall_ms: float,
+    cpu_ms: float | None = None,
+    findings: int = 0,
+    cached: bool = False,
+    inputs: Iterable[str] = DEFAULT_INPUTS,
+) -> None:
+    """Buffer one gate timing; flushed to the history database at exit."""
+    global _registered
+    if disabled():
+        return
+    row = (_run_id, time.time(), gate, status, wall_ms, cpu_ms, findings, int(cached), tuple(inputs) or DEFAULT_INPUTS)
+    with _lock:
+        _pending.append(row)
+        if not _registered:
+            atexit.register(flush)
+            _registered = True
+
+
+def connect(path: Path | None = None) -> sqlite3.Connection:
+    import sqlite3
+
+    path = path or db_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=10)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version != DB_SCHEMA_VERSION:
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {DB_SCHEMA_VERSION}")
+    return conn
+
+
+def flush() -> int:
+    """Write buffered timings in one transaction; returns the number of rows written."""
+    with _lock:
+        rows = list(_pending)
+        _pending.clear()
+    if not rows:
+        return 0
+    import sqlite3
+
+    version = tools_version()
+    values = [(*row[:8], *input_size(row[8]), version) for row in rows]
+    try:
+        conn = connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO gate_runs (run_id, ts, gate, status, wall_ms, cpu_ms, findings, cached,"
+                    " input_files, input_bytes, tools_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    values,
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError) as e:
+        sys.stderr.write(f"[perf-history] WARN: cannot record timings: {e}\n")
+        return 0
+    return len(values)
+
+
+@dataclass
+class GateTrend:
+    gate: str
+    runs: int
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    last_ms: float
+    baseline_ms: float
+    change: float  # last vs baseline, e.g. 0.25 = 25% slower
+    first_inputs: int | None
+    last_inputs: int | None
+    cached_runs: int
+    regressions: list[dict[str, Any]]
+    regressed: bool  # the latest run is one of `regressions`
+
+
+def percentile(sorted_vals: list[float], q: float) -> float:
+    """Linear-interpolated percentile of an ascending list (q in 0..100)."""
+    if not sorted_vals:
+        return 0.0
+    pos = (len(sorted_vals) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+
+
+def _is_regression(wall: float, baseline: float, threshold: float, min_ms: float) -> bool:
+    return baseline > 0 and wall > baseline * (1 + threshold) and wall - baseline >= min_ms
+
+
+def load_runs(conn: sqlite3.Connection, gate: str = "", days: float = 0) -> list[sqlite3.Row]:
+    import sqlite3
+
+    conn.row_factory = sqlite3.Row
+    sql = "SELECT * FROM gate_runs WHERE 1 = 1"
+    params: list[Any] = []
+    if gate:
+        sql += " AND gate = ?"
+        params.append(gate)
+    if days > 0:
+        sql += " AND ts >= ?"
+        params.append(time.time() - days * 86400)
+    return conn.execute(sql + " ORDER BY gate, ts", params).fetchall()
+
+
+def trends(rows: list[sqlite3.Row], window: int = 10, threshold: float = 0.25, min_ms: float = 50.0) -> list[GateTrend]:
+    """Per-gate percentiles plus runs slower than the median of the `window` runs before them.
+
+    Cache replays are counted but excluded from timings: they measure the cache,
+    not the gate.
+    """
+    import statistics
+
+    by_gate: dict[str, list[sqlite3.Row]] = {}
+    for row in rows:
+        by_gate.setdefault(row["gate"], []).append(row)
+
+    out: list[GateTrend] = []
+    for gate, gate_rows in sorted(by_gate.items()):
+        timed = [r for r in gate_rows if not r["cached"] and r["status"] in ("OK", "FAIL")]
+        if not timed:
+            continue
+        walls = [r["wall_ms"] for r in timed]
+        regressions: list[dict[str, Any]] = []
+        for i, r in enumerate(timed):
+            prev = walls[max(0, i - window) : i]
+            if len(prev) < 3:
+                continue
+            base = statistics.median(prev)
+            if _is_regression(r["wall_ms"], base, threshold, min_ms):
+                regressions.append(
+                    {
+                        "ts": r["ts"],
+                        "run_id": r["run_id"],
+                        "wall_ms": round(r["wall_ms"], 1),
+                        "baseline_ms": round(base, 1),
+                        "input_files": r["input_files"],
+                    }
+                )
+        prev = walls[-window - 1 : -1]
+        baseline = statistics.median(prev) if prev else walls[-1]
+        ordered = sorted(walls)
+        out.append(
+            GateTrend(
+                gate=gate,
+                runs=len(timed),
+                p50_ms=percentile(ordered, 50),
+                p90_ms=percentile(ordered, 90),
+                p95_ms=percentile(ordered, 95),
+                last_ms=walls[-1],
+                baseline_ms=baseline,
+                change=(walls[-1] / baseline - 1) if baseline else 0.0,
+                first_inputs=timed[0]["input_files"],
+                last_inputs=timed[-1]["input_files"],
+                cached_runs=len(gate_rows) - len(timed),
+                regressions=regressions,
+                regressed=bool(regressions) and regressions[-1]["ts"] == timed[-1]["ts"],
+            )
+        )
+    return out
+
+
+def _fmt_inputs(first: int | None, last: int | None) -> str:
+    if last is None:
+        return "-"
+    return str(last) if first in (None, last) else f"{first}->{last}"
+
+
+def render_text(items: list[GateTrend], threshold: float, show: int = 5) -> str:
+    lines = [f"{'gate':<34} {'runs':>5} {'p50':>9} {'p90':>9} {'p95':>9} {'last':>9} {'vs base':>8} {'inputs':>11}"]
+    for t in items:
+        flag = "  REGRESSED" if t.regressed else ""
+        lines.append(
+            f"{t.gate:<34} {t.runs:>5} {t.p50_ms:>7.1f}ms {t.p90_ms:>7.1f}ms {t.p95_ms:>7.1f}ms {t.last_ms:>7.1f}ms"
+            f" {t.change:>+7.0%} {_fmt_inputs(t.first_inputs, t.last_inputs):>11}{flag}"
+        )
+    flagged = [(t.gate, r) for t in items for r in t.regressions]
+    if flagged:
+        lines.append(f"runs slower than their rolling median by more than {threshold:.0%}:")
+        for gate, r in sorted(flagged, key=lambda x: x[1]["ts"])[-show:]:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(r["ts"]))
+            lines.append(
+                f"- {when} {gate}: {r['wall_ms']}ms vs {r['baseline_ms']}ms"
+                f" (run {r['run_id']}, {r['input_files'] if r['input_files'] is not None else '?'} input files)"
+            )
+    return "\n".join(lines)
+
+
+def run_history(
+    gate: str = "",
+    days: float = 0,
+    window: int = 10,
+    threshold: float = 0.25,
+    min_ms: float = 50.0,
+    fmt: str = "text",
+    fail_on_regression: bool = False,
+) -> int:
+    path = db_path()
+    if not path.exists():
+        print(f"[perf-history] no timings recorded yet ({path})")
+        return 0
+    conn = connect(path)
+    try:
+        items = trends(load_runs(conn, gate, days), window, threshold, min_ms)
+    finally:
+        conn.close()
+
+    regressed = [t.gate for t in items if t.regressed]
+    if fmt == "json":
+        print(json.dumps({"db": str(path), "threshold": threshold, "gates": [asdict(t) for t in items]}, indent=2))
+    else:
+        print(f"[perf-history] {len(items)} gate(s) from {path}")
+        if items:
+            print(render_text(items, threshold))
+        if regressed:
+            print(f"[perf-history] REGRESSED: latest run of {', '.join(regressed)}")
+    return 1 if fail_on_regression and regressed else 0
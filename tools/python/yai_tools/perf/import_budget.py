@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+
+from yai_tools._core.entrypoints import EntryPoint, discover_entry_points
+from yai_tools._core.paths import repo_root
+
+# Import-time budget for the tools/bin entry points. Each wrapper that execs a
+# yai_tools module is started with `-X importtime ... --help` in a fresh
+# interpreter; the budget covers everything imported after interpreter startup
+# (the entry module and whatever its subcommand loads), best of --repeat runs.
+
+REPO_ROOT = repo_root()
+PYTHON_DIR = REPO_ROOT / "tools" / "python"
+
+# Lightweight commands (PR/issue/branch helpers) get the default budget and
+# must not import the verify stack at all; verify commands and `plan` may.
+DEFAULT_BUDGET_MS = 80.0
+BUDGETS_MS: dict[str, float] = {
+    "yai_tools.cli docs-schema-check": 160.0,
+    "yai_tools.cli docs-graph": 160.0,
+    "yai_tools.cli agent-pack": 160.0,
+    "yai_tools.cli docs-doctor": 160.0,
+    "yai_tools.cli architecture-check": 160.0,
+    "yai_tools.cli path-policy-check": 160.0,
+    "yai_tools.cli generate": 160.0,
+    "yai_tools.cli plan": 160.0,
+    "yai_tools.cli perf-check": 160.0,
+    "yai_tools.cli changelog": 160.0,
+    "yai_tools.verify.traceability": 160.0,
+    "yai_tools.verify.changelog": 160.0,
+    "yai_tools.verify.proof_pack": 160.0,
+}
+LIGHTWEIGHT_FORBIDDEN = ("yai_tools.verify", "yai_tools.workflow.plan")
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+
+
+@dataclass
+class Measurement:
+    script: str
+    target: str
+    import_ms: float
+    budget_ms: float
+    top: list[tuple[str, float]] = field(default_factory=list)
+    forbidden: list[str] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and not self.forbidden and self.import_ms <= self.budget_ms
+
+
+def _importtime(argv: list[str], env: dict[str, str]) -> tuple[dict[str, int], set[str], str]:
+    """Top-level imports of one run as {module: cumulative µs}, every module imported, and stderr on failure."""
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=str(REPO_ROOT),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    top: dict[str, int] = {}
+    seen: set[str] = set()
+    other: list[str] = []
+    for line in p.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m is None:
+            if not line.startswith("import time:"):
+                other.append(line)
+            continue
+        seen.add(m.group(4))
+        if len(m.group(3)) == 1:  # one space after "|" marks a top-level import
+            top[m.group(4)] = top.get(m.group(4), 0) + int(m.group(2))
+    err = "\n".join(other[-3:]) if p.returncode not in (0, 1, 2) or "Traceback" in p.stderr else ""
+    return top, seen, err
+
+
+def measure(ep: EntryPoint, repeat: int = 3) -> Measurement:
+    env = {**os.environ, "PYTHONPATH": str(PYTHON_DIR), "YAI_TOOLS_NO_HISTORY": "1"}
+    env.pop("YAI_TOOLS_PROFILE", None)
+    env.pop("YAI_TOOLS_PSTATS", None)
+    startup, _, _ = _importtime(["-c", "pass"], env)
+    budget = BUDGETS_MS.get(ep.target, DEFAULT_BUDGET_MS)
+    argv = ["-m", ep.module, *([ep.sub] if ep.sub else []), "--help"]
+    if ep.module == "yai_tools.cli" and not ep.sub:
+        argv = ["-m", ep.module]  # bare dispatcher: usage only
+
+    best: dict[str, int] | None = None
+    best_us = 0
+    forbidden: set[str] = set()
+    for _ in range(max(1, repeat)):
+        top, seen, err = _importtime(argv, env)
+        if err:
+            return Measurement(ep.script, ep.target, 0.0, budget, error=err)
+        if ep.target not in BUDGETS_MS:
+            forbidden |= {m for m in seen if m.startswith(LIGHTWEIGHT_FORBIDDEN)}
+        mods = {k: v for k, v in top.items() if k not in startup}
+        total = sum(mods.values())
+        if best is None or total < best_us:
+            best, best_us = mods, total
+    assert best is not None
+    heavy = sorted(best.items(), key=lambda kv: kv[1], reverse=True)[:3]
+    return Measurement(
+        ep.script,
+        ep.target,
+        best_us / 1000,
+        budget,
+        top=[(name, us / 1000) for name, us in heavy],
+        forbidden=sorted(forbidden),
+    )
+
+
+def run_import_budget(only: list[str] | None = None, repeat: int = 3, scale: float = 1.0, fmt: str = "text") -> int:
+    eps = discover_entry_points()
+    if only:
+        eps = [ep for ep in eps if ep.script in only]
+    results = []
+    for ep in eps:
+        res = measure(ep, repeat)
+        res.budget_ms *= scale
+        results.append(res)
+
+    failed = [r for r in results if not r.ok]
+    if fmt == "json":
+        print(json.dumps({"ok": not failed, "entry_points": [{**asdict(r), "ok": r.ok} for r in results]}, indent=2))
+        return 1 if failed else 0
+
+    for r in results:
+        if r.error:
+            print(f"- {r.script}: ERROR ({r.target}): {r.error}")
+            continue
+        mark = "" if r.ok else ("  HEAVY IMPORTS" if r.import_ms <= r.budget_ms else "  OVER BUDGET")
+        heavy = ", ".join(f"{n} {ms:.1f}ms" for n, ms in r.top)
+        print(f"- {r.script}: {r.import_ms:.1f}ms / {r.budget_ms:.0f}ms ({r.target}){mark}")
+        if r.forbidden:
+            print(f"    imports the verify stack: {', '.join(r.forbidden[:5])}")
+        if not r.ok and heavy:
+            print(f"    heaviest: {heavy}")
+    if failed:
+        print(f"[import-budget] FAIL: {len(failed)} of {len(results)} entry point(s) over budget")
+        return 1
+    print(f"[import-budget] OK: {len(results)} entry point(s) within budget")
+    return 0
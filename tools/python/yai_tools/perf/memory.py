@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from yai_tools.perf import bench
+
+# Memory harness for the tools that hold a whole tree in memory. Each tool runs
+# in a child interpreter (module-level paths follow YAI_REPO_ROOT) on a
+# synthetic corpus, under tracemalloc started after its imports: `peak` is the
+# high-water mark of the tool's own allocations, `retained` what its result
+# still holds, and the top allocation sites are taken while that result is alive.
+
+DEFAULT_DOCS = 10_000
+DEFAULT_TOP = 8
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Peak tracemalloc budget: `fixed_mib` plus `per_1k_mib` per thousand docs."""
+
+    fixed_mib: float
+    per_1k_mib: float
+
+    def mib(self, docs: int) -> float:
+        return self.fixed_mib + self.per_1k_mib * docs / 1000
+
+
+# peaks measured at 1k/10k/100k docs (linear in corpus size) plus >=25% headroom
+# at each size; walk_repo peaks at 1.9/10.3/92.7 MiB, so its fixed part is not tight
+BUDGETS: dict[str, Budget] = {
+    "walk_repo": Budget(1.5, 1.2),
+    "build_graph": Budget(2.0, 5.0),
+    "alignment_snapshot": Budget(1.0, 0.35),
+}
+
+
+def _walk_repo(root: Path) -> Any:
+    from yai_infra_tools.project.inventory import walk_repo
+
+    return lambda: walk_repo(root)
+
+
+def _build_graph(root: Path) -> Any:
+    from yai_tools.verify.corpus import DocsCorpus
+    from yai_tools.verify.trace_graph import build_graph
+
+    return lambda: build_graph(DocsCorpus(root))
+
+
+def _alignment_snapshot(root: Path) -> Any:
+    from yai_tools.verify.architecture_alignment import build_alignment_snapshot
+    from yai_tools.verify.corpus import DocsCorpus
+
+    return lambda: build_alignment_snapshot(max_workers=1, corpus=DocsCorpus(root))
+
+
+# tool name -> loader returning the call to measure (imports happen before tracing starts)
+TOOLS: dict[str, Callable[[Path], Callable[[], Any]]] = {
+    "walk_repo": _walk_repo,
+    "build_graph": _build_graph,
+    "alignment_snapshot": _alignment_snapshot,
+}
+
+
+@dataclass
+class MemoryResult:
+    tool: str
+    docs: int
+    peak_kib: float = 0.0
+    retained_kib: float = 0.0
+    budget_kib: float = 0.0
+    top: list[dict[str, Any]] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and self.peak_kib <= self.budget_kib
+
+
+def trace(tool: str, root: Path, top: int = DEFAULT_TOP) -> dict[str, Any]:
+    """Run one tool under tracemalloc in this process; returns peak/retained KiB and top sites."""
+    import tracemalloc
+
+    call = TOOLS[tool](root)
+    tracemalloc.start(1)
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    prefix = str(bench.PYTHON_DIR) + os.sep
+    stats = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)]).statistics("lineno")
+    sites = [
+        {
+            "site": f"{s.traceback[0].filename.removeprefix(prefix)}:{s.traceback[0].lineno}",
+            "kib": round(s.size / 1024, 1),
+            "count": s.count,
+        }
+        for s in stats[:top]
+    ]
+    retained = sum(s.size for s in stats)
+    del result
+    return {"peak_kib": round(peak / 1024, 1), "retained_kib": round(retained / 1024, 1), "top": sites}
+
+
+def measure(tool: str, docs: int, top: int = DEFAULT_TOP, fresh: bool = False) -> MemoryResult:
+    root, _ = bench.ensure_corpus(docs, 0.02, 0, fresh)
+    res = MemoryResult(tool=tool, docs=docs, budget_kib=BUDGETS[tool].mib(docs) * 1024)
+    p = subprocess.run(
+        [sys.executable, "-m", "yai_tools.perf.memory", tool, str(root), str(top)],
+        env=bench.gate_env(root),
+        capture_output=True,
+        text=True,
+    )
+    if p.returncode != 0:
+        res.error = (p.stderr.strip().splitlines() or [f"exit {p.returncode}"])[-1]
+        return res
+    data = json.loads(p.stdout)
+    res.peak_kib, res.retained_kib, res.top = data["peak_kib"], data["retained_kib"], data["top"]
+    return res
+
+
+def run_memory(
+    tools: list[str] | None = None,
+    docs: int = DEFAULT_DOCS,
+    top: int = DEFAULT_TOP,
+    scale: float = 1.0,
+    fresh: bool = False,
+    fmt: str = "text",
+) -> int:
+    tools = tools or list(TOOLS)
+    unknown = [t for t in tools if t not in TOOLS]
+    if unknown:
+        print(f"[memory] ERROR: unknown tool(s): {', '.join(unknown)} (known: {', '.join(TOOLS)})")
+        return 2
+    results = []
+    for tool in tools:
+        res = measure(tool, docs, top, fresh)
+        res.budget_kib *= scale
+        results.append(res)
+
+    failed = [r for r in results if not r.ok]
+    if fmt == "json":
+        print(json.dumps({"ok": not failed, "docs": docs, "tools": [{**asdict(r), "ok": r.ok} for r in results]}, indent=2))
+        return 1 if failed else 0
+
+    for r in results:
+        if r.error:
+            print(f"- {r.tool}: ERROR: {r.error}")
+            continue
+        mark = "" if r.ok else "  OVER BUDGET"
+        print(
+            f"- {r.tool} @ {r.docs} docs: peak {r.peak_kib / 1024:.1f}MB / {r.budget_kib / 1024:.1f}MB,"
+            f" retained {r.retained_kib / 1024:.1f}MB{mark}"
+        )
+        for site in r.top:
+            print(f"    {site['kib'] / 1024:>7.2f}MB {site['count']:>8} blocks  {site['site']}")
+    if failed:
+        print(f"[memory] FAIL: {len(failed)} of {len(results)} tool(s) over their memory budget")
+        return 1
+    print(f"[memory] OK: {len(results)} tool(s) within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    # child mode: <tool> <root> [top]
+    tool_name, tree = sys.argv[1], Path(sys.argv[2])
+    print(json.dumps(trace(tool_name, tree, int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_TOP)))
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import random
+import shutil
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Synthetic governance corpus: a self-contained tree (docs/, deps/yai-law/,
+# tools/schemas/docs) shaped like a real yai checkout, with proposals, ADRs,
+# runbooks, milestone packs and architecture components cross-referencing each
+# other. A deterministic fraction of docs is broken on purpose (missing
+# frontmatter, bad ids/status, dangling refs, unlinked MPs) so every gate walks
+# both its pass and its failure paths. Point the tools at it with YAI_REPO_ROOT.
+
+GENERATOR_VERSION = 1
+MANIFEST = "synth-manifest.json"
+
+# tools/python/yai_tools/perf/synth.py -> the checkout the tools ship in
+_SOURCE_ROOT = Path(__file__).resolve().parents[4]
+
+# share of the corpus per doc kind; the rest of the counts follow from these
+MIX = {"adr": 0.30, "runbook": 0.28, "mp": 0.25, "proposal": 0.12, "component": 0.05}
+TRACK_SIZE = 500  # runbooks/MPs/proposals per track directory; ADRs stay flat, as the schema requires
+DEFECTS = ("no-frontmatter", "bad-id", "bad-status", "dangling-ref", "unlinked-mp")
+STATUSES = ("draft", "active", "active", "active", "superseded")
+TOPOLOGY = "Canonical Topology: root -> kernel -> engine -> mind"
+_LOREM = (
+    "The control plane keeps authority at the root boundary and forwards only validated envelopes. "
+    "Every transition is recorded with its evidence pointer so the audit trail can be replayed. "
+    "Operators confirm the gate output before promotion; drift is tracked as a named gap with an owner. "
+)
+
+
+@dataclass
+class SynthStats:
+    root: str
+    docs: int
+    seed: int
+    invalid_ratio: float
+    counts: dict[str, int] = field(default_factory=dict)
+    defects: dict[str, int] = field(default_factory=dict)
+    law_files: int = 0
+    generator_version: int = GENERATOR_VERSION
+
+
+def parse_size(text: str) -> int:
+    """`1000`, `10k` or `1m` -> doc count."""
+    t = text.strip().lower()
+    mult = 1
+    if t.endswith("k"):
+        t, mult = t[:-1], 1000
+    elif t.endswith("m"):
+        t, mult = t[:-1], 1_000_000
+    return int(float(t) * mult)
+
+
+def _counts(total: int) -> dict[str, int]:
+    counts = {kind: max(1, int(total * share)) for kind, share in MIX.items()}
+    counts["adr"] += total - sum(counts.values())  # rounding remainder
+    return counts
+
+
+def _frontmatter(fields: list[tuple[str, str | list[str]]]) -> str:
+    lines = ["---"]
+    for key, val in fields:
+        if isinstance(val, list):
+            lines.append(f"{key}:")
+            lines.extend(f"  - {v}" for v in val)
+        else:
+            lines.append(f"{key}: {val}")
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+def _body(title: str, rng: random.Random, extra: list[str] | None = None) -> str:
+    paras = [_LOREM * rng.randint(1, 3) for _ in range(rng.randint(2, 5))]
+    return "\n".join([f"# {title}", "", *(extra or []), *(p + "\n" for p in paras)])
+
+
+class _Writer:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._dirs: set[Path] = set()
+
+    def write(self, rel: str, text: str) -> None:
+        path = self.root / rel
+        if path.parent not in self._dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(path.parent)
+        path.write_text(text, encoding="utf-8")
+
+
+def _track(i: int) -> str:
+    return f"track-{i // TRACK_SIZE:03d}"
+
+
+def generate(root: Path, docs: int, invalid_ratio: float = 0.02, seed: int = 0) -> SynthStats:
+    """Write a synthetic corpus of about `docs` governance docs under `root` (replacing it)."""
+    if root.exists():
+        shutil.rmtree(root)
+    rng = random.Random(seed)
+    out = _Writer(root)
+    counts = _counts(docs)
+    stats = SynthStats(root=str(root), docs=sum(counts.values()), seed=seed, invalid_ratio=invalid_ratio, counts=counts)
+    stats.defects = {d: 0 for d in DEFECTS}
+
+    def defect(allowed: tuple[str, ...] = DEFECTS[:4]) -> str:
+        if rng.random() >= invalid_ratio:
+            return ""
+        kind = rng.choice(allowed)
+        stats.defects[kind] += 1
+        return kind
+
+    # L0 anchors the docs point into
+    areas = ("invariants", "boundaries", "protocol")
+    law = [f"deps/yai-law/contracts/{areas[i % 3]}/I-{i:04d}.md" for i in range(max(3, docs // 100))]
+    for ref in law:
+        out.write(ref, f"# {Path(ref).stem}\n\n{_LOREM}\n")
+    stats.law_files = len(law)
+
+    adrs = [f"docs/design/adr/ADR-{i:06d}-decision.md" for i in range(counts["adr"])]
+    runbooks = [f"docs/runbooks/{_track(i)}/rb-{i:06d}.md" for i in range(counts["runbook"])]
+    mps = [f"docs/milestone-packs/{_track(i)}/mp-{i:06d}.md" for i in range(counts["mp"])]
+    proposals = [f"docs/design/proposals/{_track(i)}/PRP-{i:06d}.md" for i in range(counts["proposal"])]
+
+    # milestone pack -> runbook, decided up front so runbooks can mention their MP ids
+    mp_runbook = [rng.randrange(len(runbooks)) for _ in mps]
+    mp_unlinked = [defect(DEFECTS) for _ in mps]
+    runbook_mps: dict[int, list[str]] = {}
+    for i, (rb, bad) in enumerate(zip(mp_runbook, mp_unlinked)):
+        if bad != "unlinked-mp":
+            runbook_mps.setdefault(rb, []).append(f"MP-SYN-{i:06d}")
+
+    def dangling(ref: str) -> str:
+        return ref.replace(".md", "-missing.md")
+
+    for i, path in enumerate(adrs):
+        bad = defect()
+        refs = rng.sample(law, min(len(law), rng.randint(1, 3)))
+        if bad == "dangling-ref":
+            refs[0] = dangling(refs[0])
+        fields: list[tuple[str, str | list[str]]] = [
+            ("id", f"ADR-{i:06d}" if bad != "bad-id" else f"DEC-{i:06d}"),
+            ("status", rng.choice(STATUSES) if bad != "bad-status" else "someday"),
+            ("law_refs", refs),
+        ]
+        if runbooks and rng.random() < 0.5:
+            fields.append(("runbook", runbooks[rng.randrange(len(runbooks))]))
+        fm = "" if bad == "no-frontmatter" else _frontmatter(fields)
+        out.write(path, fm + _body(f"ADR {i}", rng))
+
+    for i, path in enumerate(runbooks):
+        bad = defect()
+        refs = rng.sample(adrs, min(len(adrs), rng.randint(1, 3)))
+        if bad == "dangling-ref":
+            refs[0] = dangling(refs[0])
+        fm = "" if bad == "no-frontmatter" else _frontmatter(
+            [
+                ("id", f"RB-SYN-{i:06d}" if bad != "bad-id" else f"RUN-{i:06d}"),
+                ("status", rng.choice(STATUSES) if bad != "bad-status" else "someday"),
+                ("adr_refs", refs),
+            ]
+        )
+        linked = [f"- Milestone Pack: `{mp}`" for mp in runbook_mps.get(i, [])]
+        out.write(path, fm + _body(f"Runbook {i}", rng, linked + ([""] if linked else [])))
+
+    for i, path in enumerate(mps):
+        bad = mp_unlinked[i] if mp_unlinked[i] != "unlinked-mp" else ""
+        anchors = rng.sample(law, min(len(law), rng.randint(1, 2)))
+        mp_adrs = rng.sample(adrs, min(len(adrs), rng.randint(1, 2)))
+        if bad == "dangling-ref":
+            mp_adrs[0] = dangling(mp_adrs[0])
+        fm = "" if bad == "no-frontmatter" else _frontmatter(
+            [
+                ("id", f"MP-SYN-{i:06d}" if bad != "bad-id" else f"MS-SYN-{i:06d}"),
+                ("status", rng.choice(STATUSES) if bad != "bad-status" else "someday"),
+                ("runbook", runbooks[mp_runbook[i]]),
+                ("phase", f"0.{i % 9}.{i % 7} - Synthetic Phase"),
+                ("adrs", mp_adrs),
+                ("spec_anchors", anchors),
+                ("issues", [f"#{1000 + i}"] if i % 5 else ["N/A"]),
+                ("issue_reason", "bootstrap"),
+            ]
+        )
+        out.write(path, fm + _body(f"Milestone Pack {i}", rng))
+
+    for i, path in enumerate(proposals):
+        bad = defect()
+        prp_adrs = rng.sample(adrs, min(len(adrs), rng.randint(1, 2)))
+        if bad == "dangling-ref":
+            prp_adrs[0] = dangling(prp_adrs[0])
+        fm = "" if bad == "no-frontmatter" else _frontmatter(
+            [
+                ("id", f"PRP-{i:06d}" if bad != "bad-id" else f"RFC-{i:06d}"),
+                ("status", rng.choice(("draft", "active", "accepted")) if bad != "bad-status" else "someday"),
+                ("owner", f"team-{i % 17}"),
+                ("effective_date", f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}"),
+                ("adr", prp_adrs),
+                ("runbooks", rng.sample(runbooks, min(len(runbooks), 1))),
+                ("milestone_packs", rng.sample(mps, min(len(mps), 1))),
+            ]
+        )
+        out.write(path, fm + _body(f"Proposal {i}", rng))
+
+    # architecture: topology docs plus one component doc per `component` slot
+    for name in ("overview", "runtime-model"):
+        out.write(f"docs/architecture/{name}.md", f"# {name}\n\n{TOPOLOGY}\n\n{_LOREM}\n")
+    for i in range(counts["component"]):
+        bad = defect()
+        status = rng.choice(("implemented", "partial", "planned/external"))
+        trace = [f"`{a}`" for a in rng.sample(adrs, min(len(adrs), 2))] + [f"`{rng.choice(runbooks)}`"]
+        if bad == "dangling-ref":
+            trace[0] = f"`{dangling(trace[0].strip('`'))}`"
+        sections = {
+            "Role": _LOREM,
+            "Current Implementation Status": status if bad != "bad-status" else "unknown",
+            "Interfaces and Entry Points": f"- `{rng.choice(law)}`",
+            "Authority and Boundary Rules": _LOREM,
+            "Traceability": "\n".join(f"- {t}" for t in trace) + f"\n- `{rng.choice(law)}`",
+            "Known Drift / Gaps": "- none tracked",
+            "Next Alignment Steps": "- keep refs current",
+        }
+        body = "".join(f"## {k}\n\n{v}\n\n" for k, v in sections.items())
+        fm = "" if bad == "no-frontmatter" else _frontmatter(
+            [
+                ("id", f"ARCH-COMP-{i:05d}" if bad != "bad-id" else ""),
+                ("status", "active"),
+                ("effective_date", "2026-02-19"),
+                ("revision", "1"),
+                ("owner", "architecture"),
+                ("law_refs", [rng.choice(law)]),
+            ]
+        )
+        out.write(f"docs/architecture/components/component-{i:05d}.md", fm + f"# Component {i}\n\n" + body)
+
+    # schemas and version from the checkout the tools ship in
+    schema_src = _SOURCE_ROOT / "tools" / "schemas" / "docs"
+    shutil.copytree(schema_src, root / "tools" / "schemas" / "docs")
+    version = _SOURCE_ROOT / "tools" / "VERSION"
+    if version.exists():
+        shutil.copy2(version, root / "tools" / "VERSION")
+
+    (root / MANIFEST).write_text(json.dumps(asdict(stats), indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return stats
+
+
+def load_manifest(root: Path) -> SynthStats | None:
+    try:
+        data = json.loads((root / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("generator_version") != GENERATOR_VERSION:
+        return None
+    return SynthStats(**data)
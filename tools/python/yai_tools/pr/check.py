@@ -2,52 +2,65 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from typing import Any, Iterator
+
+REQUIRED = (
+    "Issue-ID:",
+    "MP-ID:",
+    "Runbook:",
+    "Base-Commit:",
+    "Classification:",
+    "Compatibility:",
+    "## Evidence",
+    "## Commands run",
+)
+BANNED = (
+    "#<issue-number>",
+    "<40-char-sha>",
+    "MP-<TRACK>-<X.Y.Z>",
+    "docs/runbooks/<name>.md#<anchor>",
+    "<one paragraph>",
+    "<what doc/policy changes and why>",
+    "<case 1>",
+    "# exact commands",
+)
+
+# compiled once per process: batch runs check hundreds of bodies
+PLACEHOLDER_BULLET_RE = re.compile(r"^\s*-\s+\.\.\.\s*$", re.MULTILINE)
+ISSUE_RE = re.compile(r"#\d+|N/A", re.IGNORECASE)
+MP_ID_RE = re.compile(r"MP-[A-Z0-9-]+-\d+\.\d+\.\d+|N/A", re.IGNORECASE)
+RUNBOOK_RE = re.compile(r"docs/runbooks/.+\.md#.+|N/A", re.IGNORECASE)
+SHA_RE = re.compile(r"[0-9a-fA-F]{40}")
+EVIDENCE_RE = re.compile(r"## Evidence\s*([\s\S]*?)(?:\n##\s|$)", re.IGNORECASE)
+TODO_RE = re.compile(r"\b(TODO|TBD|to be done|lorem ipsum)\b", re.IGNORECASE)
+POS_NEG_RE = re.compile(r"-\s+Positive:\s*[\s\S]*-\s+Negative:", re.IGNORECASE)
+COMMANDS_RE = re.compile(r"## Commands run\s*[\s\S]*?```bash\s*([\s\S]*?)```", re.IGNORECASE)
+
+_FIELD_RES: dict[str, re.Pattern[str]] = {}
 
 
 def _extract(md: str, key: str) -> str:
-    m = re.search(rf"{re.escape(key)}\s*:\s*([^\n\r]+)", md, flags=re.IGNORECASE)
+    pat = _FIELD_RES.get(key)
+    if pat is None:
+        pat = _FIELD_RES[key] = re.compile(rf"{re.escape(key)}\s*:\s*([^\n\r]+)", re.IGNORECASE)
+    m = pat.search(md)
     return m.group(1).strip() if m else ""
 
 
-def check_pr_body(path: str) -> tuple[bool, str]:
-    p = Path(path)
-    if not p.exists():
-        return False, f"PR body file not found: {path}"
-
-    body = p.read_text(encoding="utf-8")
-
-    required = [
-        "Issue-ID:",
-        "MP-ID:",
-        "Runbook:",
-        "Base-Commit:",
-        "Classification:",
-        "Compatibility:",
-        "## Evidence",
-        "## Commands run",
-    ]
-    missing = [x for x in required if x not in body]
+def check_pr_text(body: str, label: str) -> tuple[bool, str]:
+    """Validate one PR body's text; `label` names it in the success message."""
+    missing = [x for x in REQUIRED if x not in body]
     if missing:
         return False, f"missing required fields: {', '.join(missing)}"
 
-    banned = [
-        "#<issue-number>",
-        "<40-char-sha>",
-        "MP-<TRACK>-<X.Y.Z>",
-        "docs/runbooks/<name>.md#<anchor>",
-        "<one paragraph>",
-        "<what doc/policy changes and why>",
-        "<case 1>",
-        "# exact commands",
-    ]
-    unresolved = [x for x in banned if x in body]
+    unresolved = [x for x in BANNED if x in body]
     if unresolved:
         return False, f"unresolved placeholders: {', '.join(unresolved)}"
-    if re.search(r"^\s*-\s+\.\.\.\s*$", body, flags=re.MULTILINE):
+    if PLACEHOLDER_BULLET_RE.search(body):
         return False, "placeholder bullets ('- ...') are not allowed"
 
     issue = _extract(body, "Issue-ID")
-    if not re.fullmatch(r"#\d+|N/A", issue, flags=re.IGNORECASE):
+    if not ISSUE_RE.fullmatch(issue):
         return False, "Issue-ID must be #<number> or N/A"
 
     if issue.upper() == "N/A":
@@ -56,27 +69,27 @@ def check_pr_body(path: str) -> tuple[bool, str]:
             return False, "Issue-Reason required when Issue-ID is N/A"
 
     mp_id = _extract(body, "MP-ID")
-    if not re.fullmatch(r"MP-[A-Z0-9-]+-\d+\.\d+\.\d+|N/A", mp_id, flags=re.IGNORECASE):
+    if not MP_ID_RE.fullmatch(mp_id):
         return False, "MP-ID must be MP-<TRACK>-<X.Y.Z> or N/A"
 
     runbook = _extract(body, "Runbook")
-    if not re.fullmatch(r"docs/runbooks/.+\.md#.+|N/A", runbook, flags=re.IGNORECASE):
+    if not RUNBOOK_RE.fullmatch(runbook):
         return False, "Runbook must be docs/runbooks/<name>.md#<anchor> or N/A"
 
     base = _extract(body, "Base-Commit")
-    if not re.fullmatch(r"[0-9a-fA-F]{40}", base):
+    if not SHA_RE.fullmatch(base):
         return False, "Base-Commit must be 40-char SHA"
 
-    ev_match = re.search(r"## Evidence\s*([\s\S]*?)(?:\n##\s|$)", body, flags=re.IGNORECASE)
+    ev_match = EVIDENCE_RE.search(body)
     evidence = (ev_match.group(1) if ev_match else "").strip()
     if not evidence:
         return False, "Evidence section cannot be empty"
-    if re.search(r"\b(TODO|TBD|to be done|lorem ipsum)\b", evidence, flags=re.IGNORECASE):
+    if TODO_RE.search(evidence):
         return False, "Evidence section has placeholder/TODO text"
-    if not re.search(r"-\s+Positive:\s*[\s\S]*-\s+Negative:", evidence, flags=re.IGNORECASE):
+    if not POS_NEG_RE.search(evidence):
         return False, "Evidence must include Positive and Negative subsections"
 
-    cmd_match = re.search(r"## Commands run\s*[\s\S]*?```bash\s*([\s\S]*?)```", body, flags=re.IGNORECASE)
+    cmd_match = COMMANDS_RE.search(body)
     if not cmd_match:
         return False, "Commands run must include a bash fenced block"
     cmd_body = cmd_match.group(1)
@@ -84,4 +97,81 @@ def check_pr_body(path: str) -> tuple[bool, str]:
     if not runnable:
         return False, "Commands run must include at least one executable command"
 
-    return True, f"PR metadata valid ({path})"
+    return True, f"PR metadata valid ({label})"
+
+
+def check_pr_body(path: str) -> tuple[bool, str]:
+    p = Path(path)
+    if not p.exists():
+        return False, f"PR body file not found: {path}"
+    return check_pr_text(p.read_text(encoding="utf-8"), path)
+
+
+def _iter_jsonl(lines: Iterator[bytes], source: str) -> Iterator[dict[str, Any]]:
+    import json
+
+    for n, raw in enumerate(lines, 1):
+        if not raw.strip():
+            continue
+        entry: dict[str, Any] = {"id": f"{source}:{n}", "source": f"{source}:{n}"}
+        try:
+            line = raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            yield {**entry, "error": f"invalid UTF-8: {e}"}
+            continue
+        try:
+            obj = json.loads(line)
+        except ValueError as e:
+            yield {**entry, "error": f"invalid JSON: {e}"}
+            continue
+        if not isinstance(obj, dict) or not isinstance(obj.get("body"), str):
+            yield {**entry, "error": "record has no string `body`"}
+            continue
+        ident = next((obj[k] for k in ("number", "id", "url") if obj.get(k) not in (None, "")), None)
+        if ident is not None:
+            entry["id"] = str(ident)
+        if obj.get("title"):
+            entry["title"] = obj["title"]
+        yield {**entry, "body": obj["body"]}
+
+
+def iter_batch(source: str) -> Iterator[dict[str, Any]]:
+    """PR records from a directory of `*.md` bodies or a JSONL export (`-` for stdin).
+
+    JSONL records need a `body`; `number`, `id` or `url` (first present) names the PR,
+    e.g. `gh pr list --state all --json number,title,body --jq '.[]'`.
+    """
+    import sys
+
+    if source == "-":
+        yield from _iter_jsonl(iter(sys.stdin.buffer), "stdin")
+        return
+    root = Path(source)
+    if root.is_dir():
+        for p in sorted(root.rglob("*.md")):
+            rel = p.relative_to(root).as_posix()
+            yield {"id": rel, "source": str(p), "path": p}
+        return
+    with root.open("rb") as f:  # decoded per line: one bad line must not sink the batch
+        yield from _iter_jsonl(f, source)
+
+
+def _check_record(rec: dict[str, Any]) -> dict[str, Any]:
+    out = {k: rec[k] for k in ("id", "title", "source") if k in rec}
+    if "error" in rec:
+        return {**out, "ok": False, "message": rec["error"]}
+    try:
+        body = rec["body"] if "body" in rec else rec["path"].read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return {**out, "ok": False, "message": f"cannot read PR body: {e}"}
+    ok, msg = check_pr_text(body, str(rec["id"]))
+    return {**out, "ok": ok, "message": msg}
+
+
+def check_batch(source: str) -> list[dict[str, Any]]:
+    """Check every PR body of `source`; results keep the input order.
+
+    Runs serially: a check takes microseconds, so a process pool's pickling
+    and startup cost more than it saves, and threads are GIL-bound.
+    """
+    return [_check_record(r) for r in iter_batch(source)]
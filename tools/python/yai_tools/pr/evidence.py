@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from yai_tools._core.cache import cache_dir, cache_disabled
+from yai_tools._core.git import GitError, run_git
+
+# Evidence commands for `pr-body --run-evidence`. They run concurrently, each in
+# its own process group under a timeout, with stdout+stderr streamed to a log
+# file instead of buffered in memory, so wall time is the slowest command's.
+# Outcomes are cached per command and tree state (index tree, dirty worktree
+# files, submodule checkouts); an unchanged tree replays them without running.
+
+DEFAULT_TIMEOUT_S = 600.0
+TIMEOUT_RC = 124  # as timeout(1) reports it
+_KILL_GRACE_S = 5.0
+CACHE_SCHEMA = 2  # 2: logs stored per cache key
+
+
+@dataclass
+class EvidenceResult:
+    command: str
+    rc: int
+    duration_s: float
+    log: Path
+    timed_out: bool = False
+    skipped: bool = False  # yai-proof-check reported SKIP (private draft manifest)
+    output_digest: str = ""  # sha256 of the log
+    cached: bool = False
+
+    def log_text(self) -> str:
+        try:
+            return self.log.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return ""
+
+    @property
+    def timing(self) -> str:
+        return f"cached, {self.duration_s:.1f}s" if self.cached else f"{self.duration_s:.1f}s"
+
+
+def default_log_dir() -> Path:
+    return cache_dir("evidence", "logs")
+
+
+def _log_name(i: int, command: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "-", command).strip("-")[:60] or "command"
+    return f"{i:02d}-{slug}.log"
+
+
+def _stop(proc: subprocess.Popen[bytes]) -> None:
+    # the command runs under `sh -c`: signal the whole group, not just the shell
+    for sig, grace in ((signal.SIGTERM, _KILL_GRACE_S), (signal.SIGKILL, None)):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            return
+        try:
+            proc.wait(timeout=grace)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def run_command(command: str, cwd: str | Path, log: Path, timeout_s: float = DEFAULT_TIMEOUT_S) -> EvidenceResult:
+    log.parent.mkdir(parents=True, exist_ok=True)
+    t0 = time.perf_counter()
+    with log.open("wb") as out:
+        proc = subprocess.Popen(
+            command,
+            shell=True,
+            cwd=str(cwd),
+            stdin=subprocess.DEVNULL,
+            stdout=out,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        try:
+            rc = proc.wait(timeout=timeout_s)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            _stop(proc)
+            rc, timed_out = TIMEOUT_RC, True
+    res = EvidenceResult(command, rc, time.perf_counter() - t0, log, timed_out)
+    data = log.read_bytes()
+    res.output_digest = hashlib.sha256(data).hexdigest()
+    res.skipped = "yai-proof-check" in command and b"SKIP" in data
+    return res
+
+
+def tree_state(cwd: str | Path) -> str | None:
+    """Digest of what an evidence command sees, or None when it cannot be pinned down.
+
+    `git write-tree` covers the index (and the submodule pins it records); files
+    modified or untracked in the worktree and the checked-out submodule commits
+    are folded in, since commands read the worktree, not the index. The `.pr/`
+    workspace, where the generated body usually lands, is left out.
+    """
+    try:
+        tree = run_git(["write-tree"], cwd=cwd).strip()
+        status = run_git(
+            ["status", "--porcelain", "-z", "--untracked-files=all", "--ignore-submodules=all", "--", ".", ":!.pr"],
+            cwd=cwd,
+        )
+        submodules = run_git(["submodule", "status", "--recursive"], cwd=cwd)
+    except GitError:
+        return None  # not a checkout, or unmerged entries in the index
+    h = hashlib.sha256(f"{tree}\n{submodules}\n".encode("utf-8"))
+    recs = status.split("\0")
+    i = 0
+    while i < len(recs):
+        rec = recs[i]
+        i += 1
+        if len(rec) < 4:
+            continue
+        if rec[0] in "RC":
+            i += 1  # rename/copy source follows
+        h.update(rec.encode("utf-8") + b"\0")
+        p = Path(cwd) / rec[3:]
+        if p.is_file():
+            h.update(hashlib.sha256(p.read_bytes()).digest())
+    return h.hexdigest()
+
+
+def _cache_path(command: str, state: str) -> tuple[str, Path]:
+    key = hashlib.sha256(json.dumps([CACHE_SCHEMA, command, state]).encode("utf-8")).hexdigest()
+    return key, cache_dir("evidence", "results", key[:2], f"{key}.json")
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_cached(command: str, state: str) -> EvidenceResult | None:
+    """Stored outcome of `command` on `state`; a missing or altered log is a miss."""
+    key, path = _cache_path(command, state)
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if entry.get("schema") != CACHE_SCHEMA or entry.get("key") != key:
+        return None
+    r = entry["result"]
+    res = EvidenceResult(**{**r, "log": Path(r["log"]), "cached": True})
+    if _file_digest(res.log) != res.output_digest:
+        return None
+    return res
+
+
+def store_cached(res: EvidenceResult, state: str) -> None:
+    if res.timed_out:
+        return  # a timeout says nothing stable about the tree
+    key, path = _cache_path(res.command, state)
+    # keep the log beside the entry: the run's own log slot is reused by later runs
+    log = path.with_suffix(".log")
+    entry = {"schema": CACHE_SCHEMA, "key": key, "result": {**asdict(res), "log": str(log), "cached": False}}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(res.log, log)
+        path.write_text(json.dumps(entry, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    except OSError as e:
+        print(f"[evidence] WARN: cannot cache result of {res.command}: {e}", file=sys.stderr)
+
+
+def run_evidence(
+    commands: list[str],
+    cwd: str | Path,
+    timeout_s: float = DEFAULT_TIMEOUT_S,
+    log_dir: Path | None = None,
+    jobs: int = 0,
+    use_cache: bool = True,
+) -> list[EvidenceResult]:
+    """Run `commands` concurrently (`jobs` 0 = all at once); results keep the input order.
+
+    With `use_cache`, commands with a stored outcome for the current tree state
+    are not run; their results come back with `cached` set.
+    """
+    if not commands:
+        return []
+    log_dir = log_dir or default_log_dir()
+    state = tree_state(cwd) if use_cache and not cache_disabled() else None
+    results: list[EvidenceResult | None] = [load_cached(c, state) if state else None for c in commands]
+    todo = [i for i, r in enumerate(results) if r is None]
+    if todo:
+        with ThreadPoolExecutor(max_workers=jobs or len(todo)) as pool:
+            futures = {
+                i: pool.submit(run_command, commands[i], cwd, log_dir / _log_name(i, commands[i]), timeout_s) for i in todo
+            }
+            for i, fut in futures.items():
+                results[i] = fut.result()
+                if state:
+                    store_cached(fut.result(), state)
+    done = [r for r in results if r is not None]
+    for r in done:
+        outcome = f"timed out after {timeout_s:g}s" if r.timed_out else f"exit {r.rc}"
+        cached = ", cached" if r.cached else ""
+        print(f"[evidence] {r.command}: {outcome} in {r.duration_s:.1f}s{cached} (log: {r.log})", file=sys.stderr)
+    return done
+
+
+def positive_bullets(results: list[EvidenceResult]) -> list[str]:
+    return [
+        f"{r.command} exit code = 0 ({r.timing})"
+        for r in results
+        if r.rc == 0 and "yai-proof-check" not in r.command
+    ]
+
+
+def negative_bullets(results: list[EvidenceResult]) -> list[str]:
+    neg: list[str] = []
+    for r in results:
+        if r.skipped:
+            neg.append(f"{r.command} -> SKIP (private draft manifest)")
+        elif r.timed_out:
+            neg.append(f"{r.command} timed out after {r.duration_s:.1f}s")
+        elif r.rc != 0:
+            neg.append(f"{r.command} exit code = {r.rc} ({r.timing})")
+    return neg
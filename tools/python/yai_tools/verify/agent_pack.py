@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
 from typing import Any
 
+from yai_tools._core.paths import repo_root
 from yai_tools.verify.generated_sync import check_json_synced, write_json
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
 
-REPO_ROOT = Path(__file__).resolve().parents[4]
+REPO_ROOT = repo_root()
 OUT = REPO_ROOT / "docs" / "_generated" / "agent-pack.v1.json"
 
 
@@ -30,7 +31,11 @@ def build_pack() -> dict[str, Any]:
             "tools/bin/yai-docs-schema-check --changed --base <BASE_SHA> --head <HEAD_SHA>",
             "tools/bin/yai-docs-graph --check",
             "tools/bin/yai-agent-pack --check",
+            "tools/bin/yai-path-policy-check",
             "tools/bin/yai-docs-doctor --mode ci --base <BASE_SHA> --head <HEAD_SHA>",
+            "tools/bin/yai-perf-check",
+            "tools/bin/yai-tools perf import-budget",
+            "tools/bin/yai-tools perf memory --docs 1000",
             "tools/bin/yai-pr-body --template <template> ..."
         ],
         "quality_gates": [
@@ -38,7 +43,8 @@ def build_pack() -> dict[str, Any]:
             "validate-traceability",
             "validate-runbook-adr-links",
             "validate-agent-pack",
-            "validate-changelog"
+            "validate-changelog",
+            "validate-tooling-performance"
         ],
         "path_policy": {
             "relative_only": True,
@@ -53,20 +59,22 @@ def build_pack() -> dict[str, Any]:
     }
 
 
-def run_agent_pack(write: bool) -> int:
+def check_agent_pack(write: bool) -> GateResult:
     obj = build_pack()
+    result = GateResult(gate="agent-pack")
     if write:
         write_json(OUT, obj)
-        print("[agent-pack] OK: generated pack updated")
-        return 0
+        result.detail = "generated pack updated"
+        return result
 
     ok, msg = check_json_synced(OUT, obj)
     if not ok:
-        print(f"[agent-pack] FAIL: {msg}")
-        return 1
+        result.fail_detail(Finding(msg, "generated/drift", file=OUT.relative_to(REPO_ROOT).as_posix()))
+    return result
 
-    print("[agent-pack] OK")
-    return 0
+
+def run_agent_pack(write: bool, fmt: str = "text") -> int:
+    return run_gate("agent-pack", fmt, lambda: check_agent_pack(write))
 
 
 def main() -> int:
@@ -74,8 +82,9 @@ def main() -> int:
     mode = ap.add_mutually_exclusive_group(required=True)
     mode.add_argument("--write", action="store_true")
     mode.add_argument("--check", action="store_true")
+    add_format_arg(ap)
     args = ap.parse_args()
-    return run_agent_pack(write=args.write)
+    return run_agent_pack(write=args.write, fmt=args.format)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,19 @@ from __future__ import annotations
 import argparse
 import json
 import re
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from yai_tools._core import profile
+from yai_tools._core.git import diff_name_only
 from yai_tools._core.paths import repo_root
-from yai_tools.verify.generated_sync import check_json_synced, write_json
-from yai_tools.verify.traceability import parse_frontmatter
+from yai_tools.verify import gate_cache, report
+from yai_tools.verify.corpus import DocsCorpus, default_corpus
+from yai_tools.verify.generated_sync import check_json_synced, check_text_synced, write_json, write_text
+from yai_tools.verify.records import ComponentDoc, intern
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
 
 REPO_ROOT = repo_root()
 ARCH_DIR = REPO_ROOT / "docs" / "architecture"
@@ -33,13 +39,6 @@ REQUIRED_COMPONENT_SECTIONS = [
 ]
 
 
-def _run_git(args: list[str]) -> str:
-    proc = subprocess.run(["git", *args], cwd=str(REPO_ROOT), text=True, capture_output=True)
-    if proc.returncode != 0:
-        raise RuntimeError(proc.stderr.strip() or "git command failed")
-    return proc.stdout.strip()
-
-
 def _md_body(text: str) -> str:
     text = text.lstrip("\ufeff")
     if not text.startswith("---"):
@@ -97,17 +96,20 @@ def _extract_refs_by_prefix(text: str, prefixes: tuple[str, ...]) -> list[str]:
     return sorted(set(refs))
 
 
-def _topology_line(path: Path) -> str:
-    text = path.read_text(encoding="utf-8")
+def _topology_line(path: Path, corpus: DocsCorpus) -> str:
+    text = corpus.text(path)
     for line in text.splitlines():
         if line.strip().startswith("Canonical Topology:"):
             return re.sub(r"\s+", " ", line.strip())
     return ""
 
 
+def _rel(path: Path) -> str:
+    return path.relative_to(REPO_ROOT).as_posix()
+
+
 def _changed_paths(base: str, head: str) -> list[str]:
-    out = _run_git(["diff", "--name-only", f"{base}...{head}"])
-    return [x.strip() for x in out.splitlines() if x.strip()]
+    return diff_name_only(base, head, cwd=REPO_ROOT)
 
 
 def _mind_impl_present() -> bool:
@@ -121,36 +123,32 @@ def _mind_impl_present() -> bool:
     return False
 
 
-def _parse_component_doc(path: Path) -> dict[str, Any]:
-    rel = path.relative_to(REPO_ROOT).as_posix()
-    text = path.read_text(encoding="utf-8")
-    fm = parse_frontmatter(text)
+def _refs(text: str, prefix: str) -> list[str]:
+    return [intern(r) for r in _extract_refs_by_prefix(text, (prefix,))]
+
+
+def _parse_component_doc(path: Path, corpus: DocsCorpus) -> ComponentDoc:
+    rel = intern(path.relative_to(REPO_ROOT).as_posix())
+    text = corpus.text(path)
+    fm = corpus.frontmatter(path)
     body = _md_body(text)
     sections = _section_map(body)
 
     impl_status = sections.get("Current Implementation Status", "").strip().lower()
     traceability = sections.get("Traceability", "")
 
-    return {
-        "name": path.stem,
-        "path": rel,
-        "frontmatter": fm,
-        "sections": sections,
-        "impl_status": impl_status,
-        "adr_refs": _extract_refs_by_prefix(traceability, ("docs/design/adr/",)),
-        "runbook_refs": _extract_refs_by_prefix(traceability, ("docs/runbooks/",)),
-        "mp_refs": _extract_refs_by_prefix(traceability, ("docs/milestone-packs/",)),
-        "l0_refs": _extract_refs_by_prefix(traceability, ("deps/yai-law/",)),
-    }
-
-
-def _check_text_synced(path: Path, expected: str) -> tuple[bool, str]:
-    if not path.exists():
-        return False, f"missing generated file: {path.as_posix()}"
-    current = path.read_text(encoding="utf-8")
-    if current != expected:
-        return False, f"stale generated file: {path.as_posix()} (run --write to refresh)"
-    return True, "ok"
+    return ComponentDoc(
+        name=path.stem,
+        path=rel,
+        frontmatter=fm,
+        impl_status=intern(impl_status),
+        sections=frozenset(k for k, v in sections.items() if v.strip()),
+        interfaces=sections.get("Interfaces and Entry Points", ""),
+        adr_refs=_refs(traceability, "docs/design/adr/"),
+        runbook_refs=_refs(traceability, "docs/runbooks/"),
+        mp_refs=_refs(traceability, "docs/milestone-packs/"),
+        l0_refs=_refs(traceability, "deps/yai-law/"),
+    )
 
 
 def _display_name(component_name: str) -> str:
@@ -259,7 +257,108 @@ def _validate_schema_like(obj: dict[str, Any], errors: list[str]) -> None:
             errors.append(f"generated alignment component status invalid: {c.get('status')}")
 
 
-def build_alignment_snapshot() -> tuple[dict[str, Any], str, list[str]]:
+@dataclass
+class ComponentResult:
+    name: str
+    path: str
+    entry: dict[str, Any]
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _validate_component(path: Path, corpus: DocsCorpus) -> ComponentResult:
+    doc = _parse_component_doc(path, corpus)
+    fm = doc.frontmatter
+    errors: list[str] = []
+
+    for key in REQUIRED_FRONTMATTER_KEYS:
+        if key not in fm or fm[key] in (None, "", []):
+            errors.append(f"missing required frontmatter key `{key}`")
+
+    law_refs = fm.get("law_refs", [])
+    if not isinstance(law_refs, list) or not law_refs:
+        errors.append("frontmatter `law_refs` must be non-empty list")
+    else:
+        for ref in law_refs:
+            if not isinstance(ref, str):
+                errors.append("non-string law_ref")
+                continue
+            if _is_absolute_ref(ref):
+                errors.append(f"absolute path not allowed in law_refs: {ref}")
+            elif not _path_exists(ref):
+                errors.append(f"law_ref path not found: {ref}")
+
+    for req in REQUIRED_COMPONENT_SECTIONS:
+        if req not in doc.sections:
+            errors.append(f"missing required section `## {req}`")
+
+    impl_status = doc.impl_status
+    if impl_status not in ALLOWED_COMPONENT_STATUS:
+        errors.append(f"invalid implementation status `{impl_status}`")
+
+    if path.stem == "mind" and impl_status == "implemented" and not _mind_impl_present():
+        errors.append("claims implemented but local `mind` implementation is absent")
+
+    trace_refs = doc.adr_refs + doc.runbook_refs + doc.mp_refs + doc.l0_refs
+    for ref in trace_refs:
+        if _is_absolute_ref(ref):
+            errors.append(f"absolute path not allowed: {ref}")
+        elif not _path_exists(ref):
+            errors.append(f"traceability path not found: {ref}")
+
+    # validate interface entry paths when they look like repo paths
+    for token in _extract_backtick_refs(doc.interfaces):
+        ref = _normalize_ref(token)
+        if not ref or ref.startswith("~"):
+            continue
+        if "/" not in ref:
+            continue
+        if _is_absolute_ref(ref):
+            errors.append(f"absolute path not allowed in interfaces: {ref}")
+            continue
+        # only enforce existence for obvious repo-file patterns
+        if any(ref.endswith(sfx) for sfx in [".md", ".c", ".h", ".rs", ".json", ".sh"]) or "*" in ref:
+            if not _path_exists(ref):
+                errors.append(f"interface path not found: {ref}")
+
+    entry = {
+        "name": path.stem,
+        "path": doc.path,
+        "status": impl_status,
+        "adr_refs": doc.adr_refs,
+        "runbook_refs": doc.runbook_refs,
+        "mp_refs": doc.mp_refs,
+        "l0_refs": doc.l0_refs,
+    }
+    return ComponentResult(name=path.stem, path=doc.path, entry=entry, errors=sorted(set(errors)))
+
+
+def validate_components(
+    paths: list[Path],
+    max_workers: int | None = None,
+    corpus: DocsCorpus | None = None,
+) -> list[ComponentResult]:
+    """Validate component docs concurrently; results keep the order of `paths`."""
+    corpus = corpus or default_corpus()
+
+    def _one(p: Path) -> ComponentResult:
+        with profile.span("component", "validate", path=p.name):
+            return _validate_component(p, corpus)
+
+    if len(paths) <= 1 or max_workers == 1:
+        return [_one(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_one, paths))
+
+
+def build_alignment_snapshot(
+    max_workers: int | None = None,
+    corpus: DocsCorpus | None = None,
+) -> tuple[dict[str, Any], str, list[str], list[ComponentResult]]:
+    corpus = corpus or default_corpus()
     errors: list[str] = []
 
     if not SCHEMA_PATH.exists():
@@ -270,86 +369,19 @@ def build_alignment_snapshot() -> tuple[dict[str, Any], str, list[str]]:
         except json.JSONDecodeError as exc:
             errors.append(f"invalid schema JSON: {exc}")
 
-    component_paths = sorted(COMPONENTS_DIR.glob("*.md"))
+    component_paths = corpus.glob(COMPONENTS_DIR)
     if not component_paths:
         errors.append("no component docs found under docs/architecture/components")
 
-    overview_topology = _topology_line(OVERVIEW_DOC)
-    runtime_topology = _topology_line(RUNTIME_MODEL_DOC)
+    overview_topology = _topology_line(OVERVIEW_DOC, corpus)
+    runtime_topology = _topology_line(RUNTIME_MODEL_DOC, corpus)
     if not overview_topology or not runtime_topology:
         errors.append("missing Canonical Topology line in overview.md or runtime-model.md")
     elif overview_topology != runtime_topology:
         errors.append("overview.md and runtime-model.md disagree on Canonical Topology")
 
-    component_entries: list[dict[str, Any]] = []
-    for path in component_paths:
-        doc = _parse_component_doc(path)
-        rel = doc["path"]
-        fm = doc["frontmatter"]
-        sections = doc["sections"]
-
-        for key in REQUIRED_FRONTMATTER_KEYS:
-            if key not in fm or fm[key] in (None, "", []):
-                errors.append(f"{rel}: missing required frontmatter key `{key}`")
-
-        law_refs = fm.get("law_refs", [])
-        if not isinstance(law_refs, list) or not law_refs:
-            errors.append(f"{rel}: frontmatter `law_refs` must be non-empty list")
-        else:
-            for ref in law_refs:
-                if not isinstance(ref, str):
-                    errors.append(f"{rel}: non-string law_ref")
-                    continue
-                if _is_absolute_ref(ref):
-                    errors.append(f"{rel}: absolute path not allowed in law_refs: {ref}")
-                elif not _path_exists(ref):
-                    errors.append(f"{rel}: law_ref path not found: {ref}")
-
-        for req in REQUIRED_COMPONENT_SECTIONS:
-            if req not in sections or not sections[req].strip():
-                errors.append(f"{rel}: missing required section `## {req}`")
-
-        impl_status = doc["impl_status"]
-        if impl_status not in ALLOWED_COMPONENT_STATUS:
-            errors.append(f"{rel}: invalid implementation status `{impl_status}`")
-
-        if path.stem == "mind" and impl_status == "implemented" and not _mind_impl_present():
-            errors.append(f"{rel}: claims implemented but local `mind` implementation is absent")
-
-        trace_refs = doc["adr_refs"] + doc["runbook_refs"] + doc["mp_refs"] + doc["l0_refs"]
-        for ref in trace_refs:
-            if _is_absolute_ref(ref):
-                errors.append(f"{rel}: absolute path not allowed: {ref}")
-            elif not _path_exists(ref):
-                errors.append(f"{rel}: traceability path not found: {ref}")
-
-        # validate interface entry paths when they look like repo paths
-        interfaces = sections.get("Interfaces and Entry Points", "")
-        for token in _extract_backtick_refs(interfaces):
-            ref = _normalize_ref(token)
-            if not ref or ref.startswith("~"):
-                continue
-            if "/" not in ref:
-                continue
-            if _is_absolute_ref(ref):
-                errors.append(f"{rel}: absolute path not allowed in interfaces: {ref}")
-                continue
-            # only enforce existence for obvious repo-file patterns
-            if any(ref.endswith(sfx) for sfx in [".md", ".c", ".h", ".rs", ".json", ".sh"]) or "*" in ref:
-                if not _path_exists(ref):
-                    errors.append(f"{rel}: interface path not found: {ref}")
-
-        component_entries.append(
-            {
-                "name": path.stem,
-                "path": rel,
-                "status": impl_status,
-                "adr_refs": doc["adr_refs"],
-                "runbook_refs": doc["runbook_refs"],
-                "mp_refs": doc["mp_refs"],
-                "l0_refs": doc["l0_refs"],
-            }
-        )
+    components = validate_components(component_paths, max_workers=max_workers, corpus=corpus)
+    component_entries = [c.entry for c in components]
 
     trace_rows = _rows_from_components(component_entries)
     for row in trace_rows:
@@ -369,9 +401,9 @@ def build_alignment_snapshot() -> tuple[dict[str, Any], str, list[str]]:
     traceability_md = _render_traceability_md(trace_rows)
 
     # global path checks for architecture docs
-    for md_path in sorted(ARCH_DIR.rglob("*.md")):
+    for md_path in corpus.rglob(ARCH_DIR):
         rel = md_path.relative_to(REPO_ROOT).as_posix()
-        txt = md_path.read_text(encoding="utf-8")
+        txt = corpus.text(md_path)
 
         for bt in _extract_backtick_refs(txt):
             ref = _normalize_ref(bt)
@@ -393,49 +425,80 @@ def build_alignment_snapshot() -> tuple[dict[str, Any], str, list[str]]:
         "traceability_rows": trace_rows,
     }
     _validate_schema_like(snapshot, errors)
-    return snapshot, traceability_md, sorted(set(errors))
+    return snapshot, traceability_md, sorted(set(errors)), components
 
 
-def run_architecture_alignment(mode: str, base: str, head: str, write: bool) -> int:
-    if not ARCH_DIR.exists():
-        print("[architecture-check] SKIP: docs/architecture not present in this repo layout")
-        return 0
+_PATH_PREFIX_RE = re.compile(r"^([\w./-]+\.md): (.+)$")
 
-    if mode == "changed" and not base:
-        print("[architecture-check] ERROR: --changed requires --base <sha>")
-        return 2
 
-    if mode == "changed":
-        # keep interface parity and basic signal in logs; check remains full to prevent drift.
-        changed = _changed_paths(base=base, head=head)
-        print(f"[architecture-check] changed files: {len(changed)}")
+def _report_failures(result: GateResult, errors: list[str], components: list[ComponentResult]) -> None:
+    for err in errors:
+        m = _PATH_PREFIX_RE.match(err)
+        result.report(Finding(err, "architecture/alignment", file=m.group(1) if m else ""), text=f"- {err}")
+    for comp in components:
+        if comp.ok:
+            continue
+        result.note(f"- {comp.path}")
+        for err in comp.errors:
+            result.report(Finding(err, "architecture/component", file=comp.path), text=f"  - {err}")
 
-    snapshot, traceability_md, errors = build_alignment_snapshot()
 
-    if errors:
-        print("[architecture-check] FAIL:")
-        for err in errors:
-            print(f"- {err}")
-        return 1
+def check_alignment(write: bool, jobs: int | None = None) -> GateResult:
+    result = GateResult(gate="architecture-check")
+    snapshot, traceability_md, errors, components = build_alignment_snapshot(max_workers=jobs)
+
+    if errors or not all(c.ok for c in components):
+        _report_failures(result, errors, components)
+        return result
 
     if write:
         write_json(GENERATED_ALIGNMENT, snapshot)
-        TRACEABILITY_DOC.write_text(traceability_md, encoding="utf-8")
-        print("[architecture-check] OK: generated alignment snapshot and traceability doc updated")
-        return 0
+        write_text(TRACEABILITY_DOC, traceability_md)
+        result.detail = "generated alignment snapshot and traceability doc updated"
+        return result
 
     ok, msg = check_json_synced(GENERATED_ALIGNMENT, snapshot)
-    ok_trace, msg_trace = _check_text_synced(TRACEABILITY_DOC, traceability_md)
-    if not ok or not ok_trace:
-        print("[architecture-check] FAIL:")
-        if not ok:
-            print(f"- {msg}")
-        if not ok_trace:
-            print(f"- {msg_trace}")
-        return 1
+    ok_trace, msg_trace = check_text_synced(TRACEABILITY_DOC, traceability_md)
+    if not ok:
+        result.fail(f"- {msg}", rule="generated/drift", file=_rel(GENERATED_ALIGNMENT))
+    if not ok_trace:
+        result.fail(f"- {msg_trace}", rule="generated/drift", file=_rel(TRACEABILITY_DOC))
+    return result
+
+
+def _architecture_gate(mode: str, base: str, head: str, write: bool, jobs: int | None, use_cache: bool) -> GateResult:
+    if not ARCH_DIR.exists():
+        return GateResult(gate="architecture-check", status="SKIP", detail="docs/architecture not present in this repo layout")
 
-    print("[architecture-check] OK")
-    return 0
+    if mode == "changed" and not base:
+        return GateResult(gate="architecture-check", rc=2, status="ERROR", detail="--changed requires --base <sha>")
+
+    if mode == "changed" and not report.streaming():
+        # keep interface parity and basic signal in logs; check remains full to prevent drift.
+        changed = _changed_paths(base=base, head=head)
+        print(f"[architecture-check] changed files: {len(changed)}")
+
+    # the check is always full, so base/head do not enter the key; interface and
+    # implementation paths may point anywhere, so the whole tree is its input
+    key = gate_cache.gate_key("architecture-check", (".",)) if use_cache and not write else None
+    return gate_cache.cached_result("architecture-check", key, lambda: check_alignment(write, jobs))
+
+
+def run_architecture_alignment(
+    mode: str,
+    base: str,
+    head: str,
+    write: bool,
+    jobs: int | None = None,
+    use_cache: bool = True,
+    fmt: str = "text",
+) -> int:
+    return run_gate(
+        "architecture-check",
+        fmt,
+        lambda: _architecture_gate(mode, base, head, write, jobs, use_cache),
+        tool="yai-architecture-check",
+    )
 
 
 def main() -> int:
@@ -446,13 +509,24 @@ def main() -> int:
     mode.add_argument("--write", action="store_true")
     ap.add_argument("--base", default="")
     ap.add_argument("--head", default="HEAD")
+    ap.add_argument("--jobs", type=int, default=None, help="component validation workers (default: auto)")
+    ap.add_argument("--no-cache", action="store_true", help="always run the check, ignoring the gate result cache")
+    add_format_arg(ap)
     args = ap.parse_args()
 
     run_mode = "all"
     if args.changed:
         run_mode = "changed"
 
-    return run_architecture_alignment(mode=run_mode, base=args.base, head=args.head, write=args.write)
+    return run_architecture_alignment(
+        mode=run_mode,
+        base=args.base,
+        head=args.head,
+        write=args.write,
+        jobs=None if args.jobs is None else max(1, args.jobs),
+        use_cache=gate_cache.enabled(args.no_cache),
+        fmt=args.format,
+    )
 
 
 if __name__ == "__main__":
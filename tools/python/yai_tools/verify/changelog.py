@@ -3,11 +3,16 @@ from __future__ import annotations
 
 import argparse
 import re
-import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
-REPO_ROOT = Path(__file__).resolve().parents[4]
+from yai_tools._core.git import DiffScan, GitError, diff_scan, log_scan, read_blob, run_git
+from yai_tools._core.paths import repo_root
+from yai_tools.verify import gate_cache
+from yai_tools.verify.changelog_index import Section, index_for, section_text
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
+
+REPO_ROOT = repo_root()
 ALLOWED_KAC_SECTIONS = {"Added", "Changed", "Deprecated", "Removed", "Fixed", "Security"}
 PLACEHOLDER_RE = re.compile(r"\b(TODO|TBD|lorem ipsum|to be done)\b|<[^>]+>|\.\.\.", re.IGNORECASE)
 VAGUE_BULLET_RE = re.compile(r"^\s*-\s*(update stuff|misc)\s*$", re.IGNORECASE)
@@ -24,26 +29,33 @@ META_FILES = {
 
 
 def run(cmd: List[str]) -> str:
-    p = subprocess.run(cmd, cwd=REPO_ROOT, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if p.returncode != 0:
-        raise SystemExit(f"[changelog] ERROR: command failed: {' '.join(cmd)}\n{p.stderr.strip()}")
-    return p.stdout
+    if cmd[:1] != ["git"]:
+        raise ValueError("changelog.run only executes git commands")
+    try:
+        return run_git(cmd[1:], cwd=REPO_ROOT)
+    except GitError as e:
+        raise SystemExit(f"[changelog] ERROR: command failed: {' '.join(cmd)}\n{e.stderr}")
 
 
 def read_at_ref(ref: str, path: str) -> Optional[str]:
-    p = subprocess.run(["git", "show", f"{ref}:{path}"], cwd=REPO_ROOT, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if p.returncode != 0:
-        return None
-    return p.stdout
+    # served by the persistent `git cat-file --batch` reader, not a `git show` per lookup
+    return read_blob(ref, path, cwd=REPO_ROOT)
 
 
 def read_file(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def scan_diff(base: str, head: str, paths: Tuple[str, ...] = ("CHANGELOG.md",)) -> DiffScan:
+    """Changed files and the added lines of `paths`, from one streamed `git diff`."""
+    try:
+        return diff_scan(base, head, paths, cwd=REPO_ROOT)
+    except GitError as e:
+        raise SystemExit(f"[changelog] ERROR: command failed: git {' '.join(e.git_args)}\n{e.stderr}")
+
+
 def changed_files(base: str, head: str) -> List[str]:
-    out = run(["git", "diff", "--name-only", f"{base}...{head}"])
-    return [x.strip() for x in out.splitlines() if x.strip()]
+    return list(scan_diff(base, head).names)
 
 
 def is_meta_docs_only(files: List[str]) -> bool:
@@ -58,23 +70,15 @@ def is_meta_docs_only(files: List[str]) -> bool:
     return True
 
 
+def find_section(md: str, section_name: str) -> Tuple[Optional[Section], str]:
+    """(indexed section or None, its block text); the file is indexed once per content."""
+    data = md.encode("utf-8")
+    sec = index_for(data).get(section_name)
+    return sec, section_text(data, sec) if sec is not None else ""
+
+
 def extract_section_block(md: str, section_name: str) -> str:
-    lines = md.splitlines()
-    start = None
-    section_re = re.compile(rf"^##\s*\[{re.escape(section_name)}\](?:\s*-\s*\d{{4}}-\d{{2}}-\d{{2}})?\s*$", re.IGNORECASE)
-    any_section_re = re.compile(r"^##\s*\[[^\]]+\]")
-    for i, line in enumerate(lines):
-        if section_re.match(line.strip()):
-            start = i + 1
-            break
-    if start is None:
-        return ""
-    end = len(lines)
-    for j in range(start, len(lines)):
-        if any_section_re.match(lines[j].strip()):
-            end = j
-            break
-    return "\n".join(lines[start:end]).strip("\n")
+    return find_section(md, section_name)[1]
 
 
 def parse_kac_subsections(block: str) -> Dict[str, List[str]]:
@@ -92,15 +96,8 @@ def parse_kac_subsections(block: str) -> Dict[str, List[str]]:
     return data
 
 
-def added_lines(base: str, head: str, path: str) -> List[str]:
-    diff = run(["git", "diff", "--unified=0", f"{base}...{head}", "--", path])
-    out: List[str] = []
-    for ln in diff.splitlines():
-        if ln.startswith("+++") or ln.startswith("@@"):
-            continue
-        if ln.startswith("+"):
-            out.append(ln[1:])
-    return out
+def added_lines(base: str, head: str, path: str = "CHANGELOG.md") -> List[str]:
+    return list(scan_diff(base, head, (path,)).added[path])
 
 
 def is_real_bullet(line: str) -> bool:
@@ -113,52 +110,68 @@ def is_real_bullet(line: str) -> bool:
     return True
 
 
-def validate_added_content(lines: List[str]) -> List[str]:
-    errs: List[str] = []
-    for ln in lines:
+def validate_added_content(lines: List[str], line_nos: Sequence[int] = ()) -> List[Tuple[str, int]]:
+    """(message, CHANGELOG.md line or 0) per problem in the added `lines`."""
+    errs: List[Tuple[str, int]] = []
+    for i, ln in enumerate(lines):
         s = ln.strip()
         if not s:
             continue
+        at = line_nos[i] if i < len(line_nos) else 0
         if s.startswith("### "):
             sec = s[4:].strip()
             if sec not in ALLOWED_KAC_SECTIONS:
-                errs.append(f"invalid subsection heading introduced: {sec}")
+                errs.append((f"invalid subsection heading introduced: {sec}", at))
         if PLACEHOLDER_RE.search(s):
-            errs.append(f"placeholder text introduced: {s}")
+            errs.append((f"placeholder text introduced: {s}", at))
         if VAGUE_BULLET_RE.match(s):
-            errs.append(f"vague bullet introduced: {s}")
+            errs.append((f"vague bullet introduced: {s}", at))
     return errs
 
 
-def validate_pr_mode(base: str, head: str, changelog_path: Path) -> int:
-    files = changed_files(base, head)
+def _reject(result: GateResult, msg: str, rule: str, file: str = "CHANGELOG.md") -> GateResult:
+    result.fail_detail(Finding(msg, f"changelog/{rule}", file=file))
+    return result
+
+
+def check_change(
+    files: List[str],
+    added: Tuple[str, ...],
+    read_now: Callable[[], str],
+    read_old: Callable[[], str],
+    what: str = "PR",
+    added_at: Tuple[int, ...] = (),
+) -> Tuple[str, Optional[Tuple[str, str]], List[Tuple[str, int]]]:
+    """PR rules for one change: (pass detail, first blocking (rule, message) or None, added-content errors).
+
+    `read_now`/`read_old` give the changelog after and before the change; they are
+    only called when the change touches CHANGELOG.md. `added_at` holds the line
+    of each `added` line, which the added-content errors carry.
+    """
     only_meta = is_meta_docs_only(files)
     changed_changelog = "CHANGELOG.md" in files
 
     if not only_meta and not changed_changelog:
-        print("[changelog] FAIL: non meta/docs-only PR must update CHANGELOG.md")
-        return 1
+        return "", ("missing-update", f"non meta/docs-only {what} must update CHANGELOG.md"), []
 
     if not changed_changelog:
-        print("[changelog] OK: meta/docs-only PR without changelog update")
-        return 0
+        return f"meta/docs-only {what} without changelog update", None, []
 
-    current = read_file(changelog_path)
-    old = read_at_ref(base, "CHANGELOG.md") or ""
+    current = read_now()
+    old = read_old()
 
-    unreleased_now = extract_section_block(current, "Unreleased")
-    if not unreleased_now:
-        print("[changelog] FAIL: missing section ## [Unreleased]")
-        return 1
+    sec_now, unreleased_now = find_section(current, "Unreleased")
+    if sec_now is None or not unreleased_now:
+        return "", ("unreleased-section", "missing section ## [Unreleased]"), []
 
-    unreleased_old = extract_section_block(old, "Unreleased") if old else ""
-    parsed_now = parse_kac_subsections(unreleased_now)
-    parsed_old = parse_kac_subsections(unreleased_old)
+    sec_old = find_section(old, "Unreleased")[0] if old else None
+    parsed_now = sec_now.subsections
+    parsed_old = sec_old.subsections if sec_old is not None else {}
 
     bad_sections = [k for k in parsed_now.keys() if k not in ALLOWED_KAC_SECTIONS]
     if bad_sections:
-        print("[changelog] FAIL: invalid Keep a Changelog subsections in Unreleased: " + ", ".join(sorted(bad_sections)))
-        return 1
+        msg = "invalid Keep a Changelog subsections in Unreleased: " + ", ".join(sorted(bad_sections))
+        return "", ("subsection", msg), []
 
     now_bullets: Set[str] = set()
     old_bullets: Set[str] = set()
@@ -169,88 +182,152 @@ def validate_pr_mode(base: str, head: str, changelog_path: Path) -> int:
 
     new_bullets = [b for b in now_bullets if b not in old_bullets and is_real_bullet(b)]
     if not new_bullets:
-        print("[changelog] FAIL: changelog changed but no new real bullet in Unreleased")
-        return 1
-
-    added = added_lines(base, head, "CHANGELOG.md")
-    errs = validate_added_content(added)
-    if errs:
-        print("[changelog] FAIL:")
-        for e in errs:
-            print(f"- {e}")
-        return 1
-
-    print("[changelog] OK: PR changelog validation passed")
-    return 0
-
-
-def validate_tag_mode(version: str, changelog_path: Path, version_path: Path) -> int:
+        return "", ("no-new-bullet", "changelog changed but no new real bullet in Unreleased"), []
+
+    return f"{what} changelog validation passed", None, validate_added_content(list(added), added_at)
+
+
+def validate_pr_mode(base: str, head: str, changelog_path: Path) -> GateResult:
+    result = GateResult(gate="changelog")
+    scan = scan_diff(base, head)
+    detail, blocking, errs = check_change(
+        list(scan.names),
+        scan.added["CHANGELOG.md"],
+        lambda: read_file(changelog_path),
+        lambda: read_at_ref(base, "CHANGELOG.md") or "",
+        added_at=scan.added_at["CHANGELOG.md"],
+    )
+    if blocking is not None:
+        return _reject(result, blocking[1], blocking[0])
+    for e, line in errs:
+        result.report(Finding(e, "changelog/added-content", file="CHANGELOG.md", line=line), text=f"- {e}")
+    if result.ok:
+        result.detail = detail
+    return result
+
+
+def validate_range_mode(base: str, head: str) -> GateResult:
+    """PR rules applied to every non-merge commit of `base..head` against its parent.
+
+    One streamed `git log` supplies every commit's paths and added CHANGELOG.md
+    lines; changelog contents come from the cat-file batch reader.
+    """
+    result = GateResult(gate="changelog")
+    try:
+        commits = log_scan(base, head, ("CHANGELOG.md",), cwd=REPO_ROOT)
+    except GitError as e:
+        raise SystemExit(f"[changelog] ERROR: command failed: git {' '.join(e.git_args)}\n{e.stderr}")
+
+    for c in commits:
+        _, blocking, errs = check_change(
+            list(c.diff.names),
+            c.diff.added["CHANGELOG.md"],
+            lambda: read_at_ref(c.sha, "CHANGELOG.md") or "",
+            lambda: (read_at_ref(c.parent, "CHANGELOG.md") or "") if c.parent else "",
+            what="commit",
+            added_at=c.diff.added_at["CHANGELOG.md"],
+        )
+        label = f"{c.sha[:12]} {c.subject}"
+        # added-content lines refer to CHANGELOG.md as of that commit
+        violations = [(*blocking, 0)] if blocking is not None else [("added-content", e, n) for e, n in errs]
+        for rule, msg, line in violations:
+            finding = Finding(f"{label}: {msg}", f"changelog/{rule}", file="CHANGELOG.md", line=line)
+            result.report(finding, text=f"- {label}: {msg}")
+    if result.ok:
+        result.detail = f"{len(commits)} commit(s) in {base}..{head} passed changelog validation"
+    return result
+
+
+def validate_tag_mode(version: str, changelog_path: Path, version_path: Path) -> GateResult:
+    result = GateResult(gate="changelog")
     v_file = read_file(version_path).strip()
     if v_file != version:
-        print(f"[changelog] FAIL: VERSION ({v_file}) != tag version ({version})")
-        return 1
+        return _reject(result, f"VERSION ({v_file}) != tag version ({version})", "version-mismatch", file="VERSION")
 
     md = read_file(changelog_path)
-    rel_block = extract_section_block(md, version)
-    if not rel_block:
-        print(f"[changelog] FAIL: missing section ## [{version}] - YYYY-MM-DD")
-        return 1
+    sec, rel_block = find_section(md, version)
+    if sec is None or not rel_block:
+        return _reject(result, f"missing section ## [{version}] - YYYY-MM-DD", "release-section")
 
-    parsed = parse_kac_subsections(rel_block)
+    parsed = sec.subsections
     if not parsed:
-        print(f"[changelog] FAIL: release section [{version}] has no Keep a Changelog subsections")
-        return 1
+        return _reject(result, f"release section [{version}] has no Keep a Changelog subsections", "subsection")
 
     bad_sections = [k for k in parsed.keys() if k not in ALLOWED_KAC_SECTIONS]
     if bad_sections:
-        print("[changelog] FAIL: invalid subsection(s): " + ", ".join(sorted(bad_sections)))
-        return 1
+        return _reject(result, "invalid subsection(s): " + ", ".join(sorted(bad_sections)), "subsection")
 
     bullets = [b for _, vals in parsed.items() for b in vals]
     real_bullets = [b for b in bullets if is_real_bullet(b)]
     if not real_bullets:
-        print(f"[changelog] FAIL: release section [{version}] has no real bullets")
-        return 1
+        return _reject(result, f"release section [{version}] has no real bullets", "no-real-bullet")
 
     for ln in rel_block.splitlines():
         if PLACEHOLDER_RE.search(ln) or VAGUE_BULLET_RE.match(ln):
-            print(f"[changelog] FAIL: placeholder/vague content in [{version}] section: {ln.strip()}")
-            return 1
-
-    print(f"[changelog] OK: tag changelog validation passed for {version}")
-    return 0
-
-
-def main() -> int:
+            msg = f"placeholder/vague content in [{version}] section: {ln.strip()}"
+            return _reject(result, msg, "placeholder")
+
+    result.detail = f"tag changelog validation passed for {version}"
+    return result
+
+
+def _cache_key(args: argparse.Namespace, changelog_path: Path, version_path: Path) -> str | None:
+    inputs = [changelog_path.relative_to(REPO_ROOT).as_posix()]
+    if args.pr or args.range:
+        # the diff is fully determined by the resolved commits; PR mode reads CHANGELOG.md from the worktree
+        revs = gate_cache.resolve_revs(args.base, args.head)
+        if revs is None:
+            return None
+        params = {"mode": "pr" if args.pr else "range", "revs": revs}
+        if args.range:
+            inputs = []  # every changelog version comes from the commits themselves
+    else:
+        inputs.append(version_path.relative_to(REPO_ROOT).as_posix())
+        params = {"mode": "tag", "version": args.version}
+    return gate_cache.gate_key("changelog", inputs, params)
+
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(prog="yai-changelog-check")
     mode = ap.add_mutually_exclusive_group(required=True)
     mode.add_argument("--pr", action="store_true", help="validate PR-mode changelog rules")
     mode.add_argument("--tag", action="store_true", help="validate tag-mode release rules")
+    mode.add_argument("--range", action="store_true", help="validate PR rules on every commit of base..head")
 
-    ap.add_argument("--base", default="", help="base sha for PR mode")
-    ap.add_argument("--head", default="HEAD", help="head sha for PR mode")
+    ap.add_argument("--base", default="", help="base sha for PR/range mode")
+    ap.add_argument("--head", default="HEAD", help="head sha for PR/range mode")
     ap.add_argument("--version", default="", help="version X.Y.Z for tag mode")
     ap.add_argument("--file", default="CHANGELOG.md", help="changelog file path")
     ap.add_argument("--version-file", default="VERSION", help="version file path")
-    args = ap.parse_args()
+    ap.add_argument("--no-cache", action="store_true", help="always validate, ignoring the gate result cache")
+    add_format_arg(ap)
+    args = ap.parse_args(argv)
 
     changelog_path = REPO_ROOT / args.file
     version_path = REPO_ROOT / args.version_file
 
+    if (args.pr or args.range) and not args.base:
+        print(f"[changelog] ERROR: {'--pr' if args.pr else '--range'} requires --base <sha>")
+        return 2
+    if args.tag and not args.version:
+        print("[changelog] ERROR: --tag requires --version X.Y.Z")
+        return 2
+
     if args.pr:
-        if not args.base:
-            print("[changelog] ERROR: --pr requires --base <sha>")
-            return 2
-        return validate_pr_mode(args.base, args.head, changelog_path)
+        check = lambda: validate_pr_mode(args.base, args.head, changelog_path)
+    elif args.range:
+        check = lambda: validate_range_mode(args.base, args.head)
+    else:
+        check = lambda: validate_tag_mode(args.version, changelog_path, version_path)
 
-    if args.tag:
-        if not args.version:
-            print("[changelog] ERROR: --tag requires --version X.Y.Z")
-            return 2
-        return validate_tag_mode(args.version, changelog_path, version_path)
+    def _gate() -> GateResult:
+        key = _cache_key(args, changelog_path, version_path) if gate_cache.enabled(args.no_cache) else None
+        return gate_cache.cached_result("changelog", key, check)
 
-    return 2
+    return run_gate("changelog", args.format, _gate, tool="yai-changelog-check", inputs=("CHANGELOG.md",))
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from yai_tools._core.profile import run_main
+
+    raise SystemExit(run_main(main, "changelog-check"))
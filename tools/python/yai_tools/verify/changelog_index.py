@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from yai_tools._core.cache import cache_dir, cache_disabled
+from yai_tools.verify.gate_cache import blob_oid
+from yai_tools.verify.generated_sync import write_json
+
+# One-pass index of a Keep a Changelog file: every `## [name]` section with its
+# byte range, date, `###` subsections and bullets. Lookups and exports slice the
+# text by range instead of rescanning it per version. An index depends only on
+# the file content, so it is memoized and stored in the tool cache by blob OID.
+
+INDEX_SCHEMA = 1
+
+# any `## [...]` line ends the previous section; only the full form opens an addressable one
+BOUNDARY_RE = re.compile(r"^##\s*\[[^\]]+\]")
+SECTION_RE = re.compile(r"^##\s*\[([^\]]+)\](?:\s*-\s*(\d{4}-\d{2}-\d{2}))?\s*$")
+SUBSECTION_RE = re.compile(r"^###\s+(.+?)\s*$")
+BULLET_RE = re.compile(r"^\s*-\s+.+")
+
+
+@dataclass(slots=True)
+class Section:
+    name: str
+    date: str
+    start: int  # byte offset of the `## [name]` heading
+    body: int  # byte offset of the line after the heading
+    end: int  # byte offset of the next boundary (or end of file)
+    subsections: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def bullets(self) -> list[str]:
+        return [b for vals in self.subsections.values() for b in vals]
+
+
+@dataclass(slots=True)
+class ChangelogIndex:
+    oid: str
+    sections: list[Section] = field(default_factory=list)
+    _by_name: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        self._by_name.clear()
+        for i, sec in enumerate(self.sections):
+            self._by_name.setdefault(sec.name.lower(), i)  # first heading wins, as in a linear scan
+
+    def get(self, name: str) -> Section | None:
+        i = self._by_name.get(name.lower())
+        return None if i is None else self.sections[i]
+
+    def position(self, name: str) -> int | None:
+        return self._by_name.get(name.lower())
+
+    def as_json(self) -> dict[str, Any]:
+        return {"schema": INDEX_SCHEMA, "oid": self.oid, "sections": [asdict(s) for s in self.sections]}
+
+
+def build_index(data: bytes) -> ChangelogIndex:
+    text = data.decode("utf-8")
+    index = ChangelogIndex(oid=blob_oid(data))
+    current: Section | None = None
+    sub: list[str] | None = None
+    offset = 0
+    for raw in text.splitlines(keepends=True):
+        start, offset = offset, offset + len(raw.encode("utf-8"))
+        line = raw.rstrip("\r\n").rstrip()
+        stripped = line.strip()
+        if BOUNDARY_RE.match(stripped):
+            if current is not None:
+                current.end = start
+            current, sub = None, None
+            m = SECTION_RE.match(stripped)
+            if m:
+                current = Section(m.group(1), m.group(2) or "", start, offset, len(data))
+                index.sections.append(current)
+            continue
+        if current is None:
+            continue
+        m = SUBSECTION_RE.match(stripped)
+        if m:
+            sub = current.subsections.setdefault(m.group(1).strip(), [])
+        elif sub is not None and BULLET_RE.match(line):
+            sub.append(stripped)
+    index.reindex()
+    return index
+
+
+def _entry_path(oid: str) -> Path:
+    return cache_dir("changelog", oid[:2], f"{oid}.json")
+
+
+def _load(oid: str) -> ChangelogIndex | None:
+    try:
+        raw = json.loads(_entry_path(oid).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if raw.get("schema") != INDEX_SCHEMA or raw.get("oid") != oid:
+        return None
+    return ChangelogIndex(oid=oid, sections=[Section(**s) for s in raw["sections"]])
+
+
+_memo: dict[str, ChangelogIndex] = {}
+
+
+def index_for(data: bytes, persist: bool = True) -> ChangelogIndex:
+    """Index of `data`, from the process memo, then the tool cache, then a fresh pass."""
+    oid = blob_oid(data)
+    index = _memo.get(oid)
+    if index is not None:
+        return index
+    use_cache = persist and not cache_disabled()
+    index = _load(oid) if use_cache else None
+    if index is None:
+        index = build_index(data)
+        if use_cache:
+            try:
+                write_json(_entry_path(oid), index.as_json())
+            except OSError as e:
+                print(f"[changelog] WARN: cannot store section index: {e}", file=sys.stderr)
+    _memo[oid] = index
+    return index
+
+
+def section_text(data: bytes, sec: Section, heading: bool = False) -> str:
+    """Section content, trimmed like `changelog.extract_section_block` (`heading` keeps the `##` line)."""
+    text = data[sec.start if heading else sec.body : sec.end].decode("utf-8")
+    return "\n".join(text.splitlines()).strip("\n")
+
+
+def select(index: ChangelogIndex, names: list[str], since: str = "", until: str = "") -> list[Section]:
+    """Sections by name, or the file-order run between `since` and `until` (both inclusive).
+
+    With neither, every section. Raises KeyError naming the first unknown version.
+    """
+    for name in (*names, since, until):
+        if name and index.position(name) is None:
+            raise KeyError(name)
+    if names:
+        return [index.sections[index.position(n)] for n in names]  # type: ignore[index]
+    if not since and not until:
+        return list(index.sections)
+    a = index.position(since) if since else 0
+    b = index.position(until) if until else len(index.sections) - 1
+    lo, hi = min(a, b), max(a, b)  # type: ignore[type-var]
+    return index.sections[lo : hi + 1]
+
+
+def render_markdown(data: bytes, sections: list[Section]) -> str:
+    return "\n\n".join(section_text(data, s, heading=True) for s in sections) + "\n"
+
+
+def render_json(data: bytes, index: ChangelogIndex, sections: list[Section], source: str) -> str:
+    doc = {
+        "source": source,
+        "oid": index.oid,
+        "sections": [
+            {"version": s.name, "date": s.date, "subsections": s.subsections, "notes": section_text(data, s)}
+            for s in sections
+        ],
+    }
+    return json.dumps(doc, indent=2, ensure_ascii=False) + "\n"
+
+
+def run_query(
+    path: str,
+    ref: str = "",
+    versions: list[str] | None = None,
+    since: str = "",
+    until: str = "",
+    list_only: bool = False,
+    fmt: str = "markdown",
+) -> int:
+    from yai_tools._core.git import cat_file
+    from yai_tools._core.paths import repo_root
+
+    root = repo_root()
+    if ref:
+        raw = cat_file(root).read(f"{ref}:{path}")
+        source = f"{ref}:{path}"
+    else:
+        try:
+            raw = (root / path).read_bytes()
+        except OSError:
+            raw = None
+        source = path
+    if raw is None:
+        print(f"[changelog] ERROR: cannot read {source}", file=sys.stderr)
+        return 2
+
+    index = index_for(raw)
+    try:
+        sections = select(index, versions or [], since, until)
+    except KeyError as e:
+        print(f"[changelog] ERROR: no section ## [{e.args[0]}] in {source}", file=sys.stderr)
+        return 2
+    if list_only:
+        if fmt == "json":
+            rows = [{"version": s.name, "date": s.date, "bullets": len(s.bullets)} for s in sections]
+            print(json.dumps({"source": source, "oid": index.oid, "sections": rows}, indent=2))
+        else:
+            for s in sections:
+                print(f"{s.name}\t{s.date or '-'}\t{len(s.bullets)} bullet(s)")
+        return 0
+    out = render_json(raw, index, sections, source) if fmt == "json" else render_markdown(raw, sections)
+    sys.stdout.write(out)
+    return 0
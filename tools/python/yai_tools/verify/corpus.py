@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import contextlib
+from pathlib import Path
+from typing import Any, Iterator
+
+from yai_tools._core import profile
+from yai_tools.verify import generated_sync
+from yai_tools.verify.records import intern_frontmatter
+from yai_tools.verify.traceability import REPO_ROOT, parse_frontmatter
+
+
+class DocsCorpus:
+    """Read-once view of the docs tree.
+
+    Discovery, file reads and frontmatter parsing are memoized so several
+    generators/gates can share one pass over the corpus.
+    """
+
+    def __init__(self, root: Path = REPO_ROOT) -> None:
+        self.root = root
+        self._text: dict[Path, str] = {}
+        self._frontmatter: dict[Path, dict[str, Any]] = {}
+        self._globs: dict[tuple[Path, str, bool], list[Path]] = {}
+        self._exists: dict[Path, bool] = {}
+
+    def rglob(self, base: Path, pattern: str = "*.md") -> list[Path]:
+        return self._glob(base, pattern, recursive=True)
+
+    def glob(self, base: Path, pattern: str = "*.md") -> list[Path]:
+        return self._glob(base, pattern, recursive=False)
+
+    def _glob(self, base: Path, pattern: str, recursive: bool) -> list[Path]:
+        key = (base, pattern, recursive)
+        hit = self._globs.get(key)
+        if hit is None:
+            with profile.span("glob", "discovery", base=base, pattern=pattern):
+                found = base.rglob(pattern) if recursive else base.glob(pattern)
+                hit = sorted(found)
+            self._globs[key] = hit
+        return list(hit)
+
+    def exists(self, path: Path) -> bool:
+        hit = self._exists.get(path)
+        if hit is None:
+            hit = path.exists()
+            self._exists[path] = hit
+        return hit
+
+    def text(self, path: Path) -> str:
+        hit = self._text.get(path)
+        if hit is None:
+            with profile.span("read", "io", path=path):
+                hit = path.read_text(encoding="utf-8")
+            self._text[path] = hit
+        return hit
+
+    def frontmatter(self, path: Path) -> dict[str, Any]:
+        hit = self._frontmatter.get(path)
+        if hit is None:
+            text = self.text(path)
+            with profile.span("frontmatter", "parse", path=path):
+                hit = intern_frontmatter(parse_frontmatter(text))
+            self._frontmatter[path] = hit
+        return hit
+
+    def forget(self, path: Path) -> None:
+        """Drop cached state for a file rewritten in this process (discovery included)."""
+        self._text.pop(path, None)
+        self._frontmatter.pop(path, None)
+        self._exists.pop(path, None)
+        parents = set(path.parents)
+        for key in [k for k in self._globs if k[0] in parents]:
+            del self._globs[key]
+
+
+_shared: DocsCorpus | None = None
+
+
+def default_corpus() -> DocsCorpus:
+    """The process-wide corpus inside `shared_corpus()`, otherwise a fresh one."""
+    return _shared if _shared is not None else DocsCorpus()
+
+
+@contextlib.contextmanager
+def shared_corpus() -> Iterator[DocsCorpus]:
+    """Let every command in this block reuse one corpus; files written meanwhile are re-read."""
+    global _shared
+    prev = _shared
+    _shared = DocsCorpus()
+    corpus = _shared
+    generated_sync.add_write_listener(corpus.forget)
+    try:
+        yield corpus
+    finally:
+        generated_sync.remove_write_listener(corpus.forget)
+        _shared = prev
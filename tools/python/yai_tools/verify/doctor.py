@@ -1,52 +1,102 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
-from pathlib import Path
-
-from yai_tools.verify.agent_pack import run_agent_pack
-from yai_tools.verify.frontmatter_schema import run_schema_check
-from yai_tools.verify.trace_graph import run_graph
-
-REPO_ROOT = Path(__file__).resolve().parents[4]
-
-
-def _run_traceability(mode: str, base: str, head: str) -> int:
-    if mode == "ci":
-        cmd = ["tools/bin/yai-docs-trace-check", "--changed", "--base", base, "--head", head]
-    else:
-        cmd = ["tools/bin/yai-docs-trace-check", "--all"]
-    p = subprocess.run(cmd, cwd=REPO_ROOT)
-    return p.returncode
-
-
-def run_doctor(mode: str, base: str, head: str) -> int:
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from yai_tools._core import profile
+from yai_tools.verify import gate_cache
+from yai_tools.verify.agent_pack import check_agent_pack
+from yai_tools.verify.corpus import default_corpus
+from yai_tools.verify.frontmatter_schema import check_schema
+from yai_tools.verify import report
+from yai_tools.verify.report import GateResult, add_format_arg, error_result, measure
+from yai_tools.verify.trace_graph import check_graph
+from yai_tools.verify.traceability import changed_files, check_traceability, rel
+
+
+def _guard(gate: str, fn: Callable[[], GateResult]) -> GateResult:
+    try:
+        return fn()
+    except (Exception, SystemExit) as exc:
+        return error_result(gate, exc)
+
+
+def collect_doctor(
+    mode: str, base: str, head: str, jobs: int | None = None, use_cache: bool = True
+) -> list[GateResult]:
+    """Run every docs gate in-process and concurrently against one changed-file set and corpus.
+
+    With `use_cache`, each gate's outcome is replayed from the gate cache when its
+    inputs (doc blobs, schemas, pinned deps, generator version, changed set) match.
+    """
+    ci = mode == "ci"
+    corpus = default_corpus()
+    changed = changed_files(base, head) if ci else None
+
+    gates: list[tuple[str, tuple[str, ...], Callable[[], GateResult]]] = [
+        (
+            "traceability",
+            gate_cache.DOCS_INPUTS,
+            lambda: check_traceability(all_docs=not ci, base=base, head=head, changed=changed, corpus=corpus),
+        ),
+        (
+            "docs-schema",
+            gate_cache.DOCS_INPUTS,
+            lambda: check_schema(changed=ci, base=base, head=head, changed_paths=changed, corpus=corpus),
+        ),
+        ("docs-graph", gate_cache.DOCS_INPUTS, lambda: check_graph(write=False, corpus=corpus)),
+        ("agent-pack", ("docs/_generated/agent-pack.v1.json",), lambda: check_agent_pack(write=False)),
+    ]
+
+    use_cache = use_cache and not report.streaming()
+    params = {"mode": mode, "changed": sorted(rel(p) for p in changed) if changed is not None else None}
+    keys = {
+        name: gate_cache.gate_key(name, inputs, params) if use_cache else None for name, inputs, _ in gates
+    }
+
+    def _run(name: str, fn: Callable[[], GateResult]) -> GateResult:
+        with profile.span(name, "validate"):
+            res = measure(lambda: _guard(name, lambda: gate_cache.cached_result(name, keys[name], fn)), time.thread_time)
+        if report.streaming():
+            res.emit()  # structured formats stream each gate as soon as it completes
+        return res
+
+    with ThreadPoolExecutor(max_workers=jobs or len(gates)) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, _run, name, fn) for name, _, fn in gates]
+        return [f.result() for f in futures]
+
+
+def _doctor(mode: str, base: str, head: str, jobs: int | None, use_cache: bool) -> GateResult:
+    summary = GateResult(gate="docs-doctor")
     if mode == "ci" and not base:
-        print("[docs-doctor] ERROR: --mode ci requires --base")
-        return 2
-
-    # 1) existing traceability gate
-    rc = _run_traceability(mode=mode, base=base, head=head)
-    if rc != 0:
-        return rc
+        summary.rc, summary.status, summary.detail = 2, "ERROR", "--mode ci requires --base"
+        return summary
 
-    # 2) schema checks
-    rc = run_schema_check(changed=(mode == "ci"), base=base if mode == "ci" else "", head=head if mode == "ci" else "HEAD")
-    if rc != 0:
-        return rc
+    try:
+        results = collect_doctor(mode=mode, base=base, head=head, jobs=jobs, use_cache=use_cache)
+    except SystemExit as exc:
+        # shared changed-file resolution failed (bad base/head)
+        return error_result("docs-doctor", exc)
+    if not report.streaming():
+        for res in results:
+            print(res.render())
 
-    # 3) generated graph sync
-    rc = run_graph(write=False)
-    if rc != 0:
-        return rc
+    failed = [r for r in results if not r.ok]
+    if failed:
+        names = ", ".join(r.gate for r in failed)
+        summary.rc, summary.status = max(r.rc for r in failed), "FAIL"
+        summary.detail = f"{len(failed)} of {len(results)} gate(s) failed ({names})"
+    return summary
 
-    # 4) agent pack sync
-    rc = run_agent_pack(write=False)
-    if rc != 0:
-        return rc
 
-    print("[docs-doctor] OK")
-    return 0
+def run_doctor(
+    mode: str, base: str, head: str, jobs: int | None = None, use_cache: bool = True, fmt: str = "text"
+) -> int:
+    with report.report_output(fmt, "yai-docs-doctor"):
+        return measure(lambda: _doctor(mode, base, head, jobs, use_cache)).emit()
 
 
 def main() -> int:
@@ -54,8 +104,18 @@ def main() -> int:
     ap.add_argument("--mode", choices=["ci", "all"], default="ci")
     ap.add_argument("--base", default="")
     ap.add_argument("--head", default="HEAD")
+    ap.add_argument("--jobs", type=int, default=None, help="max concurrent gates (default: one per gate)")
+    ap.add_argument("--no-cache", action="store_true", help="always run gates, ignoring the gate result cache")
+    add_format_arg(ap)
     args = ap.parse_args()
-    return run_doctor(args.mode, args.base, args.head)
+    return run_doctor(
+        args.mode,
+        args.base,
+        args.head,
+        jobs=None if args.jobs is None else max(1, args.jobs),
+        use_cache=gate_cache.enabled(args.no_cache),
+        fmt=args.format,
+    )
 
 
 if __name__ == "__main__":
@@ -6,13 +6,15 @@ import re
 from pathlib import Path
 from typing import Any
 
+from yai_tools.verify.corpus import DocsCorpus, default_corpus
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
 from yai_tools.verify.traceability import (
     ADR_DIR,
     MP_DIR,
     REPO_ROOT,
     RUNBOOK_DIR,
     changed_files,
-    parse_frontmatter,
+    frontmatter_lines,
 )
 
 SCHEMA_DIR = REPO_ROOT / "tools" / "schemas" / "docs"
@@ -39,14 +41,15 @@ def _check_pattern(val: Any, pattern: str) -> bool:
     return re.match(pattern, str(val)) is not None
 
 
-def _validate_frontmatter(fm: dict[str, Any], schema: dict[str, Any], relpath: str) -> list[str]:
-    errs: list[str] = []
+def _validate_frontmatter(fm: dict[str, Any], schema: dict[str, Any]) -> list[tuple[str, str, str]]:
+    """(rule, key, message) per schema violation."""
+    errs: list[tuple[str, str, str]] = []
     required = schema.get("required", [])
     props = schema.get("properties", {})
 
     for k in required:
         if k not in fm or fm.get(k) in ("", [], None):
-            errs.append(f"{relpath}: missing required frontmatter key `{k}`")
+            errs.append(("required", k, f"missing required frontmatter key `{k}`"))
 
     for key, rules in props.items():
         if key not in fm:
@@ -56,18 +59,18 @@ def _validate_frontmatter(fm: dict[str, Any], schema: dict[str, Any], relpath: s
         if t == "array":
             arr = _ensure_list(val)
             if rules.get("minItems") and len(arr) < int(rules["minItems"]):
-                errs.append(f"{relpath}: `{key}` must contain at least {rules['minItems']} item(s)")
+                errs.append(("min-items", key, f"`{key}` must contain at least {rules['minItems']} item(s)"))
             item_rules = rules.get("items", {})
             pat = item_rules.get("pattern")
             if pat:
                 for i in arr:
                     if not _check_pattern(i, pat):
-                        errs.append(f"{relpath}: `{key}` item does not match pattern `{pat}`: {i}")
+                        errs.append(("pattern", key, f"`{key}` item does not match pattern `{pat}`: {i}"))
         else:
             if "enum" in rules and not _check_enum(val, rules["enum"]):
-                errs.append(f"{relpath}: `{key}` must be one of {rules['enum']}")
+                errs.append(("enum", key, f"`{key}` must be one of {rules['enum']}"))
             if "pattern" in rules and not _check_pattern(val, rules["pattern"]):
-                errs.append(f"{relpath}: `{key}` does not match pattern `{rules['pattern']}`")
+                errs.append(("pattern", key, f"`{key}` does not match pattern `{rules['pattern']}`"))
 
     return errs
 
@@ -84,36 +87,41 @@ def _classify(path: Path) -> tuple[str, dict[str, Any]] | None:
     return None
 
 
-def run_schema_check(changed: bool, base: str, head: str) -> int:
+def check_schema(
+    changed: bool,
+    base: str,
+    head: str,
+    changed_paths: list[Path] | None = None,
+    corpus: DocsCorpus | None = None,
+) -> GateResult:
+    corpus = corpus or default_corpus()
     files: list[Path]
     if changed:
-        files = changed_files(base, head)
+        files = changed_paths if changed_paths is not None else changed_files(base, head)
     else:
-        files = list(ADR_DIR.rglob("*.md")) + list(RUNBOOK_DIR.rglob("*.md")) + list(MP_DIR.rglob("*.md")) + list(
-            PROPOSAL_DIR.rglob("*.md")
-        )
+        files = corpus.rglob(ADR_DIR) + corpus.rglob(RUNBOOK_DIR) + corpus.rglob(MP_DIR) + corpus.rglob(PROPOSAL_DIR)
 
-    failures: list[str] = []
+    result = GateResult(gate="docs-schema")
     for p in sorted(set(files)):
         c = _classify(p)
         if not c:
             continue
         _, schema = c
         relpath = p.relative_to(REPO_ROOT).as_posix()
-        fm = parse_frontmatter(p.read_text(encoding="utf-8"))
+        fm = corpus.frontmatter(p)
         if not fm:
-            failures.append(f"{relpath}: missing YAML frontmatter")
+            result.report(Finding("missing YAML frontmatter", "docs-schema/frontmatter", file=relpath))
             continue
-        failures.extend(_validate_frontmatter(fm, schema, relpath))
+        errs = _validate_frontmatter(fm, schema)
+        lines = frontmatter_lines(corpus.text(p)) if errs else {}
+        for rule, key, msg in errs:
+            result.report(Finding(msg, f"docs-schema/{rule}", file=relpath, line=lines.get(key, 0)))
 
-    if failures:
-        print("[docs-schema] FAIL:")
-        for e in failures:
-            print(f"- {e}")
-        return 1
+    return result
 
-    print("[docs-schema] OK")
-    return 0
+
+def run_schema_check(changed: bool, base: str, head: str, fmt: str = "text") -> int:
+    return run_gate("docs-schema", fmt, lambda: check_schema(changed, base, head), tool="yai-docs-schema-check")
 
 
 def main() -> int:
@@ -121,13 +129,14 @@ def main() -> int:
     ap.add_argument("--changed", action="store_true")
     ap.add_argument("--base", default="")
     ap.add_argument("--head", default="HEAD")
+    add_format_arg(ap)
     args = ap.parse_args()
 
     if args.changed and not args.base:
         print("[docs-schema] ERROR: --changed requires --base")
         return 2
 
-    return run_schema_check(args.changed, args.base, args.head)
+    return run_schema_check(args.changed, args.base, args.head, fmt=args.format)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from yai_tools._core.cache import cache_dir, cache_disabled
+from yai_tools._core.git import GitError, rev_parse, run_git
+from yai_tools._core.paths import repo_root, tools_version
+from yai_tools.verify.generated_sync import write_json
+from yai_tools.verify import report
+from yai_tools.verify.report import GateResult
+
+REPO_ROOT = repo_root()
+TOOLS_PKG = Path(__file__).resolve().parents[1]
+
+# Bump when the entry layout or key derivation changes.
+CACHE_SCHEMA = 1
+
+# Declared inputs of the docs gates: every doc blob and the schemas that validate
+# them. Pinned submodules (deps/yai-law, deps/yai-specs) are listed in the index as
+# gitlinks, so their pinned commit is part of every key below.
+DOCS_INPUTS = ("docs", "tools/schemas", "deps")
+
+
+def blob_oid(data: bytes) -> str:
+    """Git blob id of `data` (same value `git hash-object` prints)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def source_digest(pkg_dir: Path = TOOLS_PKG) -> str:
+    """sha256 over the yai_tools sources (the zipapp build stores it in `_build_info`)."""
+    h = hashlib.sha256()
+    for p in sorted(pkg_dir.rglob("*.py")):
+        if p.name == "_build_info.py":
+            continue
+        h.update(p.relative_to(pkg_dir).as_posix().encode("utf-8") + b"\0")
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def generator_version() -> str:
+    """Tools version plus a digest of the yai_tools sources, so local edits invalidate."""
+    version = tools_version() or "0"
+    try:
+        from yai_tools._build_info import SOURCE_DIGEST as digest  # zipapp: no source tree to walk
+    except ImportError:
+        digest = source_digest()
+    return f"{version}+{digest[:16]}"
+
+
+def _index_oids(pathspecs: tuple[str, ...], root: Path) -> dict[str, str]:
+    out = run_git(["ls-files", "-s", "-z", "--", *pathspecs], cwd=root)
+    oids: dict[str, str] = {}
+    for rec in out.split("\0"):
+        if not rec:
+            continue
+        meta, path = rec.split("\t", 1)
+        oids[path] = meta.split(" ")[1]
+    return oids
+
+
+def _dirty_paths(pathspecs: tuple[str, ...], root: Path) -> list[str]:
+    out = run_git(["status", "--porcelain", "-z", "--untracked-files=all", "--", *pathspecs], cwd=root)
+    recs = out.split("\0")
+    paths: list[str] = []
+    i = 0
+    while i < len(recs):
+        rec = recs[i]
+        i += 1
+        if len(rec) < 4:
+            continue
+        paths.append(rec[3:])
+        if rec[0] in "RC":
+            i += 1  # rename/copy source follows
+    return paths
+
+
+def _walk_oids(pathspecs: tuple[str, ...], root: Path) -> dict[str, str]:
+    oids: dict[str, str] = {}
+    for spec in pathspecs:
+        base = root / spec
+        files = [base] if base.is_file() else sorted(p for p in base.rglob("*") if p.is_file())
+        for p in files:
+            oids[p.relative_to(root).as_posix()] = blob_oid(p.read_bytes())
+    return oids
+
+
+def scan_tree_oids(pathspecs: tuple[str, ...], root: Path = REPO_ROOT) -> tuple[tuple[str, str], ...]:
+    """(path, blob oid) for every file under `pathspecs` as it is in the working tree.
+
+    Clean files come straight from the index; only modified or untracked files are
+    read and hashed. Outside a git checkout every file is hashed.
+    """
+    try:
+        oids = _index_oids(pathspecs, root)
+        for rel in _dirty_paths(pathspecs, root):
+            p = root / rel
+            if p.is_file():
+                oids[rel] = blob_oid(p.read_bytes())
+            elif not p.is_dir():
+                oids.pop(rel, None)
+    except GitError:
+        oids = _walk_oids(pathspecs, root)
+    return tuple(sorted(oids.items()))
+
+
+# memoized per process: gates that only read their inputs share one scan
+tree_oids = lru_cache(maxsize=None)(scan_tree_oids)
+
+
+def gate_key(
+    gate: str, inputs: Iterable[str] = (), params: dict[str, Any] | None = None, fresh: bool = False
+) -> str:
+    """Content hash of one gate invocation: gate, generator, parameters and input blobs.
+
+    Pass `fresh=True` when earlier work in this process may have rewritten the inputs.
+    """
+    h = hashlib.sha256()
+    head = {"schema": CACHE_SCHEMA, "gate": gate, "generator": generator_version(), "params": params or {}}
+    h.update(json.dumps(head, sort_keys=True).encode("utf-8") + b"\n")
+    scan = scan_tree_oids if fresh else tree_oids
+    for path, oid in scan(tuple(inputs)):
+        h.update(f"{path}\0{oid}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _entry_path(gate: str, key: str) -> Path:
+    return cache_dir("gates", gate, key[:2], f"{key}.json")
+
+
+def load_entry(gate: str, key: str) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(_entry_path(gate, key).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if entry.get("schema") != CACHE_SCHEMA or entry.get("key") != key:
+        return None
+    return entry
+
+
+def store_entry(gate: str, key: str, rc: int, output: str, result: GateResult | None = None) -> None:
+    entry = {
+        "schema": CACHE_SCHEMA,
+        "gate": gate,
+        "key": key,
+        "rc": rc,
+        "output": output,
+        "result": asdict(result) if result is not None else None,
+    }
+    try:
+        write_json(_entry_path(gate, key), entry)
+    except OSError as e:
+        print(f"[gate-cache] WARN: cannot store {gate} result: {e}", file=sys.stderr)
+
+
+def _note_hit(gate: str, key: str) -> None:
+    # single write: doctor gates report hits from worker threads
+    sys.stderr.write(f"[gate-cache] hit: {gate} ({key[:12]})\n")
+
+
+def enabled(no_cache: bool = False) -> bool:
+    return not no_cache and not cache_disabled()
+
+
+def cached_result(gate: str, key: str | None, fn: Callable[[], GateResult]) -> GateResult:
+    """Replay a stored GateResult for `key`, or run `fn` and store pass/fail outcomes.
+
+    Structured (JSON/SARIF) runs bypass the cache: their findings are streamed,
+    not retained, so there is nothing complete to store or replay.
+    """
+    if key is None or report.streaming():
+        return fn()
+    entry = load_entry(gate, key)
+    if entry is not None and entry.get("result"):
+        _note_hit(gate, key)
+        return GateResult(**{**entry["result"], "cached": True})
+    res = fn()
+    if res.rc in (0, 1):
+        store_entry(gate, key, res.rc, res.render(), res)
+    return res
+
+
+def resolve_revs(*revs: str) -> list[str] | None:
+    """Commit ids for `revs`, or None when any cannot be resolved (caller runs uncached)."""
+    try:
+        return [rev_parse(f"{r}^{{commit}}", cwd=REPO_ROOT) for r in revs]
+    except GitError:
+        return None
+
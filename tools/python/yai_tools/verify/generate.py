@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from yai_tools.verify import agent_pack, architecture_alignment, trace_graph
+from yai_tools.verify.corpus import DocsCorpus, default_corpus
+from yai_tools.verify.generated_sync import (
+    check_json_synced,
+    check_text_synced,
+    write_json,
+    write_text,
+)
+from yai_tools.verify.report import GateResult, add_format_arg, run_gate
+from yai_tools.verify.traceability import REPO_ROOT
+
+
+@dataclass
+class Artifact:
+    path: Path
+    payload: Any
+    kind: str  # "json" | "text"
+
+    @property
+    def rel(self) -> str:
+        return self.path.relative_to(REPO_ROOT).as_posix()
+
+
+def build_artifacts(corpus: DocsCorpus) -> tuple[list[Artifact], list[str]]:
+    """Build every docs/_generated artifact from one shared corpus pass."""
+    artifacts: list[Artifact] = []
+    errors: list[str] = []
+
+    artifacts.append(Artifact(agent_pack.OUT, agent_pack.build_pack(), "json"))
+
+    graph = trace_graph.build_graph(corpus)
+    errors.extend(f"docs-graph: {v}" for v in graph["violations"])
+    artifacts.append(Artifact(trace_graph.GENERATED_GRAPH, graph, "json"))
+    artifacts.append(Artifact(trace_graph.GENERATED_LOCK, trace_graph.build_lock(graph), "json"))
+
+    if architecture_alignment.ARCH_DIR.exists():
+        snapshot, traceability_md, arch_errors, components = architecture_alignment.build_alignment_snapshot(
+            corpus=corpus
+        )
+        errors.extend(f"architecture-check: {e}" for e in arch_errors)
+        for comp in components:
+            errors.extend(f"architecture-check: {comp.path}: {e}" for e in comp.errors)
+        artifacts.append(Artifact(architecture_alignment.GENERATED_ALIGNMENT, snapshot, "json"))
+        artifacts.append(Artifact(architecture_alignment.TRACEABILITY_DOC, traceability_md, "text"))
+
+    return artifacts, errors
+
+
+def check_generate(check: bool, corpus: DocsCorpus | None = None) -> GateResult:
+    result = GateResult(gate="generate")
+    artifacts, errors = build_artifacts(corpus or default_corpus())
+
+    if errors:
+        for err in errors:
+            source = err.split(": ", 1)[0]
+            result.fail(f"- {err}", rule=f"generate/{source}")
+        return result
+
+    if not check:
+        changed: list[str] = []
+        for a in artifacts:
+            written = write_json(a.path, a.payload) if a.kind == "json" else write_text(a.path, a.payload)
+            if written:
+                changed.append(a.rel)
+        result.detail = f"{len(changed)} of {len(artifacts)} artifact(s) updated"
+        for rel in changed:
+            result.note(f"- {rel}")
+        return result
+
+    for a in artifacts:
+        if a.kind == "json":
+            ok, msg = check_json_synced(a.path, a.payload)
+        else:
+            ok, msg = check_text_synced(a.path, a.payload)
+        if not ok:
+            result.fail(f"- {msg}", rule="generated/drift", file=a.rel)
+
+    if result.ok:
+        result.detail = f"{len(artifacts)} artifact(s) in sync"
+    return result
+
+
+def run_generate(check: bool, corpus: DocsCorpus | None = None, fmt: str = "text") -> int:
+    return run_gate("generate", fmt, lambda: check_generate(check, corpus))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="yai-generate")
+    mode = ap.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--all", action="store_true", help="regenerate every docs/_generated artifact")
+    mode.add_argument("--check-all", action="store_true", help="report drift for every generated artifact")
+    add_format_arg(ap)
+    args = ap.parse_args()
+    return run_generate(check=args.check_all, fmt=args.format)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,21 +1,154 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
+
+from yai_tools._core import profile
+
+_CHUNK_BYTES = 1 << 16
+_write_listeners: list[Callable[[Path], None]] = []
+
+
+def _as_json(obj: Any) -> Any:
+    # compact records (verify.records) render through as_json()
+    as_json = getattr(obj, "as_json", None)
+    if as_json is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return as_json()
+
+
+_ENCODER = json.JSONEncoder(indent=2, sort_keys=True, default=_as_json)
+
+
+def add_write_listener(fn: Callable[[Path], None]) -> None:
+    """Call `fn(path)` after every generated file this process rewrites (shared corpus invalidation)."""
+    _write_listeners.append(fn)
+
+
+def remove_write_listener(fn: Callable[[Path], None]) -> None:
+    _write_listeners.remove(fn)
+
+
+def iter_canonical(obj: Any) -> Iterator[str]:
+    """Canonical JSON as a stream of string fragments (same bytes as dumps_canonical)."""
+    yield from _ENCODER.iterencode(obj)
+    yield "\n"
 
 
 def dumps_canonical(obj: Any) -> str:
-    return json.dumps(obj, indent=2, sort_keys=True) + "\n"
+    return "".join(iter_canonical(obj))
+
+
+def _byte_chunks(fragments: Iterable[str]) -> Iterator[bytes]:
+    buf: list[str] = []
+    size = 0
+    for frag in fragments:
+        buf.append(frag)
+        size += len(frag)
+        if size >= _CHUNK_BYTES:
+            yield "".join(buf).encode("utf-8")
+            buf = []
+            size = 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
+
+def _matches(path: Path, chunks: Iterable[bytes]) -> bool:
+    # text mode with universal newlines: a CRLF checkout (core.autocrlf) is not stale,
+    # same as check_text_synced; chunks always end on a character boundary
+    try:
+        fh = path.open("r", encoding="utf-8", newline=None)
+    except FileNotFoundError:
+        return False
+    with fh, profile.span("compare", "io", path=path.name):
+        try:
+            for chunk in chunks:
+                text = chunk.decode("utf-8")
+                if fh.read(len(text)) != text:
+                    return False
+            return fh.read(1) == ""
+        except UnicodeDecodeError:
+            return False
 
 
-def write_json(path: Path, obj: Any) -> None:
+def _write_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+    with profile.span("write", "io", path=path.name):
+        _write_chunks(path, chunks)
+    for fn in list(_write_listeners):
+        fn(path)
+
+
+@lru_cache(maxsize=1)
+def _umask() -> int:
+    # os.umask() can only be read by setting it, which races with other gate threads;
+    # Linux exposes it read-only in /proc
+    try:
+        for line in Path("/proc/self/status").read_text(encoding="ascii").splitlines():
+            if line.startswith("Umask:"):
+                return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def _write_chunks(path: Path, chunks: Iterable[bytes]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(dumps_canonical(obj), encoding="utf-8")
+    # mkstemp creates 0600; keep an existing file's mode, else what open() would give
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o666 & ~_umask()
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_json(path: Path, obj: Any) -> bool:
+    """Atomically write canonical JSON; returns False when the file was already identical.
+
+    The comparison streams the encoded document against the file on disk, so
+    unchanged artifacts are never rewritten (mtimes stay stable) and large
+    graphs are never materialized as a single string.
+    """
+    if _matches(path, _byte_chunks(iter_canonical(obj))):
+        return False
+    _write_atomic(path, _byte_chunks(iter_canonical(obj)))
+    return True
 
 
 def check_json_synced(path: Path, obj: Any) -> tuple[bool, str]:
-    expected = dumps_canonical(obj)
+    if not path.exists():
+        return False, f"missing generated file: {path.as_posix()}"
+    if not _matches(path, _byte_chunks(iter_canonical(obj))):
+        return False, f"stale generated file: {path.as_posix()} (run --write to refresh)"
+    return True, "ok"
+
+
+def write_text(path: Path, text: str) -> bool:
+    """Atomically write `text`; returns False when the file was already identical."""
+    data = text.encode("utf-8")
+    if _matches(path, [data]):
+        return False
+    _write_atomic(path, [data])
+    return True
+
+
+def check_text_synced(path: Path, expected: str) -> tuple[bool, str]:
     if not path.exists():
         return False, f"missing generated file: {path.as_posix()}"
     current = path.read_text(encoding="utf-8")
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import argparse
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from yai_tools._core import profile
+from yai_tools._core.git import GitError, diff_name_only, ls_files
+from yai_tools.verify.agent_pack import build_pack
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
+from yai_tools.verify.traceability import REPO_ROOT
+
+MARKDOWN_SUFFIXES = {".md"}
+JSON_SUFFIXES = {".json"}
+TEMPLATE_DIRS = (
+    ".github/ISSUE_TEMPLATE/",
+    ".github/PULL_REQUEST_TEMPLATE/",
+    "governance/templates/",
+    "docs/templates/",
+)
+TEMPLATE_SUFFIXES = {".md", ".yml", ".yaml", ".json", ".txt"}
+
+# Frontmatter keys whose values are repo references (see traceability / trace_graph).
+REF_KEYS = {"law_refs", "adr_refs", "adrs", "adr", "runbook", "runbooks", "milestone_packs", "spec_anchors"}
+
+# One combined scanner per file kind; each alternative is a named group so a
+# single finditer() pass classifies every candidate token.
+_MD_SCAN_RE = re.compile(
+    r"(?P<fence>^[ \t]*(?:```|~~~))"
+    r"|`(?P<tick>[^`\n]+)`"
+    r"|\]\((?P<link>[^)\s]+)\)",
+    re.MULTILINE,
+)
+_JSON_SCAN_RE = re.compile(r'"(?P<string>(?:[^"\\\n]|\\.)*)"')
+_ABSOLUTE_RE = re.compile(r"^(?:/|[A-Za-z]:[\\/]|\\\\)")
+_NON_RELATIVE_RE = re.compile(r"^(?:file://|~/)")
+_FM_REF_RE = re.compile(r"^(?P<key>[A-Za-z_]+):\s*(?P<value>.*)$|^\s*-\s+(?P<item>.+)$")
+
+
+@dataclass
+class PathPolicy:
+    relative_only: bool
+    allowed_prefixes: tuple[str, ...]
+    forbid_absolute_paths: bool
+
+    @classmethod
+    def from_pack(cls, pack: dict[str, Any] | None = None) -> "PathPolicy":
+        raw = (pack or build_pack()).get("path_policy", {})
+        return cls(
+            relative_only=bool(raw.get("relative_only", True)),
+            allowed_prefixes=tuple(raw.get("allowed_prefixes", [])),
+            forbid_absolute_paths=bool(raw.get("forbid_absolute_paths", True)),
+        )
+
+
+@dataclass
+class Violation:
+    path: str
+    line: int
+    rule: str
+    message: str
+
+    def render(self) -> str:
+        return f"{self.path}:{self.line}: {self.message}"
+
+
+def _kind_for(rel: str) -> str | None:
+    suffix = Path(rel).suffix.lower()
+    if rel.startswith(TEMPLATE_DIRS) and suffix in TEMPLATE_SUFFIXES:
+        return "json" if suffix in JSON_SUFFIXES else "markdown"
+    if suffix in MARKDOWN_SUFFIXES:
+        return "markdown"
+    if suffix in JSON_SUFFIXES:
+        return "json"
+    return None
+
+
+def list_repo_files(root: Path = REPO_ROOT) -> list[str]:
+    """Repo-relative paths from the git index, falling back to a filesystem walk."""
+    try:
+        return ls_files(cwd=root)
+    except (GitError, FileNotFoundError):
+        pass
+    return sorted(x.relative_to(root).as_posix() for x in root.rglob("*") if x.is_file() and ".git" not in x.parts)
+
+
+def _changed_rel_paths(base: str, head: str) -> list[str]:
+    try:
+        return sorted(diff_name_only(base, head, cwd=REPO_ROOT))
+    except GitError as e:
+        raise SystemExit(f"[path-policy] ERROR: git diff failed: {e.stderr}")
+
+
+def _ref_value(token: str) -> str:
+    ref = token.strip().strip('"').strip("'")
+    if "#" in ref:
+        ref = ref.split("#", 1)[0]
+    return ref.strip()
+
+
+def _check_ref(policy: PathPolicy, ref: str) -> tuple[str, str] | None:
+    if policy.forbid_absolute_paths and _ABSOLUTE_RE.match(ref):
+        return "absolute-path", f"absolute path not allowed: {ref}"
+    if policy.relative_only and _NON_RELATIVE_RE.match(ref):
+        return "non-relative-ref", f"non-relative reference not allowed: {ref}"
+    return None
+
+
+def _scan_frontmatter(policy: PathPolicy, rel: str, text: str) -> Iterator[Violation]:
+    if not text.startswith("---"):
+        return
+    end = text.find("\n---", 3)
+    if end < 0:
+        return
+    current: str | None = None
+    for lineno, raw in enumerate(text[3:end].splitlines(), start=1):
+        m = _FM_REF_RE.match(raw)
+        if not m:
+            continue
+        if m.group("key"):
+            current = m.group("key")
+            value = m.group("value").strip()
+            if not value:
+                continue
+        else:
+            value = m.group("item")
+        if current not in REF_KEYS:
+            continue
+        ref = _ref_value(value)
+        if not ref:
+            continue
+        hit = _check_ref(policy, ref)
+        if hit:
+            yield Violation(rel, lineno, hit[0], f"frontmatter `{current}`: {hit[1]}")
+        elif policy.allowed_prefixes and not ref.startswith(policy.allowed_prefixes):
+            yield Violation(
+                rel,
+                lineno,
+                "prefix-not-allowed",
+                f"frontmatter `{current}` ref must start with one of {list(policy.allowed_prefixes)}: {ref}",
+            )
+
+
+def _scan_markdown(policy: PathPolicy, rel: str, text: str) -> Iterator[Violation]:
+    yield from _scan_frontmatter(policy, rel, text)
+    in_fence = False
+    line = 1
+    pos = 0
+    for m in _MD_SCAN_RE.finditer(text):
+        line += text.count("\n", pos, m.start())
+        pos = m.start()
+        if m.group("fence"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        token = m.group("tick") if m.group("tick") is not None else m.group("link")
+        hit = _check_ref(policy, _ref_value(token))
+        if hit:
+            yield Violation(rel, line, hit[0], hit[1])
+
+
+def _scan_json(policy: PathPolicy, rel: str, text: str) -> Iterator[Violation]:
+    line = 1
+    pos = 0
+    for m in _JSON_SCAN_RE.finditer(text):
+        line += text.count("\n", pos, m.start())
+        pos = m.start()
+        hit = _check_ref(policy, m.group("string"))
+        if hit:
+            yield Violation(rel, line, hit[0], hit[1])
+
+
+def scan_paths(rel_paths: Iterable[str], policy: PathPolicy, root: Path = REPO_ROOT) -> Iterator[Violation]:
+    """Single streaming pass over `rel_paths`; yields violations as they are found."""
+    for rel in rel_paths:
+        kind = _kind_for(rel)
+        if kind is None:
+            continue
+        try:
+            with profile.span("read", "io", path=rel):
+                text = (root / rel).read_bytes().decode("utf-8", "replace").lstrip("\ufeff")
+        except (FileNotFoundError, IsADirectoryError):
+            continue
+        if kind == "markdown":
+            yield from _scan_markdown(policy, rel, text)
+        else:
+            yield from _scan_json(policy, rel, text)
+
+
+def check_path_policy(changed: bool, base: str, head: str) -> GateResult:
+    policy = PathPolicy.from_pack()
+    if changed:
+        rel_paths = _changed_rel_paths(base, head)
+    else:
+        rel_paths = list_repo_files()
+
+    result = GateResult(gate="path-policy")
+    scanned = sum(1 for rel in rel_paths if _kind_for(rel) is not None)
+    for v in scan_paths(rel_paths, policy):
+        result.report(Finding(v.message, f"path-policy/{v.rule}", file=v.path, line=v.line))
+    if result.ok:
+        result.detail = f"scanned {scanned} file(s)."
+    return result
+
+
+def run_path_policy(changed: bool, base: str, head: str, fmt: str = "text") -> int:
+    return run_gate("path-policy", fmt, lambda: check_path_policy(changed, base, head), tool="yai-path-policy-check")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="yai-path-policy-check")
+    ap.add_argument("--changed", action="store_true")
+    ap.add_argument("--base", default="")
+    ap.add_argument("--head", default="HEAD")
+    add_format_arg(ap)
+    args = ap.parse_args()
+
+    if args.changed and not args.base:
+        print("[path-policy] ERROR: --changed requires --base")
+        return 2
+
+    return run_path_policy(args.changed, args.base, args.head, fmt=args.format)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
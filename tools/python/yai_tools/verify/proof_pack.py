@@ -4,12 +4,20 @@ from __future__ import annotations
 import argparse
 import json
 import re
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-REPO_ROOT = Path(__file__).resolve().parents[4]
+from yai_tools._core.git import GitError, rev_parse
+from yai_tools._core.paths import repo_root
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
+
+REPO_ROOT = repo_root()
 DEFAULT_MANIFEST = REPO_ROOT / "docs" / "proof" / ".private" / "PP-FOUNDATION-0001" / "pp-foundation-0001.manifest.v1.json"
+PROOF_DIR = REPO_ROOT / "docs" / "proof"
+MANIFEST_GLOB = "*/*.manifest.v*.json"  # published packs: docs/proof/<PACK-ID>/<pack>.manifest.vN.json
 SHA40_RE = re.compile(r"^[0-9a-f]{40}$")
 
 
@@ -17,13 +25,6 @@ def die(msg: str, code: int = 2) -> None:
     raise SystemExit(f"[proof-pack] ERROR: {msg}")
 
 
-def sh(cmd: List[str], cwd: Path = REPO_ROOT) -> str:
-    p = subprocess.run(cmd, cwd=str(cwd), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if p.returncode != 0:
-        die(f"command failed: {' '.join(cmd)}\\n{p.stderr.strip()}")
-    return p.stdout.strip()
-
-
 def read_json(path: Path) -> Dict[str, Any]:
     if not path.exists():
         die(f"manifest not found: {path.as_posix()}")
@@ -180,12 +181,29 @@ def read_cli_ref(path: Path) -> str:
     die(f"missing cli_sha=... line in {path.as_posix()}")
 
 
-def validate_pins(doc: Dict[str, Any], manifest: Path) -> List[str]:
+@dataclass(frozen=True)
+class Pins:
+    """Actual cross-repo pins the manifests are compared against."""
+
+    specs_head: str
+    cli_ref: str
+
+
+@lru_cache(maxsize=1)
+def resolve_pins() -> Pins:
+    """Resolved once per process, however many manifests are validated."""
+    try:
+        specs_head = rev_parse("HEAD", cwd=REPO_ROOT / "deps" / "yai-specs")
+    except GitError as e:
+        die(f"command failed: git -C deps/yai-specs rev-parse HEAD\n{e.stderr}")
+    return Pins(specs_head=specs_head, cli_ref=read_cli_ref(REPO_ROOT / "deps" / "yai-cli.ref"))
+
+
+def validate_pins(doc: Dict[str, Any], manifest: Path, pins: Optional[Pins] = None) -> List[str]:
     errs: List[str] = []
 
-    yai_head = sh(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT)
-    specs_head = sh(["git", "-C", str(REPO_ROOT / "deps" / "yai-specs"), "rev-parse", "HEAD"], cwd=REPO_ROOT)
-    cli_ref = read_cli_ref(REPO_ROOT / "deps" / "yai-cli.ref")
+    pins = pins or resolve_pins()
+    specs_head, cli_ref = pins.specs_head, pins.cli_ref
 
     declared_yai = str(get_nested(doc, ["pins", "yai", "commit"]) or "")
     declared_specs = str(get_nested(doc, ["pins", "yai_law", "commit"]) or "")
@@ -229,7 +247,83 @@ def validate_pins(doc: Dict[str, Any], manifest: Path) -> List[str]:
     return errs
 
 
-def main() -> int:
+def _skip_reason(manifest: Path, rel_manifest: str) -> str | None:
+    if "/.private/" in f"/{rel_manifest}":
+        return f"private draft manifest ({rel_manifest})"
+    if not manifest.exists() and manifest.resolve() == DEFAULT_MANIFEST.resolve():
+        return f"default manifest not found ({rel_manifest})"
+    return None
+
+
+def check_proof_pack(manifest: Path) -> GateResult:
+    """Structured-format variant of main(): one finding per schema or pin error."""
+    rel_manifest = manifest.relative_to(REPO_ROOT).as_posix()
+    result = GateResult(gate="proof-pack", status="PASS")
+    skip = _skip_reason(manifest, rel_manifest)
+    if skip:
+        result.status, result.detail = "SKIP", skip
+        return result
+
+    doc = read_json(manifest)
+    for e in validate_schema(doc):
+        result.report(Finding(e, "proof-pack/schema", file=rel_manifest))
+    for e in validate_pins(doc, manifest.resolve()):
+        result.report(Finding(e, "proof-pack/pins", file=rel_manifest))
+    if not result.ok:
+        result.rc = 2
+    else:
+        result.detail = f"manifest={rel_manifest}"
+    return result
+
+
+def discover_manifests(root: Path = PROOF_DIR) -> List[Path]:
+    """Published manifests, one directory level under docs/proof (drafts in .private/ excluded)."""
+    return sorted(p for p in root.glob(MANIFEST_GLOB) if not p.parent.name.startswith("."))
+
+
+def _validate_one(manifest: Path, pins: Pins) -> Tuple[List[str], List[str]]:
+    """(schema errors, pin errors) of one manifest; unreadable JSON is a schema error."""
+    try:
+        doc = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        return [f"invalid JSON: {e}"], []
+    if not isinstance(doc, dict):
+        return ["manifest must be a JSON object"], []
+    return validate_schema(doc), validate_pins(doc, manifest.resolve(), pins)
+
+
+def check_all_proof_packs(jobs: int = 0) -> GateResult:
+    """Every published manifest, validated concurrently against pins resolved once; one report."""
+    result = GateResult(gate="proof-pack", status="PASS")
+    manifests = discover_manifests()
+    if not manifests:
+        result.status, result.detail = "SKIP", f"no published manifests under {PROOF_DIR.relative_to(REPO_ROOT).as_posix()}/*/"
+        return result
+
+    pins = resolve_pins()
+    with ThreadPoolExecutor(max_workers=jobs or min(8, len(manifests))) as pool:
+        outcomes = list(pool.map(lambda m: _validate_one(m, pins), manifests))
+
+    failed = 0
+    for manifest, (schema_errs, pin_errs) in zip(manifests, outcomes):
+        rel = manifest.relative_to(REPO_ROOT).as_posix()
+        if not schema_errs and not pin_errs:
+            result.note(f"- {rel}: PASS")
+            continue
+        failed += 1
+        result.note(f"- {rel}: FAIL")
+        for rule, errs in (("schema", schema_errs), ("pins", pin_errs)):
+            for e in errs:
+                result.report(Finding(e, f"proof-pack/{rule}", file=rel), text=f"   - {e}")
+    if failed:
+        result.rc = 2
+        result.detail = f"{failed} of {len(manifests)} manifest(s) failed"
+    else:
+        result.detail = f"{len(manifests)} manifest(s) valid"
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Validate proof pack manifest schema and pins")
     parser.add_argument(
         "--manifest",
@@ -237,17 +331,42 @@ def main() -> int:
         default=DEFAULT_MANIFEST,
         help="Path to proof pack manifest JSON",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="validate every published manifest under docs/proof/*/ in one consolidated report",
+    )
+    parser.add_argument("--jobs", type=int, default=0, help="--all worker threads (default: up to 8)")
+    add_format_arg(parser)
+    args = parser.parse_args(argv)
+
+    if args.all:
+        return run_gate(
+            "proof-pack",
+            args.format,
+            lambda: check_all_proof_packs(max(0, args.jobs)),
+            tool="yai-proof-check",
+            inputs=("docs/proof",),
+        )
 
     manifest = args.manifest if args.manifest.is_absolute() else (REPO_ROOT / args.manifest)
+    if args.format != "text":
+        return run_gate(
+            "proof-pack",
+            args.format,
+            lambda: check_proof_pack(manifest),
+            tool="yai-proof-check",
+            inputs=("docs/proof",),
+        )
+
     rel_manifest = manifest.relative_to(REPO_ROOT).as_posix()
-    if "/.private/" in f"/{rel_manifest}":
-        print(f"[proof-pack] SKIP: private draft manifest ({rel_manifest})")
-        print("[proof-pack] SKIP: publish under docs/proof/<PACK-ID>/ to enforce proof-pack gates")
-        return 0
-    if not manifest.exists() and manifest.resolve() == DEFAULT_MANIFEST.resolve():
-        print(f"[proof-pack] SKIP: default manifest not found ({rel_manifest})")
-        print("[proof-pack] SKIP: keep draft packs under docs/proof/.private/ until publication")
+    skip = _skip_reason(manifest, rel_manifest)
+    if skip:
+        print(f"[proof-pack] SKIP: {skip}")
+        if skip.startswith("private"):
+            print("[proof-pack] SKIP: publish under docs/proof/<PACK-ID>/ to enforce proof-pack gates")
+        else:
+            print("[proof-pack] SKIP: keep draft packs under docs/proof/.private/ until publication")
         return 0
     doc = read_json(manifest)
 
@@ -270,4 +389,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from yai_tools._core.profile import run_main
+
+    raise SystemExit(run_main(main, "proof-check"))
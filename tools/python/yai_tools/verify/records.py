@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+# Compact records for corpus-sized collections. A 100k-doc graph holds a few
+# hundred thousand nodes and edges: as slotted instances with interned paths
+# and relation names they cost one small object each instead of a dict plus
+# private copies of every string. Canonical JSON renders them through
+# `as_json()` (see generated_sync.iter_canonical), so artifacts are unchanged.
+
+intern = sys.intern
+
+
+@dataclass(slots=True, frozen=True)
+class DocNode:
+    """Graph node; the node id is its repo-relative path."""
+
+    path: str
+    type: str
+
+    @property
+    def id(self) -> str:
+        return self.path
+
+    def as_json(self) -> dict[str, Any]:
+        return {"id": self.path, "type": self.type, "path": self.path}
+
+
+@dataclass(slots=True, frozen=True)
+class Edge:
+    src: str
+    dst: str
+    relation: str
+
+    def as_json(self) -> dict[str, Any]:
+        return {"from": self.src, "to": self.dst, "relation": self.relation}
+
+
+@dataclass(slots=True)
+class ComponentDoc:
+    """What component validation needs from one architecture component doc.
+
+    Only the section names with content and the interfaces text are kept, not
+    the full section map.
+    """
+
+    name: str
+    path: str
+    frontmatter: dict[str, Any]
+    impl_status: str
+    sections: frozenset[str]
+    interfaces: str
+    adr_refs: list[str]
+    runbook_refs: list[str]
+    mp_refs: list[str]
+    l0_refs: list[str]
+
+
+def intern_frontmatter(fm: dict[str, Any]) -> dict[str, Any]:
+    """Intern keys and string values (refs repeat across thousands of docs)."""
+    return {
+        intern(k): [intern(x) for x in v] if isinstance(v, list) else intern(v) if isinstance(v, str) else v
+        for k, v in fm.items()
+    }
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import contextvars
+import json
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, TextIO
+
+from yai_tools._core import profile
+from yai_tools._core.paths import tools_version
+from yai_tools.perf import history
+
+_GATE_ERROR_PREFIX_RE = re.compile(r"^\[[\w-]+\] ERROR:\s*")
+_LINE_PREFIX_RE = re.compile(r"^\s*-\s+")
+
+FORMATS = ("text", "json", "sarif")
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+@dataclass(slots=True)
+class Finding:
+    """One structured gate finding; `line` is 1-based, 0 when not tied to a line."""
+
+    message: str
+    rule: str
+    file: str = ""
+    line: int = 0
+    severity: str = "error"  # error | warning | note
+
+    def __post_init__(self) -> None:
+        # rules and paths repeat across findings
+        self.rule = sys.intern(self.rule)
+        self.file = sys.intern(self.file)
+
+    def text(self) -> str:
+        where = f"{self.file}:{self.line}" if self.file and self.line else self.file
+        return f"- {where}: {self.message}" if where else f"- {self.message}"
+
+
+class TextSink:
+    """Default sink: gate results render as `[gate] STATUS` blocks once complete."""
+
+    streaming = False
+
+    def __init__(self, out: TextIO | None = None) -> None:
+        self.out = out
+
+    def finding(self, gate: str, finding: Finding) -> None:
+        pass
+
+    def gate_done(self, result: "GateResult") -> None:
+        print(result.render(), file=self.out or sys.stdout, flush=True)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesSink:
+    """One JSON object per line: `finding` records as produced, then one `gate` record per gate."""
+
+    streaming = True
+
+    def __init__(self, out: TextIO | None = None) -> None:
+        self.out = out or sys.stdout
+        self._lock = threading.Lock()
+
+    def _write(self, obj: dict[str, Any]) -> None:
+        line = json.dumps(obj, sort_keys=True)
+        with self._lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+
+    def finding(self, gate: str, finding: Finding) -> None:
+        self._write(
+            {
+                "type": "finding",
+                "gate": gate,
+                "rule": finding.rule,
+                "severity": finding.severity,
+                "file": finding.file or None,
+                "line": finding.line or None,
+                "message": finding.message,
+            }
+        )
+
+    def gate_done(self, result: "GateResult") -> None:
+        self._write({"type": "gate", **result.summary()})
+
+    def close(self) -> None:
+        pass
+
+
+class SarifSink:
+    """SARIF 2.1.0 log streamed result-by-result; gate timings go to the invocation."""
+
+    streaming = True
+    _LEVELS = {"error": "error", "warning": "warning", "note": "note"}
+
+    def __init__(self, tool: str, out: TextIO | None = None) -> None:
+        self.out = out or sys.stdout
+        self.tool = tool
+        self._lock = threading.Lock()
+        self._count = 0
+        self._gates: list[dict[str, Any]] = []
+        self._started = False
+
+    def _start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        driver = json.dumps({"name": self.tool, "version": tools_version()})
+        self.out.write(
+            f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", "runs": [{{"tool": {{"driver": {driver}}}, "results": [\n'
+        )
+
+    def finding(self, gate: str, finding: Finding) -> None:
+        res: dict[str, Any] = {
+            "ruleId": finding.rule,
+            "level": self._LEVELS.get(finding.severity, "error"),
+            "message": {"text": finding.message},
+            "properties": {"gate": gate},
+        }
+        if finding.file:
+            loc: dict[str, Any] = {"artifactLocation": {"uri": finding.file}}
+            if finding.line:
+                loc["region"] = {"startLine": finding.line}
+            res["locations"] = [{"physicalLocation": loc}]
+        with self._lock:
+            self._start()
+            self.out.write(("" if self._count == 0 else ",\n") + json.dumps(res, sort_keys=True))
+            self.out.flush()
+            self._count += 1
+
+    def gate_done(self, result: "GateResult") -> None:
+        with self._lock:
+            self._gates.append(result.summary())
+
+    def close(self) -> None:
+        with self._lock:
+            self._start()
+            rc = max((g["rc"] for g in self._gates), default=0)
+            invocation = {"executionSuccessful": rc == 0, "exitCode": rc, "properties": {"gates": self._gates}}
+            self.out.write(f'\n], "invocations": [{json.dumps(invocation, sort_keys=True)}]}}]}}\n')
+            self.out.flush()
+
+
+# Context-local so commands running side by side (yai-tools batch --jobs) keep
+# their own sink; gate pools propagate it with contextvars.copy_context().
+_sink: contextvars.ContextVar[TextSink | JsonLinesSink | SarifSink] = contextvars.ContextVar(
+    "yai_tools_report_sink", default=TextSink()
+)
+
+
+def current_sink() -> TextSink | JsonLinesSink | SarifSink:
+    return _sink.get()
+
+
+def streaming() -> bool:
+    """True when results stream as JSON/SARIF (text lines are then not accumulated)."""
+    return _sink.get().streaming
+
+
+@contextlib.contextmanager
+def report_output(fmt: str, tool: str) -> Iterator[None]:
+    """Route GateResult emission for the duration of one command."""
+    sink: TextSink | JsonLinesSink | SarifSink
+    if fmt == "json":
+        sink = JsonLinesSink()
+    elif fmt == "sarif":
+        sink = SarifSink(tool)
+    else:
+        sink = TextSink()
+    token = _sink.set(sink)
+    try:
+        yield
+    finally:
+        try:
+            sink.close()
+        finally:
+            _sink.reset(token)
+
+
+def add_format_arg(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="text (default), json (JSON Lines, streamed) or sarif (SARIF 2.1.0, streamed); "
+        "findings carry a line where one is known (frontmatter keys, added changelog lines, "
+        "path-policy matches), file-level ones (architecture, proof-pack, docs-graph) only the file",
+    )
+
+
+@dataclass
+class GateResult:
+    """Outcome of one verify gate, rendered in the `[gate] STATUS: detail` log style.
+
+    Findings go to the active sink as they are reported; text lines are only kept
+    for the text format, so streamed runs do not accumulate them.
+    """
+
+    gate: str
+    rc: int = 0
+    status: str = "OK"
+    detail: str = ""
+    lines: list[str] = field(default_factory=list)
+    findings: int = 0
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.rc == 0
+
+    def _mark(self, finding: Finding) -> None:
+        self.findings += 1
+        if finding.severity == "error":
+            self.rc = max(self.rc, 1)
+            self.status = "FAIL"
+        current_sink().finding(self.gate, finding)
+
+    def report(self, finding: Finding, text: str | None = None) -> None:
+        """Record a finding; `text` overrides its line in the text format."""
+        self._mark(finding)
+        if not streaming():
+            self.lines.append(text if text is not None else finding.text())
+
+    def fail(self, line: str, rule: str | None = None, file: str = "") -> None:
+        """Record a failure given as a ready `- ...` text line."""
+        self.report(Finding(_LINE_PREFIX_RE.sub("", line), rule or self.gate, file=file), text=line)
+
+    def fail_detail(self, finding: Finding) -> None:
+        """Fail with the finding as the header detail (`[gate] FAIL: message`)."""
+        self._mark(finding)
+        self.detail = finding.message
+
+    def note(self, line: str) -> None:
+        """Text-only context line (e.g. a group heading above nested findings)."""
+        if not streaming():
+            self.lines.append(line)
+
+    def render(self) -> str:
+        header = f"[{self.gate}] {self.status}"
+        if self.detail:
+            header += f": {self.detail}"
+        elif self.lines:
+            header += ":"
+        return "\n".join([header, *self.lines])
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "gate": self.gate,
+            "status": self.status,
+            "rc": self.rc,
+            "detail": self.detail,
+            "findings": self.findings,
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": round(self.cpu_ms, 3),
+        }
+
+    def emit(self) -> int:
+        current_sink().gate_done(self)
+        return self.rc
+
+
+def measure(
+    fn: Callable[[], GateResult],
+    cpu_clock: Callable[[], float] = time.process_time,
+    inputs: tuple[str, ...] = history.DEFAULT_INPUTS,
+) -> GateResult:
+    """Run a gate, stamp wall and CPU time and add it to the timing history.
+
+    Pass `time.thread_time` for gates sharing a process; `inputs` are the
+    pathspecs whose tracked size is recorded alongside the timing.
+    """
+    w0, c0 = time.perf_counter(), cpu_clock()
+    res = fn()
+    res.wall_ms = (time.perf_counter() - w0) * 1000
+    res.cpu_ms = (cpu_clock() - c0) * 1000
+    history.record(res.gate, res.status, res.wall_ms, res.cpu_ms, res.findings, res.cached, inputs)
+    return res
+
+
+def error_result(gate: str, exc: BaseException, rc: int = 2) -> GateResult:
+    """GateResult for a gate that aborted (die()/SystemExit or an unexpected exception)."""
+    if isinstance(exc, SystemExit) and isinstance(exc.code, int):
+        rc = exc.code or rc
+    msg = str(exc.code) if isinstance(exc, SystemExit) else f"{type(exc).__name__}: {exc}"
+    msg = _GATE_ERROR_PREFIX_RE.sub("", msg)
+    return GateResult(gate=gate, rc=rc, status="ERROR", detail=msg)
+
+
+def run_gate(
+    gate: str,
+    fmt: str,
+    check: Callable[[], GateResult],
+    tool: str | None = None,
+    inputs: tuple[str, ...] = history.DEFAULT_INPUTS,
+) -> int:
+    """Run one gate under `--format`, emit it and return its exit code.
+
+    Text keeps the historical behaviour (a die() still aborts the process);
+    structured formats report aborts as an ERROR gate record instead.
+    """
+    with report_output(fmt, tool or f"yai-{gate}"), profile.span(gate, "validate"):
+        if fmt == "text":
+            return measure(check, inputs=inputs).emit()
+        try:
+            res = measure(check, inputs=inputs)
+        except (Exception, SystemExit) as exc:
+            res = error_result(gate, exc)
+        return res.emit()
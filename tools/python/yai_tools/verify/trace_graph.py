@@ -4,8 +4,11 @@ import argparse
 from pathlib import Path
 from typing import Any
 
+from yai_tools.verify.corpus import DocsCorpus, default_corpus
 from yai_tools.verify.generated_sync import check_json_synced, write_json
-from yai_tools.verify.traceability import ADR_DIR, MP_DIR, REPO_ROOT, RUNBOOK_DIR, parse_frontmatter
+from yai_tools.verify.records import DocNode, Edge, intern
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
+from yai_tools.verify.traceability import ADR_DIR, MP_DIR, REPO_ROOT, RUNBOOK_DIR
 
 PROPOSAL_DIR = REPO_ROOT / "docs" / "design" / "proposals"
 GENERATED_GRAPH = REPO_ROOT / "docs" / "_generated" / "traceability.graph.v1.json"
@@ -36,9 +39,8 @@ def _list(v: Any) -> list[str]:
     return []
 
 
-def _refs_from_frontmatter(p: Path) -> list[str]:
-    txt = p.read_text(encoding="utf-8")
-    fm = parse_frontmatter(txt)
+def _refs_from_frontmatter(p: Path, corpus: DocsCorpus) -> list[str]:
+    fm = corpus.frontmatter(p)
     out: list[str] = []
     t = _node_type(p)
     if t == "proposal":
@@ -58,51 +60,49 @@ def _refs_from_frontmatter(p: Path) -> list[str]:
     return sorted(set([r for r in out if r.endswith(".md")]))
 
 
-def build_graph() -> dict[str, Any]:
+def build_graph(corpus: DocsCorpus | None = None) -> dict[str, Any]:
+    """Traceability graph; `nodes` and `edges` hold DocNode/Edge records (rendered as JSON objects)."""
+    corpus = corpus or default_corpus()
     docs = sorted(
-        list(PROPOSAL_DIR.rglob("*.md"))
-        + list(ADR_DIR.rglob("*.md"))
-        + list(RUNBOOK_DIR.rglob("*.md"))
-        + list(MP_DIR.rglob("*.md"))
+        corpus.rglob(PROPOSAL_DIR) + corpus.rglob(ADR_DIR) + corpus.rglob(RUNBOOK_DIR) + corpus.rglob(MP_DIR)
     )
 
-    nodes: list[dict[str, Any]] = []
-    edges: list[dict[str, Any]] = []
+    nodes: list[DocNode] = []
+    edges: list[Edge] = []
     violations: list[str] = []
 
     node_set: set[str] = set()
     for p in docs:
-        rp = p.relative_to(REPO_ROOT).as_posix()
+        rp = intern(p.relative_to(REPO_ROOT).as_posix())
         node_set.add(rp)
-        nodes.append({"id": rp, "type": _node_type(p), "path": rp})
+        nodes.append(DocNode(rp, _node_type(p)))
 
-    for p in docs:
-        src = p.relative_to(REPO_ROOT).as_posix()
-        src_type = _node_type(p)
-        refs = _refs_from_frontmatter(p)
+    for p, node in zip(docs, nodes[: len(docs)]):
+        src, src_type = node.path, node.type
+        refs = _refs_from_frontmatter(p, corpus)
         for ref in refs:
+            ref = intern(ref)
             dstp = REPO_ROOT / ref
-            if not dstp.exists():
+            if not corpus.exists(dstp):
                 violations.append(f"broken link: {src} -> {ref}")
                 continue
             dst_type = _node_type(dstp)
-            relation = f"{src_type}_to_{dst_type}"
-            edges.append({"from": src, "to": ref, "relation": relation})
+            edges.append(Edge(src, ref, intern(f"{src_type}_to_{dst_type}")))
             if ref not in node_set and ref.startswith("docs/"):
-                nodes.append({"id": ref, "type": dst_type, "path": ref})
+                nodes.append(DocNode(ref, dst_type))
                 node_set.add(ref)
 
     incident: set[str] = set()
     for e in edges:
-        incident.add(e["from"])
-        incident.add(e["to"])
+        incident.add(e.src)
+        incident.add(e.dst)
 
-    orphans = sorted(n["id"] for n in nodes if n["type"] in {"proposal", "adr", "runbook", "milestone_pack"} and n["id"] not in incident)
+    orphans = sorted(n.path for n in nodes if n.type in {"proposal", "adr", "runbook", "milestone_pack"} and n.path not in incident)
 
     graph = {
         "version": 1,
-        "nodes": sorted(nodes, key=lambda x: x["id"]),
-        "edges": sorted(edges, key=lambda x: (x["from"], x["to"], x["relation"])),
+        "nodes": sorted(nodes, key=lambda x: x.path),
+        "edges": sorted(edges, key=lambda x: (x.src, x.dst, x.relation)),
         "orphans": orphans,
         "violations": sorted(set(violations)),
     }
@@ -110,9 +110,8 @@ def build_graph() -> dict[str, Any]:
     return graph
 
 
-def run_graph(write: bool) -> int:
-    graph = build_graph()
-    lock = {
+def build_lock(graph: dict[str, Any]) -> dict[str, Any]:
+    return {
         "version": 1,
         "node_count": len(graph["nodes"]),
         "edge_count": len(graph["edges"]),
@@ -120,30 +119,40 @@ def run_graph(write: bool) -> int:
         "orphan_count": len(graph["orphans"]),
     }
 
+
+def _rel(p: Path) -> str:
+    return p.relative_to(REPO_ROOT).as_posix()
+
+
+def check_graph(write: bool, corpus: DocsCorpus | None = None) -> GateResult:
+    graph = build_graph(corpus)
+    lock = build_lock(graph)
+    result = GateResult(gate="docs-graph")
+
     if graph["violations"]:
-        print("[docs-graph] FAIL:")
         for v in graph["violations"]:
-            print(f"- {v}")
-        return 1
+            # "broken link: <src> -> <ref>"
+            src = v.split(": ", 1)[-1].split(" -> ", 1)[0]
+            result.report(Finding(v, "docs-graph/broken-link", file=src), text=f"- {v}")
+        return result
 
     if write:
         write_json(GENERATED_GRAPH, graph)
         write_json(GENERATED_LOCK, lock)
-        print("[docs-graph] OK: generated graph and lock updated")
-        return 0
+        result.detail = "generated graph and lock updated"
+        return result
 
     ok_graph, msg_graph = check_json_synced(GENERATED_GRAPH, graph)
     ok_lock, msg_lock = check_json_synced(GENERATED_LOCK, lock)
-    if not ok_graph or not ok_lock:
-        print("[docs-graph] FAIL:")
-        if not ok_graph:
-            print(f"- {msg_graph}")
-        if not ok_lock:
-            print(f"- {msg_lock}")
-        return 1
+    if not ok_graph:
+        result.fail(f"- {msg_graph}", rule="generated/drift", file=_rel(GENERATED_GRAPH))
+    if not ok_lock:
+        result.fail(f"- {msg_lock}", rule="generated/drift", file=_rel(GENERATED_LOCK))
+    return result
+
 
-    print("[docs-graph] OK")
-    return 0
+def run_graph(write: bool, corpus: DocsCorpus | None = None, fmt: str = "text") -> int:
+    return run_gate("docs-graph", fmt, lambda: check_graph(write, corpus), tool="yai-docs-graph")
 
 
 def main() -> int:
@@ -151,8 +160,9 @@ def main() -> int:
     mode = ap.add_mutually_exclusive_group(required=True)
     mode.add_argument("--write", action="store_true")
     mode.add_argument("--check", action="store_true")
+    add_format_arg(ap)
     args = ap.parse_args()
-    return run_graph(write=args.write)
+    return run_graph(write=args.write, fmt=args.format)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,16 @@ from __future__ import annotations
 import argparse
 import os
 import re
-import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
-REPO_ROOT = Path(__file__).resolve().parents[4]  # tools/python/yai_tools/verify/traceability.py -> repo root
+from yai_tools._core import profile
+from yai_tools._core.git import GitError, diff_name_only
+from yai_tools._core.paths import repo_root
+from yai_tools.verify.report import Finding, GateResult, add_format_arg, run_gate
+
+REPO_ROOT = repo_root()
 
 DOCS_ROOT = REPO_ROOT / "docs"
 ADR_DIR = DOCS_ROOT / "design" / "adr"
@@ -21,15 +25,10 @@ FM_DELIM = "---"
 def die(msg: str, code: int = 2) -> None:
     raise SystemExit(f"[traceability] ERROR: {msg}")
 
-def sh(cmd: List[str], cwd: Path = REPO_ROOT) -> str:
-    p = subprocess.run(cmd, cwd=str(cwd), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if p.returncode != 0:
-        die(f"command failed: {' '.join(cmd)}\n{p.stderr.strip()}")
-    return p.stdout.strip()
-
 def read_text(p: Path) -> str:
     try:
-        return p.read_text(encoding="utf-8")
+        with profile.span("read", "io", path=p.name):
+            return p.read_text(encoding="utf-8")
     except FileNotFoundError:
         die(f"missing file: {p.as_posix()}")
 
@@ -82,6 +81,24 @@ def parse_frontmatter(md: str) -> Dict[str, Any]:
 
     return data
 
+def frontmatter_lines(md: str) -> Dict[str, int]:
+    """1-based file line of each frontmatter key, as `parse_frontmatter` reads them (last one wins)."""
+    md = md.lstrip("\ufeff")
+    if not md.startswith(FM_DELIM):
+        return {}
+    parts = md.split(FM_DELIM, 2)
+    if len(parts) < 3:
+        return {}
+    raw_fm = parts[1]
+    fm = raw_fm.strip("\n")
+    first = 1 + (FM_DELIM + raw_fm[: len(raw_fm) - len(raw_fm.lstrip("\n"))]).count("\n")
+    lines: Dict[str, int] = {}
+    for i, raw in enumerate(fm.splitlines()):
+        line = raw.strip()
+        if line and not line.startswith(("#", "- ")) and ":" in line:
+            lines[line.split(":", 1)[0].strip()] = first + i
+    return lines
+
 def md_body(md: str) -> str:
     md = md.lstrip("\ufeff")
     if not md.startswith(FM_DELIM):
@@ -101,6 +118,10 @@ def rel(p: Path) -> str:
 class CheckResult:
     ok: bool
     errors: List[str]
+    keys: List[str] = field(default_factory=list)  # frontmatter key behind each error ("" if none)
+
+def _result(errs: List[Tuple[str, str]]) -> CheckResult:
+    return CheckResult(len(errs) == 0, [m for _, m in errs], [k for k, _ in errs])
 
 def is_md_under(path: Path, base: Path) -> bool:
     try:
@@ -110,9 +131,12 @@ def is_md_under(path: Path, base: Path) -> bool:
         return False
 
 def changed_files(base_sha: str, head_sha: str) -> List[Path]:
-    out = sh(["git", "diff", "--name-only", f"{base_sha}...{head_sha}"])
+    try:
+        names = diff_name_only(base_sha, head_sha, cwd=REPO_ROOT)
+    except GitError as e:
+        die(f"command failed: git diff --name-only {base_sha}...{head_sha}\n{e.stderr}")
     files = []
-    for line in out.splitlines():
+    for line in names:
         if not line.strip():
             continue
         p = (REPO_ROOT / line.strip()).resolve()
@@ -142,189 +166,210 @@ def ensure_list(v: Any) -> List[str]:
         return [v]
     return []
 
-def check_adr(path: Path) -> CheckResult:
-    txt = read_text(path)
+def _doc_text(path: Path, corpus: Any = None) -> str:
+    return corpus.text(path) if corpus is not None else read_text(path)
+
+def check_adr(path: Path, corpus: Any = None) -> CheckResult:
+    txt = _doc_text(path, corpus)
     fm = parse_frontmatter(txt)
-    errs: List[str] = []
+    errs: List[Tuple[str, str]] = []
 
     if not fm:
-        errs.append("missing YAML frontmatter (--- ... ---).")
-        return CheckResult(False, errs)
+        errs.append(("", "missing YAML frontmatter (--- ... ---)."))
+        return _result(errs)
 
     adr_id = str(fm.get("id", "")).strip()
     if not adr_id.startswith("ADR-"):
-        errs.append("frontmatter `id` must start with `ADR-`.")
+        errs.append(("id", "frontmatter `id` must start with `ADR-`."))
     status = str(fm.get("status", "")).strip()
     if status == "":
-        errs.append("frontmatter `status` is required (e.g. active/draft/superseded).")
+        errs.append(("status", "frontmatter `status` is required (e.g. active/draft/superseded)."))
 
     law_refs = ensure_list(fm.get("law_refs"))
     if len(law_refs) == 0:
-        errs.append("frontmatter `law_refs` must be non-empty and point to deps/yai-law/...")
+        errs.append(("law_refs", "frontmatter `law_refs` must be non-empty and point to deps/yai-law/..."))
     else:
         for r in law_refs:
             if not r.startswith("deps/yai-law/"):
-                errs.append(f"law_ref must start with `deps/yai-law/` but got: {r}")
+                errs.append(("law_refs", f"law_ref must start with `deps/yai-law/` but got: {r}"))
             rp = (REPO_ROOT / r).resolve()
             if not rp.exists():
-                errs.append(f"law_ref path not found: {r}")
+                errs.append(("law_refs", f"law_ref path not found: {r}"))
 
-    return CheckResult(len(errs) == 0, errs)
+    return _result(errs)
 
-def check_runbook(path: Path) -> CheckResult:
-    txt = read_text(path)
+def check_runbook(path: Path, corpus: Any = None) -> CheckResult:
+    txt = _doc_text(path, corpus)
     fm = parse_frontmatter(txt)
     body = md_body(txt)
-    errs: List[str] = []
+    errs: List[Tuple[str, str]] = []
 
     if not fm:
-        errs.append("missing YAML frontmatter (--- ... ---).")
-        return CheckResult(False, errs)
+        errs.append(("", "missing YAML frontmatter (--- ... ---)."))
+        return _result(errs)
 
     rb_id = str(fm.get("id", "")).strip()
     if not (rb_id.startswith("RB-") or rb_id.startswith("RB_")):
-        errs.append("frontmatter `id` must start with `RB-` (recommended).")
+        errs.append(("id", "frontmatter `id` must start with `RB-` (recommended)."))
 
     status = str(fm.get("status", "")).strip()
     if status == "":
-        errs.append("frontmatter `status` is required (e.g. active/draft/superseded).")
+        errs.append(("status", "frontmatter `status` is required (e.g. active/draft/superseded)."))
 
     # ops-only exception
     ops_only = str(fm.get("ops_only", "")).lower() in ("true", "1", "yes")
 
     adr_refs = ensure_list(fm.get("adr_refs"))
     if not ops_only and len(adr_refs) == 0:
-        errs.append("frontmatter `adr_refs` required unless ops_only=true.")
+        errs.append(("adr_refs", "frontmatter `adr_refs` required unless ops_only=true."))
     for r in adr_refs:
         rp = (REPO_ROOT / r).resolve()
         if not rp.exists():
-            errs.append(f"adr_ref path not found: {r}")
+            errs.append(("adr_refs", f"adr_ref path not found: {r}"))
 
     # runbook must be linkable: it must at least mention "Milestone Pack" section if MP files reference it
     # (hard enforced in MP checker via substring check)
 
-    return CheckResult(len(errs) == 0, errs)
+    return _result(errs)
 
-def check_mp(path: Path) -> CheckResult:
-    txt = read_text(path)
+def check_mp(path: Path, corpus: Any = None) -> CheckResult:
+    txt = _doc_text(path, corpus)
     fm = parse_frontmatter(txt)
-    errs: List[str] = []
+    errs: List[Tuple[str, str]] = []
 
     if not fm:
-        errs.append("missing YAML frontmatter (--- ... ---).")
-        return CheckResult(False, errs)
+        errs.append(("", "missing YAML frontmatter (--- ... ---)."))
+        return _result(errs)
 
     mp_id = str(fm.get("id", "")).strip()
     if not mp_id.startswith("MP-"):
-        errs.append("frontmatter `id` must start with `MP-`.")
+        errs.append(("id", "frontmatter `id` must start with `MP-`."))
     runbook = str(fm.get("runbook", "")).strip()
     if runbook == "":
-        errs.append("frontmatter `runbook` is required (repo-relative path).")
+        errs.append(("runbook", "frontmatter `runbook` is required (repo-relative path)."))
     else:
         rbp = (REPO_ROOT / runbook).resolve()
         if not rbp.exists():
-            errs.append(f"runbook path not found: {runbook}")
+            errs.append(("runbook", f"runbook path not found: {runbook}"))
         else:
             # HARD RULE: runbook must contain the MP id (prevents separation)
-            rb_txt = read_text(rbp)
+            rb_txt = _doc_text(rbp, corpus)
             if mp_id and mp_id not in rb_txt:
-                errs.append(f"runbook does not mention MP id `{mp_id}` (must include it to link bidirectionally).")
+                errs.append(("runbook", f"runbook does not mention MP id `{mp_id}` (must include it to link bidirectionally)."))
 
     phase = str(fm.get("phase", "")).strip()
     if phase == "":
-        errs.append("frontmatter `phase` is required (e.g. 0.1.0 — Protocol Guardrails).")
+        errs.append(("phase", "frontmatter `phase` is required (e.g. 0.1.0 — Protocol Guardrails)."))
 
     adrs = ensure_list(fm.get("adrs"))
     if len(adrs) == 0:
-        errs.append("frontmatter `adrs` must be a non-empty list of ADR paths.")
+        errs.append(("adrs", "frontmatter `adrs` must be a non-empty list of ADR paths."))
     else:
         for a in adrs:
             ap = (REPO_ROOT / a).resolve()
             if not ap.exists():
-                errs.append(f"adr path not found: {a}")
+                errs.append(("adrs", f"adr path not found: {a}"))
 
     spec_anchors = ensure_list(fm.get("spec_anchors"))
     if len(spec_anchors) == 0:
-        errs.append("frontmatter `spec_anchors` must be non-empty and point to deps/yai-law/...")
+        errs.append(("spec_anchors", "frontmatter `spec_anchors` must be non-empty and point to deps/yai-law/..."))
 
     for s in spec_anchors:
         if not s.startswith("deps/yai-law/"):
-            errs.append(f"spec_anchor must start with deps/yai-law/ but got: {s}")
+            errs.append(("spec_anchors", f"spec_anchor must start with deps/yai-law/ but got: {s}"))
         sp = (REPO_ROOT / s).resolve()
         if not sp.exists():
-            errs.append(f"spec_anchor path not found: {s}")
+            errs.append(("spec_anchors", f"spec_anchor path not found: {s}"))
 
     issues = ensure_list(fm.get("issues"))
     if len(issues) == 0:
-        errs.append("frontmatter `issues` required: list of #NNN or N/A with reason.")
+        errs.append(("issues", "frontmatter `issues` required: list of #NNN or N/A with reason."))
     else:
         if any(x.upper() == "N/A" for x in issues):
             reason = str(fm.get("issue_reason", "")).strip()
             if reason == "":
-                errs.append("issues includes N/A but `issue_reason` is missing.")
-
-    return CheckResult(len(errs) == 0, errs)
-
-def main() -> int:
-    ap = argparse.ArgumentParser(prog="yai-docs-trace-check")
-    ap.add_argument("--all", action="store_true", help="check all ADR/Runbook/MP docs (strict)")
-    ap.add_argument("--changed", action="store_true", help="check only changed docs between base..head")
-    ap.add_argument("--base", default="", help="base sha for --changed")
-    ap.add_argument("--head", default="", help="head sha for --changed (defaults to HEAD)")
-    args = ap.parse_args()
-
-    if args.all and args.changed:
-        die("choose one: --all OR --changed")
-
+                errs.append(("issues", "issues includes N/A but `issue_reason` is missing."))
+
+    return _result(errs)
+
+def check_traceability(
+    all_docs: bool,
+    base: str = "",
+    head: str = "HEAD",
+    changed: Optional[List[Path]] = None,
+    corpus: Any = None,
+) -> GateResult:
+    """Run the traceability gate; `changed`/`corpus` let callers share one diff and one read pass."""
     to_check: List[Path] = []
 
-    if args.all:
-        to_check += list(ADR_DIR.rglob("*.md"))
-        to_check += list(RUNBOOK_DIR.rglob("*.md"))
-        to_check += list(MP_DIR.rglob("*.md"))
+    if all_docs:
+        if corpus is not None:
+            to_check += corpus.rglob(ADR_DIR) + corpus.rglob(RUNBOOK_DIR) + corpus.rglob(MP_DIR)
+        else:
+            to_check += list(ADR_DIR.rglob("*.md"))
+            to_check += list(RUNBOOK_DIR.rglob("*.md"))
+            to_check += list(MP_DIR.rglob("*.md"))
     else:
-        # default = changed mode (safer for early adoption)
-        if not args.changed:
-            args.changed = True
-        base = args.base.strip()
-        head = args.head.strip() or "HEAD"
-        if base == "":
-            die("--changed requires --base <sha> (in CI use PR base sha).")
-
-        files = changed_files(base, head)
+        files = changed if changed is not None else changed_files(base, head)
         adrs, runbooks, mps = classify_changed(files)
         to_check += adrs + runbooks + mps
 
+    result = GateResult(gate="traceability")
+
     # If nothing relevant changed, pass.
     relevant = [p for p in to_check if p.exists()]
     if len(relevant) == 0:
-        print("[traceability] OK: no relevant docs changed.")
-        return 0
-
-    failures: List[str] = []
+        result.detail = "no relevant docs changed."
+        return result
 
     for p in relevant:
         rp = rel(p)
         if is_md_under(p, ADR_DIR):
-            res = check_adr(p)
+            kind, res = "adr", check_adr(p, corpus)
         elif is_md_under(p, RUNBOOK_DIR):
-            res = check_runbook(p)
+            kind, res = "runbook", check_runbook(p, corpus)
         elif is_md_under(p, MP_DIR):
-            res = check_mp(p)
+            kind, res = "milestone-pack", check_mp(p, corpus)
         else:
             continue
 
         if not res.ok:
-            failures.append(f"- {rp}")
-            for e in res.errors:
-                failures.append(f"  - {e}")
+            result.note(f"- {rp}")
+            lines = frontmatter_lines(_doc_text(p, corpus))
+            for e, key in zip(res.errors, res.keys):
+                result.report(Finding(e, f"traceability/{kind}", file=rp, line=lines.get(key, 0)), text=f"  - {e}")
 
-    if failures:
-        print("[traceability] FAIL:\n" + "\n".join(failures))
-        return 1
+    if result.ok:
+        result.detail = f"checked {len(relevant)} file(s)."
+    return result
 
-    print(f"[traceability] OK: checked {len(relevant)} file(s).")
-    return 0
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="yai-docs-trace-check")
+    ap.add_argument("--all", action="store_true", help="check all ADR/Runbook/MP docs (strict)")
+    ap.add_argument("--changed", action="store_true", help="check only changed docs between base..head")
+    ap.add_argument("--base", default="", help="base sha for --changed")
+    ap.add_argument("--head", default="", help="head sha for --changed (defaults to HEAD)")
+    add_format_arg(ap)
+    args = ap.parse_args(argv)
+
+    if args.all and args.changed:
+        die("choose one: --all OR --changed")
+
+    if not args.all:
+        # default = changed mode (safer for early adoption)
+        if not args.changed:
+            args.changed = True
+        if args.base.strip() == "":
+            die("--changed requires --base <sha> (in CI use PR base sha).")
+
+    return run_gate(
+        "traceability",
+        args.format,
+        lambda: check_traceability(all_docs=args.all, base=args.base.strip(), head=args.head.strip() or "HEAD"),
+        tool="yai-docs-trace-check",
+    )
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from yai_tools._core.profile import run_main
+
+    raise SystemExit(run_main(main, "docs-trace-check"))
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import contextvars
+import importlib
+import io
+import shlex
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, TextIO
+
+from yai_tools._core import profile
+from yai_tools._core.entrypoints import discover_entry_points
+from yai_tools._core.paths import repo_root
+
+# Run many yai_tools subcommands in one interpreter. Commands share every
+# process-level cache (git memo and cat-file reader, gate-cache tree scans and
+# one docs corpus); with --jobs > 1 each command's stdout/stderr is routed to
+# its own buffer and replayed in input order.
+
+Handler = Callable[[list[str]], int]
+
+
+class BatchError(ValueError):
+    pass
+
+
+@dataclass
+class BatchItem:
+    line: str
+    run: Callable[[], int]
+
+
+@dataclass
+class BatchRun:
+    line: str
+    rc: int
+    duration: float
+    output: str = ""
+
+
+_capture: contextvars.ContextVar[io.StringIO | None] = contextvars.ContextVar("yai_tools_batch_capture", default=None)
+
+
+class _Router(io.TextIOBase):
+    """sys.stdout/sys.stderr stand-in writing to the calling command's buffer."""
+
+    def __init__(self, fallback: TextIO) -> None:
+        self.fallback = fallback
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self.fallback, "encoding", "utf-8")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        buf = _capture.get()
+        return (buf if buf is not None else self.fallback).write(s)
+
+    def flush(self) -> None:
+        if _capture.get() is None:
+            self.fallback.flush()
+
+
+def read_lines(commands: Iterable[str], path: str = "") -> list[str]:
+    """Command lines from argv plus `path` (`-` for stdin); blank lines and `#` comments are skipped."""
+    lines = list(commands)
+    if path:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as fh:
+                text = fh.read()
+        lines.extend(text.splitlines())
+    return [ln.strip() for ln in lines if ln.strip() and not ln.strip().startswith("#")]
+
+
+def _module_runner(module: str, argv: list[str]) -> int:
+    main = importlib.import_module(module).main
+    return main(argv)
+
+
+def parse_items(lines: list[str], commands: dict[str, Handler]) -> list[BatchItem]:
+    """Resolve `<subcommand> args`, `yai-tools <subcommand> args` or `tools/bin/yai-* args` lines."""
+    scripts = {ep.script: ep for ep in discover_entry_points()}
+    items: list[BatchItem] = []
+    for line in lines:
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            raise BatchError(f"cannot parse `{line}`: {e}") from e
+        head = argv[0].rsplit("/", 1)[-1]
+        if head == "yai-tools":
+            argv, head = argv[1:], (argv[1] if len(argv) > 1 else "")
+        if head == "batch":
+            raise BatchError(f"`{line}`: batch cannot be nested")
+
+        if head in commands:
+            handler, args = commands[head], argv[1:]
+            items.append(BatchItem(line, lambda h=handler, a=args: h(a)))
+            continue
+        ep = scripts.get(head)
+        if ep is None:
+            if head.startswith("yai-") and (repo_root() / "tools" / "bin" / head).is_file():
+                raise BatchError(f"`{line}`: `{head}` is a bash wrapper, not a single subcommand; run it directly")
+            raise BatchError(f"`{line}`: unknown subcommand or entry point `{head}`")
+        if ep.module == "yai_tools.cli":
+            if ep.sub not in commands:
+                raise BatchError(f"`{line}`: `{head}` does not map to a subcommand")
+            handler, args = commands[ep.sub], argv[1:]
+            items.append(BatchItem(line, lambda h=handler, a=args: h(a)))
+        else:
+            items.append(BatchItem(line, lambda m=ep.module, a=argv[1:]: _module_runner(m, a)))
+    return items
+
+
+def _exit_code(exc: SystemExit) -> int:
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)  # die("...") messages, as the interpreter would print them
+    return 1
+
+
+def _invoke(item: BatchItem, buf: io.StringIO | None) -> BatchRun:
+    if buf is not None:
+        _capture.set(buf)
+    start = time.perf_counter()
+    with profile.span(item.line, "command"):
+        try:
+            rc = item.run()
+        except SystemExit as exc:
+            rc = _exit_code(exc)
+        except Exception:  # one broken command must not abort the batch
+            traceback.print_exc()
+            rc = 2
+    sys.stdout.flush()
+    return BatchRun(item.line, rc, time.perf_counter() - start, buf.getvalue() if buf is not None else "")
+
+
+def _print_header(i: int, total: int, line: str) -> None:
+    print(f"[batch] ({i}/{total}) {line}", flush=True)
+
+
+def _run_serial(items: list[BatchItem], fail_fast: bool) -> list[BatchRun | None]:
+    runs: list[BatchRun | None] = []
+    for i, item in enumerate(items, 1):
+        _print_header(i, len(items), item.line)
+        run = _invoke(item, None)
+        runs.append(run)
+        if fail_fast and run.rc != 0:
+            runs.extend([None] * (len(items) - i))
+            break
+    return runs
+
+
+def _run_parallel(items: list[BatchItem], jobs: int, fail_fast: bool) -> list[BatchRun | None]:
+    stop = threading.Event()
+
+    def _task(item: BatchItem) -> BatchRun | None:
+        if stop.is_set():
+            return None
+        run = _invoke(item, io.StringIO())
+        if fail_fast and run.rc != 0:
+            stop.set()
+        return run
+
+    out, err = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _Router(out), _Router(err)
+    runs: list[BatchRun | None] = []
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, _task, item) for item in items]
+            # replay in input order as soon as each prefix has finished
+            for i, (item, fut) in enumerate(zip(items, futures), 1):
+                run = fut.result()
+                runs.append(run)
+                if run is not None:
+                    _print_header(i, len(items), item.line)
+                    sys.stdout.write(run.output)
+                    sys.stdout.flush()
+    finally:
+        sys.stdout, sys.stderr = out, err
+    return runs
+
+
+def run_batch(
+    lines: list[str], commands: dict[str, Handler], jobs: int = 1, fail_fast: bool = False
+) -> int:
+    from yai_tools.verify.corpus import shared_corpus
+
+    try:
+        items = parse_items(lines, commands)
+    except BatchError as e:
+        print(f"[batch] ERROR: {e}")
+        return 2
+    if not items:
+        print("[batch] ERROR: no commands given (argv, --file PATH or --file -)")
+        return 2
+
+    t0 = time.perf_counter()
+    with shared_corpus():
+        if jobs > 1:
+            runs = _run_parallel(items, jobs, fail_fast)
+        else:
+            runs = _run_serial(items, fail_fast)
+    wall = time.perf_counter() - t0
+
+    print(f"[batch] summary ({len(items)} command(s), {wall:.2f}s wall, jobs={jobs}):")
+    for item, run in zip(items, runs):
+        if run is None:
+            print(f"- skip {item.line}")
+        else:
+            print(f"- rc={run.rc} {item.line} ({run.duration:.2f}s)")
+    failed = [r for r in runs if r is not None and r.rc != 0]
+    skipped = sum(1 for r in runs if r is None)
+    if failed or skipped:
+        print(f"[batch] FAIL: {len(failed)} of {len(items)} command(s) failed, {skipped} skipped")
+        return max([r.rc for r in failed] + [1])
+    print(f"[batch] OK: {len(items)} command(s) passed")
+    return 0
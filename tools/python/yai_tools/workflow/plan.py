@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import time
+from string import Template
+from typing import Any
+
+from yai_tools._core.paths import repo_root
+from yai_tools.perf import history
+from yai_tools.workflow.scheduler import Gate, GateRun, PlanError, Scheduler, critical_path
+
+REPO_ROOT = repo_root()
+PLANS_DIR = REPO_ROOT / "tools" / "ops" / "plans"
+
+
+def list_plans() -> list[str]:
+    if not PLANS_DIR.exists():
+        return []
+    return sorted(p.stem for p in PLANS_DIR.glob("*.json"))
+
+
+def _run_command(argv: list[str], env: dict[str, str]) -> tuple[int, str]:
+    try:
+        p = subprocess.run(
+            argv, cwd=str(REPO_ROOT), env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+    except OSError as e:
+        return 127, f"cannot run {argv[0]}: {e}\n"
+    return p.returncode, p.stdout
+
+
+def _str_list(spec: dict[str, Any], key: str, gate: str) -> tuple[str, ...]:
+    val = spec.get(key, [])
+    if not isinstance(val, list) or not all(isinstance(x, str) for x in val):
+        raise PlanError(f"gate `{gate}`: `{key}` must be a list of strings")
+    return tuple(val)
+
+
+def load_plan(name: str) -> tuple[dict[str, Any], list[Gate]]:
+    """Parse tools/ops/plans/<name>.json into command gates.
+
+    `run` arguments expand `${VAR}` from the environment, falling back to the
+    plan's `env` defaults (which are also exported to every gate).
+    """
+    path = PLANS_DIR / f"{name}.json"
+    if not path.exists():
+        raise PlanError(f"unknown plan `{name}` (available: {', '.join(list_plans()) or 'none'})")
+    try:
+        plan = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as e:
+        raise PlanError(f"{path.relative_to(REPO_ROOT).as_posix()}: invalid JSON: {e}") from e
+
+    env = {**{str(k): str(v) for k, v in plan.get("env", {}).items()}, **os.environ}
+    gates: list[Gate] = []
+    for spec in plan.get("gates", []):
+        gname = str(spec.get("name", "")).strip()
+        if not gname:
+            raise PlanError("every gate needs a `name`")
+        argv = [Template(a).safe_substitute(env) for a in _str_list(spec, "run", gname)]
+        if not argv:
+            raise PlanError(f"gate `{gname}`: `run` must not be empty")
+        gates.append(
+            Gate(
+                name=gname,
+                run=lambda argv=argv: _run_command(argv, env),
+                inputs=_str_list(spec, "inputs", gname),
+                outputs=_str_list(spec, "outputs", gname),
+                deps=_str_list(spec, "deps", gname),
+                fingerprint=json.dumps(argv),
+            )
+        )
+    return plan, gates
+
+
+def _print_run(run: GateRun, verbose: bool) -> None:
+    line = f"[plan] {run.name}: {run.status}"
+    if run.status in ("OK", "FAIL"):
+        line += f" ({run.duration:.2f}s)"
+    elif run.status == "SKIP":
+        line += " (inputs unchanged)"
+    print(line, flush=True)
+    if run.output and (verbose or not run.ok):
+        for ln in run.output.rstrip("\n").splitlines():
+            print(f"    {ln}")
+
+
+def run_plan(
+    name: str, jobs: int | None = None, use_cache: bool = True, verbose: bool = False, dry_run: bool = False
+) -> int:
+    try:
+        plan, gates = load_plan(name)
+        sched = Scheduler(
+            gates,
+            jobs=jobs,
+            cache_scope=name if use_cache else None,
+            on_done=lambda r: _print_run(r, verbose),
+        )
+    except PlanError as e:
+        print(f"[plan] ERROR: {e}")
+        return 2
+
+    if dry_run:
+        print(f"[plan] {name}: {len(gates)} gate(s), up to {sched.jobs} in parallel")
+        for gname in sched.order:
+            deps = sched.deps[gname]
+            print(f"- {gname}" + (f" (after: {', '.join(deps)})" if deps else ""))
+        return 0
+
+    print(f"[plan] {name}: {plan.get('description', '').strip() or 'running gates'}")
+    t0 = time.perf_counter()
+    runs = sched.run()
+    wall = time.perf_counter() - t0
+    for gname in sched.order:
+        run, gate = runs[gname], sched.gates[gname]
+        if run.status != "BLOCKED":
+            history.record(
+                f"plan:{name}/{gname}",
+                run.status,
+                run.duration * 1000,
+                cached=run.status == "SKIP",
+                inputs=gate.inputs or history.DEFAULT_INPUTS,
+            )
+
+    path, cp_total = critical_path(runs, sched.deps, sched.order)
+    busy = sum(r.duration for r in runs.values())
+    chain = " -> ".join(f"{n} {runs[n].duration:.2f}s" for n in path)
+    print(f"[plan] critical path ({cp_total:.2f}s of {wall:.2f}s wall, {busy:.2f}s gate time): {chain}")
+
+    failed = [r for r in (runs[n] for n in sched.order) if not r.ok]
+    skipped = sum(1 for r in runs.values() if r.status == "SKIP")
+    if failed:
+        names = ", ".join(f"{r.name} ({r.status.lower()})" for r in failed)
+        print(f"[plan] FAIL: {len(failed)} of {len(runs)} gate(s) did not pass: {names}")
+        return max(1, max(r.rc for r in failed))
+
+    print(f"[plan] OK: {len(runs)} gate(s) passed, {skipped} skipped as unchanged")
+    return 0
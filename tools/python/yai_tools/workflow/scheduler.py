@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from yai_tools.verify import gate_cache
+
+
+class PlanError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Gate:
+    """One schedulable check: `run` returns (exit code, captured output).
+
+    `inputs`/`outputs` are repo-relative pathspecs. A gate whose inputs overlap
+    another gate's outputs implicitly depends on it; `fingerprint` identifies the
+    command in the skip-cache key.
+    """
+
+    name: str
+    run: Callable[[], tuple[int, str]]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    deps: tuple[str, ...] = ()
+    fingerprint: str = ""
+
+
+@dataclass
+class GateRun:
+    name: str
+    status: str  # OK | FAIL | SKIP | BLOCKED
+    rc: int = 0
+    output: str = ""
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end - self.start)
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("OK", "SKIP")
+
+
+def _overlaps(a: str, b: str) -> bool:
+    a, b = a.rstrip("/"), b.rstrip("/")
+    if a in (".", "") or b in (".", ""):
+        return True
+    return a == b or a.startswith(b + "/") or b.startswith(a + "/")
+
+
+def resolve_deps(gates: list[Gate]) -> dict[str, tuple[str, ...]]:
+    """Explicit plus implicit (input reads another gate's output) dependencies per gate."""
+    names = [g.name for g in gates]
+    dupes = sorted({n for n in names if names.count(n) > 1})
+    if dupes:
+        raise PlanError(f"duplicate gate name(s): {', '.join(dupes)}")
+
+    known = set(names)
+    deps: dict[str, tuple[str, ...]] = {}
+    for g in gates:
+        unknown = [d for d in g.deps if d not in known]
+        if unknown:
+            raise PlanError(f"gate `{g.name}` depends on unknown gate(s): {', '.join(unknown)}")
+        found = list(g.deps)
+        for other in gates:
+            if other.name == g.name or other.name in found:
+                continue
+            if any(_overlaps(i, o) for i in g.inputs for o in other.outputs):
+                found.append(other.name)
+        deps[g.name] = tuple(found)
+    return deps
+
+
+def topo_order(gates: list[Gate], deps: dict[str, tuple[str, ...]]) -> list[str]:
+    """Declaration-stable topological order; raises PlanError on cycles."""
+    indegree = {g.name: len(deps[g.name]) for g in gates}
+    order: list[str] = []
+    ready = [g.name for g in gates if indegree[g.name] == 0]
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for g in gates:
+            if name in deps[g.name]:
+                indegree[g.name] -= 1
+                if indegree[g.name] == 0:
+                    ready.append(g.name)
+    if len(order) != len(gates):
+        cyclic = [g.name for g in gates if g.name not in order]
+        raise PlanError(f"dependency cycle among: {', '.join(cyclic)}")
+    return order
+
+
+def critical_path(
+    runs: dict[str, GateRun], deps: dict[str, tuple[str, ...]], order: list[str]
+) -> tuple[list[str], float]:
+    """Chain of dependent gates with the largest summed duration (what bounds wall time)."""
+    best: dict[str, tuple[float, str | None]] = {}
+    for name in order:
+        prev = max(deps[name], key=lambda d: best[d][0], default=None)
+        base = best[prev][0] if prev is not None else 0.0
+        best[name] = (base + runs[name].duration, prev)
+    if not best:
+        return [], 0.0
+    tail = max(order, key=lambda n: best[n][0])
+    total = best[tail][0]
+    path: list[str] = []
+    cur: str | None = tail
+    while cur is not None:
+        path.append(cur)
+        cur = best[cur][1]
+    return list(reversed(path)), total
+
+
+class Scheduler:
+    """Run gates in dependency order on a bounded worker pool.
+
+    With a `cache_scope`, a gate that declares inputs is skipped when the same
+    command already passed on identical input blobs and its outputs still exist.
+    """
+
+    def __init__(
+        self,
+        gates: list[Gate],
+        jobs: int | None = None,
+        cache_scope: str | None = None,
+        on_done: Callable[[GateRun], None] | None = None,
+    ) -> None:
+        self.gates = {g.name: g for g in gates}
+        self.deps = resolve_deps(gates)
+        self.order = topo_order(gates, self.deps)
+        self.jobs = max(1, jobs or min(8, len(gates) or 1))
+        self.cache_scope = cache_scope
+        self.on_done = on_done
+
+    def _cache_name(self, gate: Gate) -> str:
+        return f"plan/{self.cache_scope}/{gate.name}"
+
+    def _cache_key(self, gate: Gate) -> str | None:
+        if self.cache_scope is None or not gate.inputs:
+            return None
+        # inputs may have been rewritten by upstream gates in this run
+        return gate_cache.gate_key(self._cache_name(gate), gate.inputs, {"run": gate.fingerprint}, fresh=True)
+
+    def _execute(self, gate: Gate) -> GateRun:
+        start = time.perf_counter()
+        key = self._cache_key(gate)
+        if (
+            key is not None
+            and gate_cache.load_entry(self._cache_name(gate), key) is not None
+            and all((gate_cache.REPO_ROOT / Path(o)).exists() for o in gate.outputs)
+        ):
+            return GateRun(gate.name, "SKIP", start=start, end=time.perf_counter())
+        try:
+            rc, output = gate.run()
+        except Exception as exc:  # a broken gate must not take the pool down
+            rc, output = 2, f"{type(exc).__name__}: {exc}\n"
+        end = time.perf_counter()
+        if rc == 0 and key is not None:
+            gate_cache.store_entry(self._cache_name(gate), key, rc, output)
+        return GateRun(gate.name, "OK" if rc == 0 else "FAIL", rc=rc, output=output, start=start, end=end)
+
+    def _finish(self, runs: dict[str, GateRun], run: GateRun) -> None:
+        runs[run.name] = run
+        if self.on_done is not None:
+            self.on_done(run)
+
+    def run(self) -> dict[str, GateRun]:
+        runs: dict[str, GateRun] = {}
+        pending = list(self.order)
+        running: dict[Future[GateRun], str] = {}
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for name in list(pending):
+                        deps = self.deps[name]
+                        if any(d not in runs for d in deps):
+                            continue
+                        pending.remove(name)
+                        progressed = True
+                        failed = [d for d in deps if not runs[d].ok]
+                        if failed:
+                            now = time.perf_counter()
+                            msg = f"blocked by failed dependency: {', '.join(failed)}\n"
+                            self._finish(runs, GateRun(name, "BLOCKED", rc=1, output=msg, start=now, end=now))
+                        else:
+                            running[pool.submit(self._execute, self.gates[name])] = name
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    running.pop(fut)
+                    self._finish(runs, fut.result())
+        return runs